@@ -10,6 +10,9 @@ bl_info = {
     "category": "Object",
 }
 
+import time
+_import_start = time.perf_counter()
+
 import bpy
 from .modules import bebtools_properties as props
 from .modules import bebtools_ui as ui
@@ -17,6 +20,18 @@ from .modules import bebtools_core as core
 from .modules import bebtools_queue as queue
 from .modules import bebtools_script as script
 from .modules import bebtools_instructions as instr
+from .modules import bebtools_dirty as dirty
+from .modules import bebtools_graph as graph
+from .modules import bebtools_catalog as catalog
+from .modules import bebtools_texts as texts
+from .modules import bebtools_sandbox as sandbox
+from .modules import bebtools_scene_index as scene_index
+from .modules import bebtools_rpc as rpc
+from .modules import bebtools_bundle as bundle
+from .modules import bebtools_mirror as mirror
+from .modules.bebtools_utils import SCRIPTS_DIR
+
+_import_time = time.perf_counter() - _import_start
 
 
 def script_context_menu(self, context):
@@ -29,6 +44,7 @@ def script_context_menu(self, context):
                 layout.menu("BEBTOOLS_MT_script_menu")
 
 def register():
+    start = time.perf_counter()
     props.register_properties()
     for cls in ui.classes:
         bpy.utils.register_class(cls)
@@ -40,11 +56,29 @@ def register():
         bpy.utils.register_class(cls)
     for cls in instr.classes:
         bpy.utils.register_class(cls)
-    bpy.app.timers.register(core.init_scripts_timer, first_interval=0.1)
+    dirty.register_handlers()
+    texts.register_handlers()
+    scene_index.register_handlers()
+    ui.register_handlers()
+    # Scripts from a remote source are mirrored into the local folders in the background
+    mirror.start()
+    # A current bundle, when opted into, serves the library from memory, otherwise the scripts
+    # tree is indexed in the background; the list fills when the panel first draws
+    if not (bundle.is_enabled() and bundle.mount(SCRIPTS_DIR)):
+        catalog.scan_async(SCRIPTS_DIR)
+    print(f"Beb.Tools registered in {(time.perf_counter() - start) * 1000:.1f} ms (imports {_import_time * 1000:.1f} ms)")
 
 def unregister():
-    if bpy.app.timers.is_registered(core.init_scripts_timer):
-        bpy.app.timers.unregister(core.init_scripts_timer)
+    if bpy.app.timers.is_registered(ui.init_scripts_timer):
+        bpy.app.timers.unregister(ui.init_scripts_timer)
+    dirty.unregister_handlers()
+    texts.unregister_handlers()
+    scene_index.unregister_handlers()
+    ui.unregister_handlers()
+    graph.shutdown_executor()
+    rpc.stop()
+    mirror.stop()
+    sandbox.shutdown()
     for cls in reversed(instr.classes):
         bpy.utils.unregister_class(cls)
     for cls in reversed(script.classes):
@@ -0,0 +1,32 @@
+# Shared by the benchmarks Blender runs: loading the add-on from this checkout and reading the
+# arguments given after "--" on the Blender command line.
+import os
+import sys
+import importlib
+import importlib.util
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "bebtools_bench"
+
+
+def parse_blender_args(parser):
+    # Blender keeps its own arguments, the benchmark's follow "--"
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    return parser.parse_args(argv)
+
+def load_addon():
+    # Loaded under a fixed package name, checkout folders like Beb.Tools-Plugin aren't importable
+    spec = importlib.util.spec_from_file_location(PACKAGE, os.path.join(REPO_DIR, "__init__.py"),
+                                                  submodule_search_locations=[REPO_DIR])
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE] = addon
+    spec.loader.exec_module(addon)
+    return addon
+
+def forget_addon():
+    for name in [name for name in sys.modules if name == PACKAGE or name.startswith(PACKAGE + ".")]:
+        del sys.modules[name]
+
+def addon_module(name):
+    # A module of the loaded add-on, e.g. addon_module("bebtools_runner")
+    return importlib.import_module(f"{PACKAGE}.modules.{name}")
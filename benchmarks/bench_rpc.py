@@ -0,0 +1,73 @@
+# Measures jobs per second through the Beb.Tools remote control of a running Blender.
+#
+# Turn on Remote Control in the queue panel (developer mode); Blender prints where it wrote the
+# session token. Then from any Python 3:
+#   python benchmarks/bench_rpc.py --token-file <rpc_token> --jobs 200                 round trips
+#   python benchmarks/bench_rpc.py --token-file <rpc_token> --queue Cleanup --jobs 20  saved queue runs
+#
+# Jobs are sent --window at a time and every reply is checked, so failed steps are reported.
+import sys
+import json
+import time
+import socket
+import argparse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the Beb.Tools remote control")
+    parser.add_argument("--port", type=int, default=47800)
+    parser.add_argument("--token-file", required=True, help="rpc_token file in the Beb.Tools config folder")
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--queue", default="", help="Saved queue to run, pings when empty")
+    parser.add_argument("--params", default="{}", help="Step parameter overrides as JSON")
+    parser.add_argument("--window", type=int, default=8, help="Jobs in flight at once")
+    return parser.parse_args()
+
+def make_request(job_id, args, token):
+    if args.queue:
+        return {"token": token, "id": job_id, "queue": args.queue, "params": json.loads(args.params)}
+    return {"token": token, "id": job_id, "ping": True}
+
+def run_benchmark():
+    args = parse_args()
+    with open(args.token_file, "r") as f:
+        token = f.read().strip()
+    with socket.create_connection(("127.0.0.1", args.port)) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        replies = sock.makefile("r", encoding="utf-8")
+        sent = done = failed = steps = 0
+        latencies = []
+        started = {}
+        start = time.perf_counter()
+        while done < args.jobs:
+            while sent < args.jobs and sent - done < args.window:
+                sent += 1
+                started[sent] = time.perf_counter()
+                sock.sendall((json.dumps(make_request(sent, args, token)) + "\n").encode("utf-8"))
+            line = replies.readline()
+            if not line:
+                print("Connection closed by Blender", file=sys.stderr)
+                break
+            message = json.loads(line)
+            if message.get("event") == "step":
+                steps += 1
+                if message.get("error"):
+                    print(f"job {message['id']} step {message['step']} {message['name']}: {message['error']}",
+                          file=sys.stderr)
+            elif message.get("event") == "done":
+                done += 1
+                failed += not message.get("ok")
+                if message.get("error"):
+                    print(f"job {message['id']}: {message['error']}", file=sys.stderr)
+                latencies.append(time.perf_counter() - started.pop(message["id"]))
+            else:
+                print(f"Error: {message.get('message')}", file=sys.stderr)
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    median = latencies[len(latencies) // 2] * 1000 if latencies else 0.0
+    print(f"{done} jobs ({failed} failed, {steps} steps) in {elapsed:.2f}s: "
+          f"{done / elapsed:.1f} jobs/s, median latency {median:.1f} ms")
+    return 1 if failed or done < args.jobs else 0
+
+if __name__ == "__main__":
+    sys.exit(run_benchmark())
@@ -0,0 +1,80 @@
+# Measures what the shared scene index saves when a queue of bundled scripts runs in a row.
+#
+#   blender -b --factory-startup --python benchmarks/bench_scene_index.py -- --objects 100000 --rounds 3
+#
+# The typed Transform scripts run back to back the way Run Queue runs them, once with every
+# script scanning bpy.data.objects itself and once through the index. One line per mode.
+import bpy
+import os
+import sys
+import time
+import argparse
+
+# Blender doesn't put the script's folder on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import REPO_DIR, parse_blender_args, load_addon, addon_module
+
+TRANSFORM_DIR = os.path.join(REPO_DIR, "scripts", "Transform")
+KINDS = ("MESH", "EMPTY", "LIGHT", "CAMERA")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the Beb.Tools scene index on queued runs")
+    parser.add_argument("--objects", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=3, help="Times the queue is run per mode")
+    return parse_blender_args(parser)
+
+def import_addon_modules():
+    load_addon()
+    runner = addon_module("bebtools_runner")
+    index = addon_module("bebtools_scene_index")
+    log = addon_module("bebtools_log")
+    return runner, index, log
+
+def build_scene(count):
+    bpy.data.batch_remove(list(bpy.data.objects))
+    collection = bpy.context.scene.collection
+    for i in range(count):
+        kind = KINDS[i % len(KINDS)]
+        if kind == "LIGHT":
+            data = bpy.data.lights.new(f"BenchLight_{i}", 'POINT')
+        elif kind == "CAMERA":
+            data = bpy.data.cameras.new(f"BenchCamera_{i}")
+        elif kind == "MESH":
+            data = bpy.data.meshes.new(f"BenchMesh_{i}")
+        else:
+            data = None
+        obj = bpy.data.objects.new(f"Bench{kind.title()}_{i}", data)
+        obj.location = (i % 100, (i // 100) % 100, 1.0)
+        collection.objects.link(obj)
+    bpy.context.view_layer.update()
+
+def queue_scripts():
+    # Scripts that pick objects by type, the ones the index answers without a scan
+    return [os.path.join(TRANSFORM_DIR, name) for name in sorted(os.listdir(TRANSFORM_DIR))
+            if name.endswith(".py") and "All Objects" not in name]
+
+def main():
+    args = parse_args()
+    runner, index, log = import_addon_modules()
+    index.register_handlers()
+    scripts = queue_scripts()
+    build_scene(args.objects)
+
+    for enabled in (False, True):
+        index.scene_index.enabled = enabled
+        index.scene_index.invalidate()
+        start = time.perf_counter()
+        with log.run_log('WARNING'):
+            for _ in range(args.rounds):
+                for script_path in scripts:
+                    runner.run_script(script_path)
+                    index.scene_index.sync()
+        elapsed = time.perf_counter() - start
+        steps = args.rounds * len(scripts)
+        print(f"index={'on' if enabled else 'off':<3} objects={args.objects} steps={steps} "
+              f"time={elapsed:.2f}s per_step={elapsed / steps * 1000:.1f}ms")
+
+    index.unregister_handlers()
+
+main()
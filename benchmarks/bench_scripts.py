@@ -0,0 +1,222 @@
+# Runs every bundled script against generated scenes and checks it against a stored baseline.
+#
+#   blender -b --factory-startup --python benchmarks/bench_scripts.py -- --sizes 1000,10000,100000
+#   blender -b --factory-startup --python benchmarks/bench_scripts.py -- --sizes 1000 --update-baseline
+#
+# Each script gets a freshly loaded copy of the scene. One line is printed per script and size
+# with time, peak memory and datablock counts. Exits with status 1 when a script fails or is
+# slower or heavier than the baseline by more than --threshold, or leaves different datablock
+# counts behind. Timings are machine specific, record the baseline on the machine that checks it.
+# The committed baseline_scripts.json only holds the datablock counts every script leaves in the
+# default 1000 object scene; --update-baseline adds this machine's time and peak memory to it.
+import bpy
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+
+# Blender doesn't put the script's folder on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import REPO_DIR, parse_blender_args, load_addon, addon_module
+
+SCRIPTS_DIR = os.path.join(REPO_DIR, "scripts")
+BASELINE_PATH = os.path.join(REPO_DIR, "benchmarks", "baseline_scripts.json")
+DEFAULT_FOLDERS = ("Transform", "Delete", "Create", "Materials")
+# Need a 3D View area or open an options dialog, neither exists in background mode
+SKIPPED_SCRIPTS = {"Create Camera at 3D View", "Create Framing Cameras"}
+COUNTED_DATA = ("objects", "meshes", "materials", "images", "lights", "cameras", "collections")
+# Differences below these are noise on any machine and never count as regressions
+MIN_TIME_DELTA = 0.05
+MIN_MEMORY_DELTA = 16 * 1024 * 1024
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the bundled Beb.Tools scripts on generated scenes")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma separated object counts")
+    parser.add_argument("--mix", default="mesh=70,empty=15,light=10,camera=5",
+                        help="Relative weights of object types in the scene")
+    parser.add_argument("--materials", type=int, default=200, help="Unique materials assigned to the meshes")
+    parser.add_argument("--duplicates", type=float, default=0.5,
+                        help="Fraction of materials that also get a .001 duplicate")
+    parser.add_argument("--folders", default=",".join(DEFAULT_FOLDERS), help="Script folders to benchmark")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="Fail when time or peak memory exceeds the baseline by this factor")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    return parse_blender_args(parser)
+
+def parse_mix(text):
+    weights = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        weights[kind.strip().upper()] = float(weight)
+    unknown = set(weights) - {"MESH", "EMPTY", "LIGHT", "CAMERA"}
+    if unknown:
+        raise ValueError(f"Unknown object types in --mix: {', '.join(sorted(unknown))}")
+    return weights
+
+def import_addon_modules():
+    load_addon()
+    runner = addon_module("bebtools_runner")
+    utils = addon_module("bebtools_utils")
+    log = addon_module("bebtools_log")
+    # Scripts query the shared scene index, which has to drop its objects when a scene is reloaded
+    addon_module("bebtools_scene_index").register_handlers()
+    return runner, utils, log
+
+def list_scripts(folders):
+    scripts = []
+    for folder in folders:
+        for root, dirs, files in os.walk(os.path.join(SCRIPTS_DIR, folder)):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(("__", ".")))
+            for name in sorted(files):
+                if name.endswith(".py") and name[:-3] not in SKIPPED_SCRIPTS:
+                    scripts.append(os.path.join(root, name))
+    return scripts
+
+def clear_scene():
+    for data in (bpy.data.objects, bpy.data.meshes, bpy.data.materials, bpy.data.images,
+                 bpy.data.lights, bpy.data.cameras, bpy.data.collections):
+        bpy.data.batch_remove(list(data))
+
+def build_scene(count, weights, material_count, duplicates):
+    # Deterministic layout: types are dealt out in proportion to their weights
+    clear_scene()
+    materials = [bpy.data.materials.new(f"BenchMat_{i}") for i in range(material_count)]
+    for i in range(int(material_count * duplicates)):
+        materials.append(bpy.data.materials.new(f"BenchMat_{i}.001"))
+    template = bpy.data.meshes.new("BenchMesh")
+    template.from_pydata([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [], [(0, 1, 2, 3)])
+
+    kinds = sorted(kind for kind, weight in weights.items() if weight > 0)
+    dealt = {kind: 0 for kind in kinds}
+    collection = bpy.context.scene.collection
+    for i in range(count):
+        kind = min(kinds, key=lambda k: dealt[k] / weights[k])
+        dealt[kind] += 1
+        if kind == "MESH":
+            data = template.copy()
+            if materials:
+                data.materials.append(materials[i % len(materials)])
+        elif kind == "LIGHT":
+            data = bpy.data.lights.new(f"BenchLight_{i}", 'POINT')
+        elif kind == "CAMERA":
+            data = bpy.data.cameras.new(f"BenchCamera_{i}")
+        else:
+            data = None
+        obj = bpy.data.objects.new(f"Bench{kind.title()}_{i}", data)
+        if kind == "EMPTY":
+            obj.empty_display_type = 'CUBE' if i % 2 else 'PLAIN_AXES'
+        obj.location = (i % 100, (i // 100) % 100, i // 10000)
+        collection.objects.link(obj)
+    bpy.data.meshes.remove(template)
+
+def count_data():
+    return {name: len(getattr(bpy.data, name)) for name in COUNTED_DATA}
+
+class PeakSampler:
+    # Polls the process RSS on a thread, Blender's allocations don't show up in tracemalloc
+    def __init__(self, process_rss, interval=0.005):
+        self.process_rss = process_rss
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.process_rss())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak = self.process_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process_rss())
+
+def run_one(runner, utils, log, scene_path, script_path):
+    bpy.ops.wm.open_mainfile(filepath=scene_path, load_ui=False)
+    rss_before = utils.process_rss()
+    error = None
+    start = time.perf_counter()
+    with PeakSampler(utils.process_rss) as sampler, log.run_log('WARNING'):
+        try:
+            runner.run_script(script_path)
+        except Exception as e:
+            error = str(e)
+    elapsed = time.perf_counter() - start
+    return {
+        "time": elapsed,
+        "peak_memory": max(0, sampler.peak - rss_before),
+        "counts": count_data(),
+        "error": error,
+    }
+
+def compare(result, baseline, threshold, format_bytes):
+    # Returns the reasons this result regressed against its baseline entry
+    reasons = []
+    if result["error"]:
+        reasons.append(f"error: {result['error']}")
+    if not baseline:
+        return reasons
+    if ("time" in baseline and result["time"] > baseline["time"] * threshold
+            and result["time"] - baseline["time"] > MIN_TIME_DELTA):
+        reasons.append(f"time {result['time']:.2f}s vs baseline {baseline['time']:.2f}s")
+    if ("peak_memory" in baseline and result["peak_memory"] > baseline["peak_memory"] * threshold
+            and result["peak_memory"] - baseline["peak_memory"] > MIN_MEMORY_DELTA):
+        reasons.append(f"peak memory {format_bytes(result['peak_memory'])} "
+                       f"vs baseline {format_bytes(baseline['peak_memory'])}")
+    if baseline.get("counts") and result["counts"] != baseline["counts"]:
+        reasons.append(f"datablock counts {result['counts']} vs baseline {baseline['counts']}")
+    return reasons
+
+def main():
+    args = parse_args()
+    runner, utils, log = import_addon_modules()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    weights = parse_mix(args.mix)
+    scripts = list_scripts([folder.strip() for folder in args.folders.split(",")])
+    try:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        baseline = {}
+
+    results = {}
+    failures = []
+    scene_path = os.path.join(tempfile.gettempdir(), "bebtools_bench_scene.blend")
+    for size in sizes:
+        bpy.ops.wm.read_homefile(use_empty=True)
+        build_scene(size, weights, args.materials, args.duplicates)
+        bpy.ops.wm.save_as_mainfile(filepath=scene_path, compress=False, check_existing=False)
+        print(f"scene objects={size} {count_data()}")
+        for script_path in scripts:
+            key = f"{size}/{os.path.relpath(script_path, SCRIPTS_DIR).replace(os.sep, '/')}"
+            result = run_one(runner, utils, log, scene_path, script_path)
+            results[key] = result
+            reasons = compare(result, baseline.get(key), args.threshold, utils.format_bytes)
+            counts = " ".join(f"{name}={count}" for name, count in result["counts"].items())
+            print(f"{key}: time={result['time']:.3f}s peak={utils.format_bytes(result['peak_memory'])} {counts}"
+                  + (f"  REGRESSION ({'; '.join(reasons)})" if reasons else ""))
+            if reasons:
+                failures.append(key)
+    os.remove(scene_path)
+
+    if args.update_baseline:
+        baseline.update({key: result for key, result in results.items() if not result["error"]})
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+    if failures:
+        print(f"FAIL: {len(failures)} script runs regressed beyond {args.threshold}x of the baseline")
+        sys.exit(1)
+    print("OK")
+
+main()
@@ -0,0 +1,52 @@
+# Times importing and registering the Beb.Tools add-on against a budget.
+#
+#   blender -b --factory-startup --python benchmarks/bench_startup.py -- --runs 5 --budget-ms 150
+#
+# Exits with status 1 when the median import + register time exceeds the budget.
+import bpy
+import os
+import sys
+import time
+import argparse
+import statistics
+
+# Blender doesn't put the script's folder on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import parse_blender_args, load_addon, forget_addon
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark Beb.Tools import and registration time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    return parse_blender_args(parser)
+
+def measure_once():
+    forget_addon()
+    start = time.perf_counter()
+    addon = load_addon()
+    imported = time.perf_counter()
+    addon.register()
+    registered = time.perf_counter()
+    addon.unregister()
+    return (imported - start) * 1000, (registered - imported) * 1000
+
+def main():
+    args = parse_args()
+    import_times, register_times = [], []
+    for _ in range(args.runs):
+        import_ms, register_ms = measure_once()
+        import_times.append(import_ms)
+        register_times.append(register_ms)
+
+    import_ms = statistics.median(import_times)
+    register_ms = statistics.median(register_times)
+    total_ms = import_ms + register_ms
+    print(f"import={import_ms:.1f}ms register={register_ms:.1f}ms total={total_ms:.1f}ms "
+          f"budget={args.budget_ms:.1f}ms runs={args.runs} blender={bpy.app.version_string}")
+    if total_ms > args.budget_ms:
+        print("FAIL: Beb.Tools startup exceeds its budget")
+        sys.exit(1)
+    print("OK")
+
+main()
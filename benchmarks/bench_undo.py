@@ -0,0 +1,80 @@
+# Measures time and memory of the Beb.Tools undo run modes on a large scene.
+#
+# Undo is only active with a UI, so run Blender without -b:
+#   blender --factory-startup --python benchmarks/bench_undo.py -- --objects 20000 --steps 10
+#
+# Blender quits by itself and prints one line per mode.
+import bpy
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Blender doesn't put the script's folder on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import parse_blender_args, load_addon, addon_module
+
+# Every step selects, moves and deselects all objects through UNDO-enabled operators. The runs
+# aren't inside an operator, so undo_scope pushes the final step the Run operators leave to Blender
+STEP_SCRIPT = """
+import bpy
+bpy.ops.object.select_all(action='SELECT')
+bpy.ops.transform.translate(value=(0.0, 0.0, 0.01))
+bpy.ops.object.select_all(action='DESELECT')
+"""
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark Beb.Tools undo run modes")
+    parser.add_argument("--objects", type=int, default=20000)
+    parser.add_argument("--steps", type=int, default=10)
+    return parse_blender_args(parser)
+
+def import_addon_modules():
+    load_addon()
+    runner = addon_module("bebtools_runner")
+    utils = addon_module("bebtools_utils")
+    return runner, utils
+
+def build_scene(count):
+    bpy.data.batch_remove(list(bpy.data.objects) + list(bpy.data.meshes))
+    mesh = bpy.data.meshes.new("BenchMesh")
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [], [(0, 1, 2, 3)])
+    collection = bpy.context.scene.collection
+    for i in range(count):
+        obj = bpy.data.objects.new(f"Bench_{i}", mesh.copy())
+        obj.location = (i % 100, i // 100, 0)
+        collection.objects.link(obj)
+    bpy.ops.ed.undo_push(message="Bench scene")
+
+def run_benchmark():
+    args = parse_args()
+    runner, utils = import_addon_modules()
+    script_path = os.path.join(tempfile.gettempdir(), "bebtools_bench_undo_step.py")
+    with open(script_path, "w") as f:
+        f.write(STEP_SCRIPT)
+
+    for mode in ('STEP', 'SINGLE', 'NONE'):
+        build_scene(args.objects)
+        rss_before = utils.process_rss()
+        start = time.perf_counter()
+        with runner.undo_scope(mode, "Bench run"):
+            for _ in range(args.steps):
+                runner.run_script(script_path)
+        elapsed = time.perf_counter() - start
+        memory = utils.process_rss() - rss_before
+        print(f"undo={mode:<6} objects={args.objects} steps={args.steps} "
+              f"time={elapsed:.2f}s memory={utils.format_bytes(memory)}")
+
+    os.remove(script_path)
+    bpy.ops.wm.quit_blender()
+
+def start():
+    # Deferred so the window manager and undo stack exist
+    window = bpy.context.window_manager.windows[0]
+    with bpy.context.temp_override(window=window):
+        run_benchmark()
+    return None
+
+bpy.app.timers.register(start, first_interval=1.0)
@@ -0,0 +1,95 @@
+import bpy
+import numpy as np
+from .bebtools_reparent import read_matrices, object_rows
+
+# Instances of one mesh are transformed together, in chunks of about this many points
+CHUNK_POINTS = 2_000_000
+
+
+def mesh_coordinates(mesh, cache=None):
+    # Vertex positions of a mesh datablock in object space, as an (n, 3) array. Pass the same
+    # dict as `cache` to several calls to read each mesh only once.
+    if cache is not None and mesh in cache:
+        return cache[mesh]
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3).astype(np.float64)
+    if cache is not None:
+        cache[mesh] = coords
+    return coords
+
+def world_matrices(objects):
+    _, rows = object_rows(objects)
+    return read_matrices(bpy.data.objects, "matrix_world")[rows]
+
+def _instances(objects, cache):
+    # (coords, indices) per mesh datablock, objects sharing a mesh are handled in one go
+    groups = {}
+    for k, obj in enumerate(objects):
+        groups.setdefault(obj.data, []).append(k)
+    for mesh, indices in groups.items():
+        yield mesh_coordinates(mesh, cache), np.array(indices)
+
+def _chunks(count, point_count):
+    # Slices over `count` instances of a mesh with `point_count` vertices
+    size = max(1, CHUNK_POINTS // point_count)
+    for start in range(0, count, size):
+        yield slice(start, start + size)
+
+def world_aabbs(objects, cache=None):
+    """World-space axis-aligned boxes of mesh objects, without applying any transform.
+
+    Every vertex goes through the object's world matrix, so the boxes are tight for rotated
+    and sheared objects too. Returns (mins, maxs), two (n, 3) arrays in the order given.
+    Meshes without vertices get an empty box at the object origin.
+    """
+    objects = list(objects)
+    worlds = world_matrices(objects)
+    mins = worlds[:, :3, 3].copy()
+    maxs = mins.copy()
+    for coords, indices in _instances(objects, cache):
+        if not len(coords):
+            continue
+        for part in _chunks(len(indices), len(coords)):
+            chunk = indices[part]
+            points = np.einsum('kij,vj->kvi', worlds[chunk, :3, :3], coords) + worlds[chunk, :3, 3][:, None]
+            mins[chunk] = points.min(axis=1)
+            maxs[chunk] = points.max(axis=1)
+    return mins, maxs
+
+def oriented_boxes(objects, cache=None):
+    """World-space oriented boxes of mesh objects, aligned to their principal axes.
+
+    The axes come from a PCA of the vertices, done once per mesh datablock and carried to
+    each instance through its world matrix. Returns (centers, rotations, half_sizes) with
+    shapes (n, 3), (n, 3, 3) and (n, 3). Rotation columns are the box axes, largest spread
+    first, and always form a right-handed frame.
+    """
+    objects = list(objects)
+    worlds = world_matrices(objects)
+    centers = worlds[:, :3, 3].copy()
+    rotations = np.repeat(np.identity(3)[None], len(objects), axis=0)
+    half_sizes = np.zeros((len(objects), 3))
+    for coords, indices in _instances(objects, cache):
+        if not len(coords):
+            continue
+        mean = coords.mean(axis=0)
+        offsets = coords - mean
+        covariance = offsets.T @ offsets / len(coords)
+        linear = worlds[indices, :3, :3]
+        world_mean = linear @ mean + worlds[indices, :3, 3]
+        _, axes = np.linalg.eigh(linear @ covariance @ linear.transpose(0, 2, 1))
+        axes = axes[:, :, ::-1].copy()
+        axes[np.linalg.det(axes) < 0, :, 2] *= -1
+        # Vertices in each box frame: axesᵀ @ linear @ (p - mean)
+        to_box = axes.transpose(0, 2, 1) @ linear
+        for part in _chunks(len(indices), len(coords)):
+            projected = np.einsum('kij,vj->kvi', to_box[part], offsets)
+            low, high = projected.min(axis=1), projected.max(axis=1)
+            chunk = indices[part]
+            centers[chunk] = world_mean[part] + np.einsum('kij,kj->ki', axes[part], (low + high) / 2)
+            half_sizes[chunk] = (high - low) / 2
+        rotations[indices] = axes
+    return centers, rotations, half_sizes
+
+classes = ()
@@ -0,0 +1,264 @@
+# A published copy of the whole scripts library in one archive, for libraries on network shares.
+#
+# The bundle is a zip next to the scripts folder holding every script and its instructions under
+# files/, their compiled code under code/ and the catalog index in index.json. Mounting reads it
+# in one go, after that browsing, searching, instructions and running never touch the share.
+# Scripts saved while a bundle is mounted are written to the folder as usual and replace their
+# bundled copy in memory; files and folders Beb.Tools creates, renames or deletes are served from
+# the folder from then on. Serving from the bundle is opted into with Use Bundle and remembered in
+# bundle.json in the Beb.Tools config folder.
+# Publishing writes a generation marker into the scripts folder and every write Beb.Tools makes
+# there removes it, so mounting checks a single file to tell whether the bundle is still current.
+import os
+import json
+import time
+import types
+import marshal
+import zipfile
+import importlib.util
+from .bebtools_catalog import mount_entries, unmount_entries, release_folder
+from .bebtools_lint import lint_source, declares_no_bpy
+from .bebtools_log import get_logger
+
+BUNDLE_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts_bundle.zip")
+BUNDLE_VERSION = 3
+INDEX_NAME = "index.json"
+STATE_NAME = "bundle.json"
+GENERATION_NAME = ".bebtools_generation"
+
+_mounted = None
+
+log = get_logger("Beb.Tools")
+
+
+def _with_filename(code, filename):
+    # Code is compiled against the publishing machine's paths, tracebacks should show this one's
+    consts = tuple(_with_filename(c, filename) if isinstance(c, types.CodeType) else c for c in code.co_consts)
+    return code.replace(co_filename=filename, co_consts=consts)
+
+def _state_path():
+    # Imported here, bebtools_utils imports this module
+    from .bebtools_utils import CONFIG_DIR
+    return os.path.join(CONFIG_DIR, STATE_NAME)
+
+def _generation_path(root=None):
+    if root is None:
+        from .bebtools_utils import SCRIPTS_DIR
+        root = SCRIPTS_DIR
+    return os.path.join(root, GENERATION_NAME)
+
+def read_generation(root):
+    try:
+        with open(_generation_path(root), "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def drop_generation():
+    # Marks a published bundle stale; a no-op when there is no marker
+    try:
+        os.remove(_generation_path())
+    except OSError:
+        pass
+
+def is_enabled():
+    try:
+        with open(_state_path(), "r") as f:
+            return bool(json.load(f).get("enabled"))
+    except (OSError, ValueError):
+        return False
+
+def set_enabled(enabled):
+    with open(_state_path(), "w") as f:
+        json.dump({"enabled": enabled}, f)
+
+def publish(root, path=BUNDLE_PATH):
+    # Rebuilds the bundle from the scripts folder, returns the number of scripts in it
+    folders = {}
+    scripts = []
+    generation = str(time.time_ns())
+    temp_path = path + ".tmp"
+    with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for directory, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(("__", ".")))
+            rel_dir = os.path.relpath(directory, root).replace(os.sep, "/")
+            rel_dir = "" if rel_dir == "." else rel_dir + "/"
+            children = [rel_dir + d for d in dirs]
+            for name in sorted(files):
+                if name.startswith(("__", ".")) or not name.endswith((".py", ".txt")):
+                    continue
+                rel = rel_dir + name
+                with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                    source = f.read()
+                archive.writestr("files/" + rel, source)
+                if name.endswith(".py"):
+                    children.append(rel)
+                    scripts.append({"path": rel, "lint": lint_source(source, rel),
+                                    "no_bpy": declares_no_bpy(source), "size": len(source)})
+                    try:
+                        archive.writestr("code/" + rel, marshal.dumps(compile(source, rel, "exec")))
+                    except (SyntaxError, ValueError):
+                        pass  # Compiled, and reported, when it runs
+            folders[rel_dir.rstrip("/")] = children
+        archive.writestr(INDEX_NAME, json.dumps({
+            "version": BUNDLE_VERSION,
+            "magic": importlib.util.MAGIC_NUMBER.hex(),
+            "published": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "folders": folders,
+            "scripts": scripts,
+            "generation": generation,
+        }))
+    # Marker first: if replacing the bundle fails the old one no longer matches it
+    with open(_generation_path(root), "w") as f:
+        f.write(generation)
+    os.replace(temp_path, path)
+    return len(scripts)
+
+
+class Bundle:
+    """A mounted bundle: every file of the archive in memory, code unmarshalled on first use."""
+
+    def __init__(self, path, root):
+        with zipfile.ZipFile(path) as archive:
+            self.files = {name: archive.read(name) for name in archive.namelist()}
+        self.index = json.loads(self.files.pop(INDEX_NAME))
+        if self.index.get("version") != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported bundle version {self.index.get('version')}")
+        # Bytecode only loads into the Python version that wrote it, otherwise sources are compiled
+        self.use_code = self.index.get("magic") == importlib.util.MAGIC_NUMBER.hex()
+        self.root = root
+        self.codes = {}
+        # Paths written since mounting, they and everything under them are read from disk
+        self.released = set()
+
+    def full_path(self, rel):
+        return os.path.join(self.root, *rel.split("/")) if rel else self.root
+
+    def rel_path(self, path):
+        try:
+            rel = os.path.relpath(path, self.root)
+        except ValueError:  # Another drive on Windows
+            return None
+        return None if rel.startswith("..") else rel.replace(os.sep, "/")
+
+    def is_current(self):
+        return read_generation(self.root) == self.index.get("generation")
+
+    def covers(self, path):
+        # True when the bundle is authoritative for path: bundled and not written since, or missing
+        # from a bundled folder
+        rel = self.rel_path(path)
+        if rel is None or any(rel == r or rel.startswith(r + "/") for r in self.released):
+            return False
+        return "files/" + rel in self.files or rel.rpartition("/")[0] in self.index["folders"]
+
+    def release(self, path):
+        rel = self.rel_path(path)
+        if rel is not None:
+            self.released.add(rel)
+            self.codes = {r: code for r, code in self.codes.items() if r != rel and not r.startswith(rel + "/")}
+
+    def read_text(self, path):
+        if not self.covers(path):
+            return None
+        data = self.files.get("files/" + self.rel_path(path))
+        return data.decode("utf-8") if data is not None else None
+
+    def get_code(self, path):
+        if not self.covers(path):
+            return None
+        rel = self.rel_path(path)
+        code = self.codes.get(rel)
+        if code is None:
+            data = self.files.get("code/" + rel) if self.use_code else None
+            if data is not None:
+                code = _with_filename(marshal.loads(data), path)
+            else:
+                source = self.read_text(path)
+                if source is None:
+                    return None
+                code = compile(source, path, "exec")
+            self.codes[rel] = code
+        return code
+
+    def store(self, path, text):
+        rel = self.rel_path(path)
+        if rel is not None and self.covers(path):
+            self.files["files/" + rel] = text.encode("utf-8")
+            self.files.pop("code/" + rel, None)
+            self.codes.pop(rel, None)
+
+    def entries(self):
+        # Catalog entries for every folder and script, and each folder's children
+        scripts = {script["path"]: script for script in self.index["scripts"]}
+        entries = []
+        children = {}
+        for rel_dir, names in self.index["folders"].items():
+            children[self.full_path(rel_dir)] = [self.full_path(rel) for rel in names]
+            for rel in names:
+                entry = {"name": rel.rsplit("/", 1)[-1], "path": self.full_path(rel), "mtime": 0, "size": 0}
+                script = scripts.get(rel)
+                if script:
+                    entry.update(name=entry["name"][:-3], is_folder=False, size=script["size"],
+                                 lint=[tuple(finding) for finding in script["lint"]], no_bpy=script["no_bpy"])
+                else:
+                    entry["is_folder"] = True
+                entries.append(entry)
+        return entries, children
+
+
+def mount(root, path=BUNDLE_PATH):
+    # Serves the library from the bundle, returns False when there is none, it can't be read or
+    # it is out of date
+    global _mounted
+    try:
+        bundle = Bundle(path, root)
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+        log.error("Could not mount script bundle %s: %s", path, e)
+        return False
+    if not bundle.is_current():
+        log.warning("Script bundle not used, the scripts folder changed since it was published; publish it again")
+        return False
+    _mounted = bundle
+    mount_entries(*bundle.entries())
+    log.info("Scripts served from the bundle published %s (%s scripts)",
+             bundle.index['published'], len(bundle.index['scripts']))
+    return True
+
+def unmount(root):
+    global _mounted
+    _mounted = None
+    unmount_entries(root)
+
+def is_mounted():
+    return _mounted is not None
+
+def read_text(path):
+    # Contents of a bundled file, None when it isn't in the mounted bundle
+    return _mounted.read_text(path) if _mounted else None
+
+def covers(path):
+    # True when the mounted bundle is authoritative for path, even if the file isn't in it
+    return _mounted is not None and _mounted.covers(path)
+
+def get_code(path):
+    return _mounted.get_code(path) if _mounted else None
+
+def store(path, text):
+    # A file Beb.Tools saved: the bundled copy is replaced in memory and the published bundle is stale
+    if _mounted:
+        _mounted.store(path, text)
+    drop_generation()
+
+def touch(path):
+    # A file or folder Beb.Tools created, renamed or deleted: it and its folder are read from disk
+    # from now on and the published bundle is stale
+    if _mounted:
+        _mounted.release(path)
+        release_folder(os.path.dirname(path))
+        release_folder(path)
+    drop_generation()
+
+classes = ()
@@ -0,0 +1,199 @@
+import os
+import threading
+from .bebtools_lint import lint_source, declares_no_bpy
+
+# In-memory index of the scripts tree so browsing and searching don't hit the disk.
+# Entries are dicts: name, path, is_folder, mtime, size, and for scripts their lint
+# findings and whether they declared they don't use bpy.
+# Folder paths are keyed normalized.
+_entries = {}
+_children = {}
+_folder_mtimes = {}
+# Folders listed from a mounted script bundle, never stat'ed or rescanned
+_bundled = set()
+_lock = threading.Lock()
+_ready = threading.Event()
+_scan_thread = None
+
+
+def _key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+def _script_entry(path, stat, source=None):
+    # Scripts are linted when indexed or saved so browsing never parses them
+    if source is None:
+        try:
+            with open(path, "r") as f:
+                source = f.read()
+        except (OSError, UnicodeDecodeError):
+            source = ""
+    return {"name": os.path.basename(path)[:-3], "path": path, "is_folder": False,
+            "mtime": stat.st_mtime_ns, "size": stat.st_size,
+            "lint": lint_source(source, path), "no_bpy": declares_no_bpy(source)}
+
+def _scan_folder(directory):
+    # Direct children of one folder: list of entries, plus the folder's own mtime
+    entries = []
+    with os.scandir(directory) as it:
+        for dir_entry in it:
+            if dir_entry.name.startswith(("__", ".")):
+                continue
+            if dir_entry.is_dir():
+                entries.append({"name": dir_entry.name, "path": os.path.join(directory, dir_entry.name),
+                                "is_folder": True, "mtime": 0, "size": 0})
+            elif dir_entry.name.endswith(".py"):
+                entries.append(_script_entry(os.path.join(directory, dir_entry.name), dir_entry.stat()))
+    return entries, os.stat(directory).st_mtime_ns
+
+def _drop_subtree(key):
+    # Forget a folder that was removed or renamed and everything below it
+    prefix = key + os.sep
+    for index in (_entries, _children, _folder_mtimes):
+        for stale in [k for k in index if k == key or k.startswith(prefix)]:
+            del index[stale]
+
+def _store_folder(directory, entries, mtime):
+    key = _key(directory)
+    new_keys = {_key(entry["path"]) for entry in entries}
+    with _lock:
+        for path in _children.get(key, ()):
+            old_key = _key(path)
+            if old_key not in new_keys:
+                _drop_subtree(old_key)
+        _children[key] = [entry["path"] for entry in entries]
+        _folder_mtimes[key] = mtime
+        for entry in entries:
+            _entries[_key(entry["path"])] = entry
+
+def scan(root):
+    # Full recursive scan, safe to run on a background thread
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries, mtime = _scan_folder(directory)
+        except OSError:
+            continue
+        _store_folder(directory, entries, mtime)
+        stack.extend(entry["path"] for entry in entries if entry["is_folder"])
+    _ready.set()
+
+def scan_async(root):
+    global _scan_thread
+    if _scan_thread is not None and _scan_thread.is_alive():
+        return
+    _ready.clear()
+    _scan_thread = threading.Thread(target=scan, args=(root,), name="bebtools_catalog", daemon=True)
+    _scan_thread.start()
+
+def is_ready():
+    return _ready.is_set()
+
+def mount_entries(entries, children):
+    # Replaces the index with a script bundle's, see bebtools_bundle.py
+    with _lock:
+        for index in (_entries, _children, _folder_mtimes):
+            index.clear()
+        _bundled.clear()
+        for entry in entries:
+            _entries[_key(entry["path"])] = entry
+        for directory, paths in children.items():
+            key = _key(directory)
+            _children[key] = list(paths)
+            _folder_mtimes[key] = 0
+            _bundled.add(key)
+    _ready.set()
+
+def unmount_entries(root):
+    # Back to the scripts folder itself, indexed again in the background
+    with _lock:
+        for index in (_entries, _children, _folder_mtimes, _bundled):
+            index.clear()
+    scan_async(root)
+
+def release_folder(directory):
+    # A bundled folder Beb.Tools changed is listed from disk from now on
+    key = _key(directory)
+    with _lock:
+        if key in _bundled:
+            _bundled.discard(key)
+            _folder_mtimes.pop(key, None)
+
+def list_dir(directory):
+    # Cached children of a folder, rescanning it only when its mtime changed
+    key = _key(directory)
+    with _lock:
+        if key in _bundled:
+            return [_entries[_key(path)] for path in _children[key]]
+    mtime = os.stat(directory).st_mtime_ns
+    with _lock:
+        if _folder_mtimes.get(key) == mtime:
+            return [_entries[_key(path)] for path in _children[key]]
+    entries, mtime = _scan_folder(directory)
+    _store_folder(directory, entries, mtime)
+    return entries
+
+def refresh(root):
+    # Rescans the folders changed since they were indexed, one stat per folder otherwise
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list_dir(directory)
+        except OSError:
+            continue
+        stack.extend(entry["path"] for entry in entries if entry["is_folder"])
+
+def update_file(path, source=None):
+    # Records a file Beb.Tools just wrote, so its folder isn't rescanned because of the write
+    directory = os.path.dirname(path)
+    key = _key(directory)
+    try:
+        stat = os.stat(path)
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return
+    entry = _script_entry(path, stat, source) if path.endswith(".py") else None
+    with _lock:
+        if key not in _folder_mtimes:
+            return
+        if key in _bundled:
+            mtime = 0
+        if entry:
+            entry_key = _key(path)
+            if entry_key not in _entries:
+                _children[key].append(path)
+            _entries[entry_key] = entry
+        _folder_mtimes[key] = mtime
+
+def get_lint(path):
+    # Findings stored in the index, nothing is read or parsed here
+    entry = get_entry(path)
+    return entry.get("lint", ()) if entry else ()
+
+def refresh_lint(path):
+    # Re-lints a script changed outside Beb.Tools; one stat when it didn't change
+    entry = get_entry(path)
+    if not entry or entry["is_folder"] or _key(os.path.dirname(path)) in _bundled:
+        return
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return
+    if stat.st_mtime_ns != entry["mtime"] or stat.st_size != entry["size"]:
+        new_entry = _script_entry(entry["path"], stat)
+        with _lock:
+            _entries[_key(path)] = new_entry
+
+def iter_scripts():
+    # All scripts in the tree, or None while the background scan is still running
+    if not _ready.is_set():
+        return None
+    with _lock:
+        return [entry for entry in _entries.values() if not entry["is_folder"]]
+
+def get_entry(path):
+    with _lock:
+        return _entries.get(_key(path))
+
+classes = ()
@@ -0,0 +1,99 @@
+import bpy
+import os
+import json
+import hashlib
+import tempfile
+from .bebtools_texts import save_copy
+
+# Kept outside bpy.app.tempdir so checkpoints survive a crash of the session that wrote them
+CHECKPOINT_DIR = os.path.join(tempfile.gettempdir(), "bebtools_checkpoints")
+STATE_PATH = os.path.join(CHECKPOINT_DIR, "state.json")
+QUEUE_PATH = os.path.join(CHECKPOINT_DIR, "queue.json")
+
+# Step index -1 is the scene before the first step
+INITIAL_STEP = -1
+
+# Cached copy of state.json, the queue panel reads it on every redraw
+_state = None
+
+
+def queue_signature(queue_items):
+    h = hashlib.sha256()
+    for item in queue_items:
+        h.update(f"{item.path}\0{item.params}\0".encode("utf-8"))
+    return h.hexdigest()
+
+def load_state():
+    global _state
+    if _state is None:
+        try:
+            with open(STATE_PATH, "r") as f:
+                _state = json.load(f)
+        except (OSError, ValueError):
+            _state = {}
+    return _state
+
+def save_state(state):
+    global _state
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    with open(STATE_PATH, "w") as f:
+        json.dump(state, f, indent=2)
+    _state = state
+
+def get_state(queue_items):
+    # State of the last checkpointed run, or an empty dict if it belongs to another queue
+    state = load_state()
+    if state.get("signature") != queue_signature(queue_items):
+        return {}
+    return state
+
+def clear_checkpoints():
+    global _state
+    state = load_state()
+    for path in state.get("checkpoints", {}).values():
+        if os.path.exists(path):
+            os.remove(path)
+    if os.path.exists(STATE_PATH):
+        os.remove(STATE_PATH)
+    _state = {}
+
+def begin_run(queue_items, write_queue):
+    # Fresh run: drop old snapshots and remember the queue and file being processed
+    clear_checkpoints()
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    write_queue(QUEUE_PATH, queue_items)
+    state = {
+        "signature": queue_signature(queue_items),
+        "blend_file": bpy.data.filepath,
+        "checkpoints": {},
+        "failed_step": None,
+    }
+    save_state(state)
+    return state
+
+def save_checkpoint(state, step):
+    # Uncompressed copy so the snapshot costs little more than the write itself
+    path = os.path.join(CHECKPOINT_DIR, f"step_{step + 1:03d}.blend")
+    save_copy(path)
+    state["checkpoints"][str(step)] = path
+    save_state(state)
+    return path
+
+def record_failure(state, step):
+    state["failed_step"] = step
+    save_state(state)
+
+def record_success(state):
+    state["failed_step"] = None
+    save_state(state)
+
+def latest_checkpoint(state, before_step):
+    # Latest snapshot taken after a step earlier than before_step: (step, path) or None
+    steps = [int(step) for step, path in state.get("checkpoints", {}).items()
+             if int(step) < before_step and os.path.exists(path)]
+    if not steps:
+        return None
+    step = max(steps)
+    return step, state["checkpoints"][str(step)]
+
+classes = ()
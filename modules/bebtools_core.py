@@ -1,7 +1,20 @@
 import bpy
+import time
+from contextlib import nullcontext
 from bpy.types import Operator
-from bpy.props import StringProperty
-from .bebtools_utils import SCRIPTS_DIR, update_info_text, get_scripts
+from bpy.props import StringProperty, IntProperty, EnumProperty, BoolProperty
+from .bebtools_utils import SCRIPTS_DIR, update_info_text, get_scripts, process_rss, format_bytes
+from .bebtools_runner import run_script, parse_params, undo_scope, log_scope
+from .bebtools_log import get_logger
+from .bebtools_sandbox import is_sandboxed, submit, run_detached, start_background
+from .bebtools_graph import parse_resources, build_graph, run_graph
+from .bebtools_scene_index import scene_index
+from .bebtools_memory import snapshot, diff, format_delta, purge_orphans
+from .bebtools_queue import write_queue_file, read_queue_file, fill_queue_item, queue_index
+from .bebtools_checkpoint import (QUEUE_PATH, INITIAL_STEP, get_state, begin_run, save_checkpoint,
+                                  record_failure, record_success, latest_checkpoint, clear_checkpoints)
+
+log = get_logger("Beb.Tools")
 
 class BEBTOOLS_OT_InitScripts(Operator):
     bl_idname = "bebtools.init_scripts"
@@ -12,7 +25,7 @@ class BEBTOOLS_OT_InitScripts(Operator):
     def execute(self, context):
         wm = context.window_manager
         load_dir = self.directory if self.directory else SCRIPTS_DIR
-        print(f"Initializing with directory: {load_dir}")
+        log.debug("Initializing with directory: %s", load_dir)
         get_scripts(load_dir)
         wm.bebtools_active_index = -1
         wm.bebtools_current_dir = load_dir  # Set current dir on init
@@ -23,6 +36,7 @@ class BEBTOOLS_OT_Run(Operator):
     bl_idname = "bebtools.run"
     bl_label = "▶ Run"
     bl_description = "Run the selected script"
+    # Blender pushes the run's undo step, undo_scope suspends or skips it per the Undo run mode
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
@@ -33,9 +47,13 @@ class BEBTOOLS_OT_Run(Operator):
                 self.report({'WARNING'}, "Select a script to run")
                 return {'CANCELLED'}
             script_path = script_item.path
+            if is_sandboxed(script_path):
+                run_detached(script_path, name=script_item.name)
+                self.report({'INFO'}, f"Running {script_item.name} in the background")
+                return {'FINISHED'}
             try:
-                with open(script_path, "r") as f:
-                    exec(f.read(), globals())
+                with log_scope(wm), undo_scope(wm.bebtools_undo_mode, f"Beb.Tools: {script_item.name}", in_operator=True):
+                    run_script(script_path)
                 self.report({'INFO'}, f"Executed script: {script_item.name}")
             except Exception as e:
                 self.report({'ERROR'}, f"Error running {script_item.name}: {str(e)}")
@@ -44,29 +62,245 @@ class BEBTOOLS_OT_Run(Operator):
         return {'FINISHED'}
 
 
+def finish_background_queue(results, error, active, names, paths, elapsed):
+    # Reports a queue run that went to the background; the queue may have been edited meanwhile
+    if error:
+        log.error("Queue run failed: %s", error)
+        return
+    queue = bpy.context.window_manager.bebtools_queue
+    for k in sorted(results):
+        step_error, duration = results[k]
+        if step_error is None:
+            if active[k] < len(queue) and queue[active[k]].path == paths[k]:
+                queue[active[k]].last_duration = duration
+            log.info("Executed script: %s", names[k])
+        else:
+            log.error("Error running %s: %s", names[k], step_error)
+    log.info("Queue finished in %.2fs in the background", elapsed)
+
+def window_scope(wm):
+    # Timers run without a window, operators called from them need one
+    return bpy.context.temp_override(window=wm.windows[0]) if wm.windows else nullcontext()
+
+def pending_resume(queue):
+    # (step, path) of the checkpoint Run All would resume a failed run from, or None
+    if not any(item.checkpoint for item in queue):
+        return None
+    state = get_state(queue)
+    if state.get("failed_step") is None:
+        return None
+    return latest_checkpoint(state, state["failed_step"])
+
+def restore_checkpoint(path, next_step, blend_file):
+    # Loading a file ends whatever operator is running, so the load happens from a timer once
+    # the calling operator returned, and the queue continues from a persistent one afterwards.
+    # Callers make sure unsaved changes may be discarded.
+    def resume_timer():
+        wm = bpy.context.window_manager
+        if not wm.bebtools_queue:
+            for step in read_queue_file(QUEUE_PATH):
+                if step["path"] is not None:
+                    fill_queue_item(wm.bebtools_queue.add(), step)
+            queue_index.invalidate()
+        with window_scope(wm):
+            bpy.ops.bebtools.multi_run('EXEC_DEFAULT', start_step=next_step)
+            # The session now points at the snapshot in the temp folder, offer to save the result
+            # where the run started instead of letting the next Ctrl+S write there
+            if blend_file:
+                bpy.ops.wm.save_as_mainfile('INVOKE_DEFAULT', filepath=blend_file)
+            else:
+                bpy.ops.wm.save_as_mainfile('INVOKE_DEFAULT')
+        return None
+
+    def load_timer():
+        bpy.app.timers.register(resume_timer, first_interval=0.1, persistent=True)
+        with window_scope(bpy.context.window_manager):
+            bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+        return None
+
+    bpy.app.timers.register(load_timer, first_interval=0.0)
+
+
 class BEBTOOLS_OT_MultiRun(Operator):
     bl_idname = "bebtools.multi_run"
     bl_label = "Run All"
     bl_description = "Run all queued scripts in order"
+    # Blender pushes the run's undo step, undo_scope suspends or skips it per the Undo run mode
     bl_options = {'REGISTER', 'UNDO'}
 
+    # -1 resumes a failed checkpointed run at its failing step, otherwise starts at step 1
+    start_step: IntProperty(name="Start Step", default=-1, options={'HIDDEN', 'SKIP_SAVE'})
+    # Resuming loads a checkpoint; set once the user confirmed losing unsaved changes
+    discard_changes: BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
+
     def invoke(self, context, event):
-        if context.window_manager.bebtools_queue:
-            return context.window_manager.invoke_confirm(self, event)
+        wm = context.window_manager
+        if wm.bebtools_queue:
+            if self.start_step < 0 and bpy.data.is_dirty and pending_resume(wm.bebtools_queue):
+                self.discard_changes = True
+                return wm.invoke_confirm(self, event, title="Resume From Checkpoint",
+                                         message="Loads the last checkpoint, unsaved changes will be lost")
+            return wm.invoke_confirm(self, event)
         else:
             self.report({'WARNING'}, "No scripts in the queue")
             return {'CANCELLED'}
 
     def execute(self, context):
         wm = context.window_manager
-        for item in wm.bebtools_queue:
-            script_path = item.path
-            try:
-                with open(script_path, "r") as f:
-                    exec(f.read(), globals())
-                self.report({'INFO'}, f"Executed script: {item.name}")
-            except Exception as e:
-                self.report({'ERROR'}, f"Error running {item.name}: {str(e)}")
+        queue = wm.bebtools_queue
+        start_step = max(self.start_step, 0)
+
+        # Checkpointed runs go strictly in order on the main thread and stop at the first error
+        state = None
+        if any(item.checkpoint for item in queue):
+            state = get_state(queue)
+            checkpoint = pending_resume(queue) if self.start_step < 0 else None
+            if checkpoint:
+                if bpy.data.is_dirty and not self.discard_changes:
+                    self.report({'WARNING'}, "Save or revert the file first, resuming loads a checkpoint")
+                    return {'CANCELLED'}
+                step, path = checkpoint
+                self.report({'INFO'}, f"Resuming failed run from checkpoint after step {step + 1}")
+                restore_checkpoint(path, step + 1, state.get("blend_file", ""))
+                return {'FINISHED'}
+            if start_step == 0 or not state:
+                state = begin_run(queue, write_queue_file)
+                save_checkpoint(state, INITIAL_STEP)
+                start_step = 0
+
+        # Copy step data out of RNA so worker threads never touch Blender data
+        active = list(range(start_step, len(queue)))
+        names = [queue[j].name for j in active]
+        paths = [queue[j].path for j in active]
+        params = [queue[j].params for j in active]
+        checkpoints = [queue[j].checkpoint for j in active]
+        purges = [wm.bebtools_purge_mode == 'EVERY_STEP' or
+                  (wm.bebtools_purge_mode == 'MARKED' and queue[j].purge_after) for j in active]
+        track_memory = wm.bebtools_track_memory
+        # Scripts that declared they don't use bpy run in the sandbox processes
+        sandboxed = [is_sandboxed(path) for path in paths]
+        steps = [(parse_resources(queue[j].inputs), parse_resources(queue[j].outputs),
+                  (queue[j].uses_bpy and not sandboxed[k]) or state is not None)
+                 for k, j in enumerate(active)]
+        deps = build_graph(steps)
+
+        # Data block counts before each main thread step, bpy.data can't be read from the workers
+        snapshots = {}
+
+        def run_step(k):
+            if track_memory and steps[k][2]:
+                snapshots[k] = snapshot()
+            if sandboxed[k]:
+                error = submit(paths[k], parse_params(params[k]), names[k]).result()
+                if error:
+                    raise RuntimeError(error)
+            else:
+                run_script(paths[k], parse_params(params[k]))
+
+        # Nothing touches Blender data, so the whole queue runs off the main thread
+        if steps and not any(uses_bpy for _, _, uses_bpy in steps):
+            start = time.perf_counter()
+            start_background(lambda: run_graph(steps, deps, run_step),
+                             lambda results, error: finish_background_queue(results, error, active, names, paths,
+                                                                            time.perf_counter() - start))
+            self.report({'INFO'}, f"Running {len(active)} queued scripts in the background")
+            return {'FINISHED'}
+
+        def after_step(k, error):
+            # No redraw happens between steps, bring the shared scene index up to date here
+            scene_index.sync()
+            if k in snapshots:
+                delta = diff(snapshots.pop(k), snapshot())
+                queue[active[k]].last_memory = format_delta(delta)
+                log.info("%s: %s", names[k], format_delta(delta))
+            if purges[k]:
+                log.info("Purged %s orphaned data blocks after %s", purge_orphans(), names[k])
+            if state is None:
+                return True
+            if error is not None:
+                record_failure(state, active[k])
+                return False
+            if checkpoints[k]:
+                save_checkpoint(state, active[k])
+            return True
+
+        start = time.perf_counter()
+        rss_before = process_rss()
+        with log_scope(wm), undo_scope(wm.bebtools_undo_mode, "Beb.Tools: Run Queue", in_operator=True):
+            results = run_graph(steps, deps, run_step, after_step)
+            if wm.bebtools_purge_mode == 'END':
+                log.info("Purged %s orphaned data blocks", purge_orphans())
+        elapsed = time.perf_counter() - start
+        memory = process_rss() - rss_before
+
+        for k in sorted(results):
+            error, duration = results[k]
+            if error is None:
+                queue[active[k]].last_duration = duration
+                self.report({'INFO'}, f"Executed script: {names[k]}")
+            else:
+                self.report({'ERROR'}, f"Error running {names[k]}: {error}")
+        if state is not None:
+            if len(results) < len(active) or any(error is not None for error, _ in results.values()):
+                self.report({'WARNING'}, "Queue stopped, Run All will resume at the failed step")
+            else:
+                record_success(state)
+        self.report({'INFO'}, f"Queue finished in {elapsed:.2f}s, memory {format_bytes(memory)} (undo: {wm.bebtools_undo_mode.lower()})")
+        return {'FINISHED'}
+
+
+class BEBTOOLS_OT_ResumeQueue(Operator):
+    bl_idname = "bebtools.resume_queue"
+    bl_label = "Resume From Checkpoint"
+    bl_description = "Restore a checkpoint of the last run and continue the queue from there"
+
+    def get_checkpoint_items(self, context):
+        queue = context.window_manager.bebtools_queue
+        state = get_state(queue)
+        items = []
+        for step in sorted(int(step) for step in state.get("checkpoints", {})):
+            if step == INITIAL_STEP:
+                items.append((str(step), "Before step 1", "Restore the scene as it was before the queue ran"))
+            elif step < len(queue) - 1:
+                items.append((str(step), f"After step {step + 1}: {queue[step].name}", f"Continue at step {step + 2}"))
+        return items if items else [("NONE", "No checkpoints", "")]
+
+    checkpoint: EnumProperty(name="Checkpoint", items=get_checkpoint_items)
+    discard_changes: BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
+
+    def invoke(self, context, event):
+        # The dialog is the confirmation, it warns when unsaved changes would be lost
+        self.discard_changes = True
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "checkpoint")
+        if bpy.data.is_dirty:
+            layout.label(text="Unsaved changes in this file will be lost", icon="ERROR")
+
+    def execute(self, context):
+        if self.checkpoint == "NONE":
+            self.report({'WARNING'}, "No checkpoints saved for this queue")
+            return {'CANCELLED'}
+        if bpy.data.is_dirty and not self.discard_changes:
+            self.report({'WARNING'}, "Save or revert the file first, resuming loads a checkpoint")
+            return {'CANCELLED'}
+        step = int(self.checkpoint)
+        state = get_state(context.window_manager.bebtools_queue)
+        self.report({'INFO'}, f"Resuming queue at step {step + 2}")
+        restore_checkpoint(state["checkpoints"][self.checkpoint], step + 1, state.get("blend_file", ""))
+        return {'FINISHED'}
+
+
+class BEBTOOLS_OT_ClearCheckpoints(Operator):
+    bl_idname = "bebtools.clear_checkpoints"
+    bl_label = "Clear Checkpoints"
+    bl_description = "Delete saved checkpoints so the next run starts from step 1"
+
+    def execute(self, context):
+        clear_checkpoints()
+        self.report({'INFO'}, "Checkpoints cleared")
         return {'FINISHED'}
 
 
@@ -74,9 +308,6 @@ classes = (
     BEBTOOLS_OT_InitScripts,
     BEBTOOLS_OT_Run,
     BEBTOOLS_OT_MultiRun,
+    BEBTOOLS_OT_ResumeQueue,
+    BEBTOOLS_OT_ClearCheckpoints,
 )
-
-
-def init_scripts_timer():
-    bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT')
-    return None
\ No newline at end of file
@@ -0,0 +1,97 @@
+import bpy
+from bpy.app.handlers import persistent
+
+# Collections are tracked by session_uid, which stays the same when they are renamed
+# Collections rendered since the file was loaded
+_rendered = set()
+# Collections whose objects, meshes or materials changed since their last render
+_dirty = set()
+# Meshes and materials changed since the dirty state was last asked for
+_changed_data = set()
+
+
+def get_parent_map():
+    parents = {}
+    for coll in bpy.data.collections:
+        for child in coll.children:
+            parents.setdefault(child.session_uid, []).append(coll.session_uid)
+    return parents
+
+def mark_collections_dirty(uids):
+    # Nested collections render their children too, so dirty flags propagate upwards
+    if not uids:
+        return
+    parents = get_parent_map()
+    stack = list(uids)
+    while stack:
+        uid = stack.pop()
+        if uid in _dirty:
+            continue
+        _dirty.add(uid)
+        stack.extend(parents.get(uid, ()))
+
+def object_collections(objects):
+    # Collections the objects are in, scene master collections left out
+    uids = set()
+    for obj in objects:
+        uids.update(coll.session_uid for coll in obj.users_collection if not coll.is_embedded_data)
+    return uids
+
+def resolve_changed_data():
+    # Mesh and material edits are matched to the objects using them in one pass, only when
+    # the dirty state is asked for instead of on every depsgraph update
+    if not _changed_data:
+        return
+    changed = set(_changed_data)
+    _changed_data.clear()
+    objects = [obj for obj in bpy.data.objects
+               if (obj.data is not None and obj.data.session_uid in changed)
+               or any(slot.material is not None and slot.material.session_uid in changed for slot in obj.material_slots)]
+    mark_collections_dirty(object_collections(objects))
+
+def is_dirty(coll):
+    resolve_changed_data()
+    return coll.session_uid not in _rendered or coll.session_uid in _dirty
+
+def get_dirty_collections(collections):
+    resolve_changed_data()
+    return [coll for coll in collections if coll.session_uid not in _rendered or coll.session_uid in _dirty]
+
+def mark_rendered(coll):
+    # Edits made before the render are in it
+    resolve_changed_data()
+    _rendered.add(coll.session_uid)
+    _dirty.discard(coll.session_uid)
+
+def clear():
+    _rendered.clear()
+    _dirty.clear()
+    _changed_data.clear()
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    objects = set()
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Object):
+            if update.is_updated_geometry or update.is_updated_transform or update.is_updated_shading:
+                objects.add(id_data)
+        elif isinstance(id_data, (bpy.types.Mesh, bpy.types.Material)):
+            _changed_data.add(id_data.session_uid)
+    mark_collections_dirty(object_collections(objects))
+
+@persistent
+def on_load_post(*args):
+    clear()
+
+def register_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    bpy.app.handlers.load_post.append(on_load_post)
+
+def unregister_handlers():
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    if on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(on_load_post)
+
+classes = ()
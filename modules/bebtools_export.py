@@ -0,0 +1,260 @@
+import bpy
+import os
+import sys
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+import numpy as np
+from .bebtools_files import atomic_write
+from .bebtools_texts import save_copy
+from .bebtools_sandbox import add_output, POOL_SIZE
+from .bebtools_log import get_logger
+
+# Collections are exported by `blender -b` processes running this script on a saved copy of
+# the scene, see bebtools_export_worker.py for the protocol
+WORKER_PATH = os.path.join(os.path.dirname(__file__), "bebtools_export_worker.py")
+PROGRESS_PREFIX = "BEBTOOLS_EXPORT "
+EXPORT_EXTENSIONS = {'FBX': ".fbx", 'GLB': ".glb", 'USD': ".usdc"}
+# Kept in the export folder: collection name -> {"hash", "file", "format"} of its last export
+MANIFEST_NAME = "bebtools_export_manifest.json"
+
+log = get_logger("Beb.Tools")
+
+
+def _array_bytes(collection, prop, size, dtype=np.float32):
+    values = np.empty(len(collection) * size, dtype=dtype)
+    collection.foreach_get(prop, values)
+    return values.tobytes()
+
+# Attribute data type -> (foreach property, values per element, dtype)
+ATTRIBUTE_ARRAYS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, np.bool_),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+# Editor state of nodes and modifiers, changing it doesn't change an export
+UI_PROPS = {"rna_type", "location", "width", "height", "dimensions", "select", "hide", "show_options",
+            "show_preview", "show_texture", "show_expanded", "is_active", "show_in_editmode", "show_on_cage"}
+
+def _value_text(value):
+    # Arrays (vectors, colors) as tuples, everything else as is
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        value = tuple(value)
+    return repr(value)
+
+def _settings(struct):
+    # Every property of an RNA struct as text, pointers by name
+    values = []
+    for prop in struct.bl_rna.properties:
+        if prop.identifier in UI_PROPS or prop.type == 'COLLECTION':
+            continue
+        value = getattr(struct, prop.identifier, None)
+        if prop.type == 'POINTER':
+            value = getattr(value, "name", None)
+        values.append(f"{prop.identifier}={_value_text(value)}")
+    return "|".join(values)
+
+def _mesh_bytes(digest, mesh):
+    digest.update(_array_bytes(mesh.loops, "vertex_index", 1, np.int32))
+    digest.update(_array_bytes(mesh.polygons, "loop_total", 1, np.int32))
+    digest.update(_array_bytes(mesh.polygons, "material_index", 1, np.int32))
+    # Positions, UV maps, colors and any other attribute; custom normals aren't one before 4.5
+    for attr in mesh.attributes:
+        digest.update(f"{attr.name}|{attr.domain}|{attr.data_type}".encode("utf-8"))
+        array = ATTRIBUTE_ARRAYS.get(attr.data_type)
+        if array is not None:
+            digest.update(_array_bytes(attr.data, *array))
+    if mesh.has_custom_normals:
+        digest.update(_array_bytes(mesh.corner_normals, "vector", 3))
+    if mesh.shape_keys:
+        for key in mesh.shape_keys.key_blocks:
+            digest.update(f"{key.name}|{key.value}|{key.mute}|{key.relative_key.name}".encode("utf-8"))
+            digest.update(_array_bytes(key.data, "co", 3))
+
+def _node_tree_text(tree, seen):
+    # Nodes with their settings and unlinked input values, links, and node groups they use
+    if tree is None or tree in seen:
+        return ""
+    seen.add(tree)
+    parts = []
+    for node in tree.nodes:
+        parts.append(f"{node.bl_idname}:{node.name}:{_settings(node)}")
+        for socket in node.inputs:
+            value = getattr(socket, "default_value", None)
+            if not socket.is_linked and value is not None:
+                parts.append(f"{socket.identifier}={_value_text(value)}")
+        parts.append(_node_tree_text(getattr(node, "node_tree", None), seen))
+    parts.extend(f"{link.from_node.name}.{link.from_socket.identifier}>{link.to_node.name}.{link.to_socket.identifier}"
+                 for link in tree.links)
+    return "|".join(parts)
+
+def _material_text(material, cache):
+    if material is None:
+        return ""
+    if material not in cache:
+        cache[material] = f"{material.name}:{_settings(material)}:" + \
+            (_node_tree_text(material.node_tree, set()) if material.use_nodes else "")
+    return cache[material]
+
+def collection_fingerprint(coll, materials=None):
+    # Hash of what an export of the collection contains: objects, transforms, mesh geometry and
+    # attributes, custom normals, shape keys, modifier settings and materials with their nodes.
+    # Anything else changing, image files included, doesn't trigger a new export.
+    materials = {} if materials is None else materials
+    digest = hashlib.sha1()
+    for obj in sorted(coll.all_objects, key=lambda obj: obj.name):
+        digest.update(f"{obj.name}|{obj.type}|{obj.data.name if obj.data else ''}".encode("utf-8"))
+        digest.update(np.array(obj.matrix_world, dtype=np.float32).tobytes())
+        for slot in obj.material_slots:
+            digest.update(_material_text(slot.material, materials).encode("utf-8"))
+        for mod in obj.modifiers:
+            digest.update(f"{mod.type}:{_settings(mod)}".encode("utf-8"))
+        if obj.type == 'MESH' and obj.data:
+            _mesh_bytes(digest, obj.data)
+    return digest.hexdigest()
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def export_path(directory, name, file_format, taken=None):
+    # `taken` holds the lowercased file names already used in this export, names that clean to
+    # the same file get a numbered suffix
+    base = bpy.path.clean_name(name)
+    extension = EXPORT_EXTENSIONS[file_format]
+    file_name = base + extension
+    if taken is not None:
+        number = 1
+        while file_name.lower() in taken:
+            file_name = f"{base}_{number}{extension}"
+            number += 1
+        taken.add(file_name.lower())
+    return os.path.join(directory, file_name)
+
+def plan_export(collections, directory, file_format, changed_only):
+    # Collections to export as {"name", "file", "hash", "weight"}, and the names skipped
+    # because their last export in `directory` still matches
+    manifest = read_manifest(directory) if changed_only else {}
+    planned, skipped = [], []
+    taken = set()
+    # Material hashes, shared by the collections using them
+    materials = {}
+    for coll in collections:
+        fingerprint = collection_fingerprint(coll, materials)
+        path = export_path(directory, coll.name, file_format, taken)
+        entry = manifest.get(coll.name)
+        if entry and entry.get("hash") == fingerprint and entry.get("format") == file_format \
+                and os.path.exists(path):
+            skipped.append(coll.name)
+        else:
+            planned.append({"name": coll.name, "file": path, "hash": fingerprint,
+                            "weight": len(coll.all_objects)})
+    return planned, skipped
+
+def shard(items, count):
+    # Largest collections first, each onto the least loaded worker
+    shards = [[] for _ in range(max(1, min(count, len(items))))]
+    loads = [0] * len(shards)
+    for item in sorted(items, key=lambda item: -item["weight"]):
+        k = loads.index(min(loads))
+        shards[k].append(item)
+        loads[k] += item["weight"] + 1
+    return shards
+
+
+class ExportRun:
+    """One export: a saved copy of the scene and the worker processes exporting it."""
+
+    def __init__(self, planned, directory, file_format, workers=POOL_SIZE):
+        self.planned = planned
+        self.directory = directory
+        self.file_format = file_format
+        self.folder = tempfile.mkdtemp(prefix="bebtools_export_")
+        self.processes = []
+        self.results = {}
+        self._lock = threading.Lock()
+        try:
+            self._start(workers)
+        except Exception:
+            self.kill()
+            shutil.rmtree(self.folder, ignore_errors=True)
+            raise
+
+    def _start(self, workers):
+        blend_path = os.path.join(self.folder, "scene.blend")
+        save_copy(blend_path)
+        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        for k, items in enumerate(shard(self.planned, workers)):
+            job_path = os.path.join(self.folder, f"job_{k}.json")
+            collections = [{"name": item["name"], "file": item["file"]} for item in items]
+            with open(job_path, "w") as f:
+                json.dump({"format": self.file_format, "collections": collections}, f)
+            process = subprocess.Popen([bpy.app.binary_path, "-b", blend_path, "--factory-startup",
+                                        "--python", WORKER_PATH, "--", job_path],
+                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                       creationflags=flags)
+            self.processes.append((process, items))
+
+    def kill(self):
+        for process, _ in self.processes:
+            if process.poll() is None:
+                process.kill()
+
+    def _read(self, process, items):
+        for line in process.stdout:
+            if not line.startswith(PROGRESS_PREFIX):
+                continue
+            try:
+                message = json.loads(line[len(PROGRESS_PREFIX):])
+            except ValueError:
+                continue
+            with self._lock:
+                self.results[message["name"]] = message.get("error")
+                done = len(self.results)
+            status = f"failed: {message['error']}" if message.get("error") else "exported"
+            add_output("Export", f"[{done}/{len(self.planned)}] {message['name']} {status}")
+        process.wait()
+        # Whatever the worker didn't report on was lost with it
+        with self._lock:
+            for item in items:
+                self.results.setdefault(item["name"], f"Export worker exited with status {process.returncode}")
+
+    def wait(self):
+        # Blocks until every worker is done, returns collection name -> error or None
+        readers = [threading.Thread(target=self._read, args=pair, daemon=True) for pair in self.processes]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        return dict(self.results)
+
+    def finish(self, results):
+        # Records the successful exports in the manifest and removes the temporary files
+        manifest = read_manifest(self.directory)
+        for item in self.planned:
+            if results.get(item["name"], "missing") is None:
+                manifest[item["name"]] = {"hash": item["hash"], "file": os.path.basename(item["file"]),
+                                          "format": self.file_format}
+        atomic_write(os.path.join(self.directory, MANIFEST_NAME), json.dumps(manifest, indent=2, sort_keys=True))
+        shutil.rmtree(self.folder, ignore_errors=True)
+        failed = sorted(name for name, error in results.items() if error)
+        for name in failed:
+            log.error("Error exporting %s: %s", name, results[name])
+        return len(results) - len(failed), failed
+
+classes = ()
@@ -0,0 +1,62 @@
+# Exports collections of a saved .blend, one file each, inside a background Blender.
+#
+# Started by bebtools_export as
+#   blender -b <scene.blend> --factory-startup --python bebtools_export_worker.py -- <job.json>
+# The job lists {"directory", "format", "collections": [{"name", "file"}]}. Progress goes back
+# on stdout as lines starting with PREFIX followed by JSON: {"name", "error"} after every
+# collection. Standalone on purpose: the add-on isn't enabled in this Blender.
+import bpy
+import sys
+import json
+import traceback
+
+PREFIX = "BEBTOOLS_EXPORT "
+
+
+def send(message):
+    print(PREFIX + json.dumps(message), flush=True)
+
+def all_layer_collections(layer_collection):
+    yield layer_collection
+    for child in layer_collection.children:
+        yield from all_layer_collections(child)
+
+def make_selectable():
+    # Objects in excluded or hidden collections can't be selected, and exporters work on selection
+    for layer_collection in all_layer_collections(bpy.context.view_layer.layer_collection):
+        layer_collection.exclude = False
+        layer_collection.hide_viewport = False
+    for obj in bpy.context.view_layer.objects:
+        obj.hide_set(False)
+        obj.hide_select = False
+
+def export_collection(coll, path, file_format):
+    bpy.ops.object.select_all(action='DESELECT')
+    for obj in coll.all_objects:
+        obj.select_set(True)
+    if file_format == 'FBX':
+        bpy.ops.export_scene.fbx(filepath=path, use_selection=True)
+    elif file_format == 'GLB':
+        bpy.ops.export_scene.gltf(filepath=path, export_format='GLB', use_selection=True)
+    elif file_format == 'USD':
+        bpy.ops.wm.usd_export(filepath=path, selected_objects_only=True)
+    else:
+        raise ValueError(f"Unknown format {file_format}")
+
+def main():
+    with open(sys.argv[sys.argv.index("--") + 1], "r") as f:
+        job = json.load(f)
+    make_selectable()
+    for item in job["collections"]:
+        coll = bpy.data.collections.get(item["name"])
+        error = None
+        try:
+            if coll is None:
+                raise KeyError(f"Collection {item['name']} not found")
+            export_collection(coll, item["file"], job["format"])
+        except Exception as e:
+            traceback.print_exc()
+            error = str(e) or type(e).__name__
+        send({"name": item["name"], "error": error})
+
+main()
@@ -0,0 +1,94 @@
+import os
+import re
+import stat
+import shutil
+import tempfile
+from datetime import datetime
+from .bebtools_utils import SCRIPTS_DIR, HISTORY_DIR, store_instructions
+from .bebtools_catalog import update_file
+from .bebtools_runner import store_code
+
+# Version files are "<name>.<YYYYmmdd-HHMMSS-ffffff><ext>", so sorting by name sorts by age
+VERSION_PATTERN = r"\.\d{8}-\d{6}-\d{6}"
+# Read once at import: os.umask can only be read by setting it, which isn't thread safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def history_folder(path):
+    # Mirrors the scripts tree; files outside it share one folder
+    try:
+        relative = os.path.relpath(os.path.dirname(os.path.abspath(path)), os.path.abspath(SCRIPTS_DIR))
+    except ValueError:  # Another drive on Windows
+        relative = os.pardir
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return os.path.join(HISTORY_DIR, "_other")
+    return os.path.normpath(os.path.join(HISTORY_DIR, relative))
+
+def list_versions(path):
+    # Saved versions of a file, oldest first
+    folder = history_folder(path)
+    stem, ext = os.path.splitext(os.path.basename(path))
+    pattern = re.compile(re.escape(stem) + VERSION_PATTERN + re.escape(ext) + "$")
+    try:
+        names = sorted(name for name in os.listdir(folder) if pattern.match(name))
+    except OSError:
+        return []
+    return [os.path.join(folder, name) for name in names]
+
+def save_version(path, keep):
+    # Copies the current file into the history and drops versions beyond the newest `keep`
+    if keep <= 0 or not os.path.exists(path):
+        return
+    folder = history_folder(path)
+    os.makedirs(folder, exist_ok=True)
+    stem, ext = os.path.splitext(os.path.basename(path))
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    shutil.copy2(path, os.path.join(folder, f"{stem}.{stamp}{ext}"))
+    for old in list_versions(path)[:-keep]:
+        os.remove(old)
+
+def atomic_write(path, text, keep_versions=0):
+    # Writes a temp file next to the target, fsyncs it and renames it over the target,
+    # so a crash leaves either the old or the new file but never a truncated one
+    directory = os.path.dirname(path)
+    save_version(path, keep_versions)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".bebtools_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp files are owner-only, new files get the mode open() would have given them
+        if os.path.exists(path):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        else:
+            os.chmod(temp_path, 0o666 & ~_UMASK)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    # Persist the rename itself; directories can't be opened for fsync on Windows
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+def save_script(path, text, keep_versions=0):
+    # Atomic write, then the catalog and code cache are updated in place instead of rescanned
+    atomic_write(path, text, keep_versions)
+    update_file(path, text)
+    store_code(path, text)
+
+def save_instructions(path, text, keep_versions=0):
+    atomic_write(path, text, keep_versions)
+    update_file(path)
+    store_instructions(path, text)
+
+classes = ()
@@ -0,0 +1,77 @@
+import math
+import numpy as np
+import mathutils
+from .bebtools_bounds import world_aabbs
+
+# Object types with geometry a camera should frame, lights, cameras and empties have none
+FRAMED_TYPES = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'VOLUME', 'POINTCLOUD', 'CURVES',
+                'GPENCIL', 'GREASEPENCIL'}
+# Custom properties linking a framing camera to what it frames
+FRAMES_KEY = "bebtools_frames"
+FRAMES_TYPE_KEY = "bebtools_frames_type"
+
+
+def object_bounds(objects):
+    # World AABBs, meshes from their vertices in one batch, other types from their bound_box
+    mins = np.empty((len(objects), 3))
+    maxs = np.empty((len(objects), 3))
+    meshes = [k for k, obj in enumerate(objects) if obj.type == 'MESH' and obj.data]
+    if meshes:
+        mins[meshes], maxs[meshes] = world_aabbs([objects[k] for k in meshes])
+    mesh_rows = set(meshes)
+    for k, obj in enumerate(objects):
+        if k not in mesh_rows:
+            matrix = np.array(obj.matrix_world)
+            corners = np.array(obj.bound_box) @ matrix[:3, :3].T + matrix[:3, 3]
+            mins[k], maxs[k] = corners.min(axis=0), corners.max(axis=0)
+    return mins, maxs
+
+def group_bounds(groups):
+    """World AABBs enclosing each group of objects, every object measured once.
+
+    Returns (mins, maxs, valid), valid is False for groups without any geometry.
+    """
+    rows = {}
+    for group in groups:
+        for obj in group:
+            if obj.type in FRAMED_TYPES:
+                rows.setdefault(obj, len(rows))
+    mins, maxs = object_bounds(list(rows))
+    members = [[rows[obj] for obj in group if obj in rows] for group in groups]
+    valid = np.array([bool(indices) for indices in members], dtype=bool)
+    group_mins = np.zeros((len(groups), 3))
+    group_maxs = np.zeros((len(groups), 3))
+    if valid.any():
+        indices = np.concatenate([indices for indices in members if indices])
+        starts = np.cumsum([0] + [len(indices) for indices in members if indices][:-1])
+        group_mins[valid] = np.minimum.reduceat(mins[indices], starts)
+        group_maxs[valid] = np.maximum.reduceat(maxs[indices], starts)
+    return group_mins, group_maxs, valid
+
+def view_direction(elevation, azimuth):
+    # Unit vector from the target towards the camera, azimuth 0 looks along +Y
+    return mathutils.Vector((math.cos(elevation) * math.sin(azimuth),
+                             -math.cos(elevation) * math.cos(azimuth),
+                             math.sin(elevation)))
+
+def frame_bounds(mins, maxs, aspect, lens, sensor_width=36.0, elevation=math.radians(30),
+                 azimuth=math.radians(45), margin=1.1):
+    """Camera placements that fit each box's bounding sphere into the view.
+
+    The sensor covers the longer side of the frame (sensor fit Auto), so the sphere has to
+    fit the narrower field of view. Returns (locations, rotation, clip_starts, clip_ends);
+    every camera looks the same way, so rotation is one Euler shared by all of them.
+    """
+    mins = np.asarray(mins, dtype=np.float64)
+    maxs = np.asarray(maxs, dtype=np.float64)
+    centers = (mins + maxs) / 2
+    radii = np.maximum(np.linalg.norm(maxs - mins, axis=1) / 2, 0.001)
+    fov = 2 * math.atan(sensor_width / (2 * lens))
+    narrow = 2 * math.atan(math.tan(fov / 2) * min(aspect, 1 / aspect))
+    distances = radii * margin / math.sin(narrow / 2)
+    direction = view_direction(elevation, azimuth)
+    locations = centers + np.outer(distances, direction)
+    rotation = (-direction).to_track_quat('-Z', 'Y').to_euler()
+    return locations, rotation, np.maximum(distances - radii * 2, 0.001), distances + radii * 2
+
+classes = ()
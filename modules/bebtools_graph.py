@@ -0,0 +1,142 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Worker threads for queue steps that don't touch bpy, created on first use
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) - 1), thread_name_prefix="bebtools")
+    return _executor
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+def parse_resources(text):
+    # "collection:Props, scene:Export, file:/tmp/out.fbx" -> {"collection:Props", ...}
+    return {part.strip() for part in text.split(",") if part.strip()}
+
+def build_graph(steps, ordering=True):
+    # steps: list of (inputs, outputs, uses_bpy). Returns the set of predecessors per step.
+    # A step waits for earlier steps whose outputs it reads or writes, or that read what it writes.
+    # With ordering, steps touching bpy also wait for the previous bpy step so they keep their
+    # queue order; that edge only schedules, it isn't a data dependency.
+    deps = []
+    last_bpy = None
+    for j, (inputs_j, outputs_j, uses_bpy_j) in enumerate(steps):
+        step_deps = set()
+        for i in range(j):
+            inputs_i, outputs_i, _ = steps[i]
+            if outputs_i & (inputs_j | outputs_j) or inputs_i & outputs_j:
+                step_deps.add(i)
+        if uses_bpy_j and ordering:
+            if last_bpy is not None:
+                step_deps.add(last_bpy)
+            last_bpy = j
+        deps.append(step_deps)
+    return deps
+
+def critical_path(deps, durations):
+    # Longest chain of dependent steps; deps only point backwards so index order is topological
+    finish = []
+    previous = []
+    for j, step_deps in enumerate(deps):
+        start, before = 0.0, None
+        for i in step_deps:
+            if finish[i] > start:
+                start, before = finish[i], i
+        finish.append(start + durations[j])
+        previous.append(before)
+    if not finish:
+        return 0.0, []
+    end = max(range(len(finish)), key=lambda j: finish[j])
+    path = []
+    while end is not None:
+        path.append(end)
+        end = previous[end]
+    return max(finish), path[::-1]
+
+def run_graph(steps, deps, run_step, after_step=None):
+    # Runs run_step(index) for every step: bpy steps in order on the calling (main) thread,
+    # the rest on the worker pool as soon as their dependencies finished.
+    # after_step(index, error) is called on the main thread after each bpy step and can
+    # return False to stop starting new steps.
+    # Returns {index: (error or None, seconds)}; steps reading or writing resources of a failed
+    # step are skipped, bpy steps that are merely ordered after it still run.
+    results = {}
+    data_deps = build_graph(steps, ordering=False)
+    # Skipped step -> the step whose failure caused it
+    failed_origin = {}
+    futures = {}
+    submitted = set()
+    main_steps = [j for j, step in enumerate(steps) if step[2]]
+
+    def timed(j):
+        start = time.perf_counter()
+        try:
+            run_step(j)
+            return None, time.perf_counter() - start
+        except Exception as e:
+            return str(e), time.perf_counter() - start
+
+    def failed_dep(j):
+        # The failed step behind a failed or skipped data dependency of j, or None
+        for i in sorted(data_deps[j]):
+            if i in results and results[i][0] is not None:
+                return failed_origin.get(i, i)
+        return None
+
+    def skip(j, origin):
+        failed_origin[j] = origin
+        results[j] = (f"Skipped, depends on failed step {origin + 1}", 0.0)
+
+    def submit_ready():
+        for j, step in enumerate(steps):
+            if step[2] or j in submitted:
+                continue
+            if all(i in results for i in deps[j]):
+                submitted.add(j)
+                origin = failed_dep(j)
+                if origin is not None:
+                    skip(j, origin)
+                else:
+                    futures[get_executor().submit(timed, j)] = j
+
+    def collect(block):
+        if not futures:
+            return
+        done, _ = wait(list(futures), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[futures.pop(future)] = future.result()
+
+    stopped = False
+    for j in main_steps:
+        submit_ready()
+        while not all(i in results for i in deps[j]):
+            collect(block=True)
+            submit_ready()
+        origin = failed_dep(j)
+        if origin is not None:
+            skip(j, origin)
+        else:
+            results[j] = timed(j)
+        if after_step and after_step(j, results[j][0]) is False:
+            stopped = True
+            break
+        collect(block=False)
+
+    if not stopped:
+        submit_ready()
+    while futures:
+        collect(block=True)
+        if not stopped:
+            submit_ready()
+    return results
+
+classes = ()
@@ -3,6 +3,8 @@ import os
 from bpy.types import Operator
 from bpy.props import BoolProperty
 from .bebtools_utils import update_info_text, open_or_reuse_text_editor
+from .bebtools_files import save_instructions
+from .bebtools_texts import get_text, set_contents, mark_synced, is_text_for
 
 
 class BEBTOOLS_OT_EditInstructions(Operator):
@@ -20,14 +22,7 @@ class BEBTOOLS_OT_EditInstructions(Operator):
             script_path = script_item.path
             script_name = script_item.name
             info_path = os.path.splitext(script_path)[0] + ".txt"
-            text_block = bpy.data.texts.get(script_name + ".txt")
-            if not text_block and os.path.exists(info_path):
-                text_block = bpy.data.texts.new(script_name + ".txt")
-                with open(info_path, "r") as f:
-                    text_block.from_string(f.read())
-            elif not text_block:
-                text_block = bpy.data.texts.new(script_name + ".txt")
-                text_block.from_string(f"Instructions for {script_name}")
+            text_block = get_text(info_path, default=f"Instructions for {script_name}")
 
             open_or_reuse_text_editor(context, text_block)
             for area in context.screen.areas:
@@ -58,10 +53,10 @@ class BEBTOOLS_OT_SaveInstructions(Operator):
                 if area.type == 'TEXT_EDITOR' and area.spaces.active.text:
                     text_block = area.spaces.active.text
                     break
-            if text_block and text_block.name == f"{script_name}.txt":
+            if text_block and (is_text_for(text_block, info_path) or text_block.name == f"{script_name}.txt"):
                 try:
-                    with open(info_path, "w") as f:
-                        f.write(text_block.as_string())
+                    save_instructions(info_path, text_block.as_string(), wm.bebtools_history_size)
+                    mark_synced(text_block, info_path)
                     self.report({'INFO'}, f"Saved changes to {script_name}.txt")
                     update_info_text(context)
                 except Exception as e:
@@ -98,22 +93,12 @@ class BEBTOOLS_OT_PasteEditInstructions(Operator):
             script_name = script_item.name
             info_path = os.path.splitext(script_path)[0] + ".txt"
             
-            text_block = bpy.data.texts.get(script_name + ".txt")
-            if not text_block and os.path.exists(info_path):
-                text_block = bpy.data.texts.new(script_name + ".txt")
-                with open(info_path, "r") as f:
-                    text_block.from_string(f.read())
-            elif not text_block:
-                text_block = bpy.data.texts.new(script_name + ".txt")
-                text_block.from_string(f"Instructions for {script_name}")
+            text_block = get_text(info_path, default=f"Instructions for {script_name}")
             open_or_reuse_text_editor(context, text_block)
 
             clipboard = context.window_manager.clipboard
-            if clipboard:
-                text_block.clear()
-                text_block.from_string(clipboard)
-            else:
-                text_block.clear()
+            set_contents(text_block, clipboard)
+            if not clipboard:
                 self.report({'INFO'}, "Clipboard is empty; instructions cleared")
 
             for area in context.screen.areas:
@@ -123,8 +108,8 @@ class BEBTOOLS_OT_PasteEditInstructions(Operator):
                     break
 
             try:
-                with open(info_path, "w") as f:
-                    f.write(text_block.as_string())
+                save_instructions(info_path, text_block.as_string(), wm.bebtools_history_size)
+                mark_synced(text_block, info_path)
                 self.report({'INFO'}, f"Pasted clipboard and saved to {script_name}.txt")
                 update_info_text(context)
             except Exception as e:
@@ -0,0 +1,72 @@
+import bpy
+import math
+import numpy as np
+from .bebtools_reparent import object_rows
+
+
+def read_vectors(objects, prop, size=3):
+    # One vector property of many objects as an (n, size) array, read in a single call
+    flat = np.empty(len(bpy.data.objects) * size, dtype=np.float32)
+    bpy.data.objects.foreach_get(prop, flat)
+    _, rows = object_rows(objects)
+    return flat.reshape(-1, size)[rows].astype(np.float64)
+
+def write_vectors(objects, prop, values, size=3):
+    # foreach_set works on whole collections, so every other object gets its own value back.
+    # It doesn't tag anything for update, callers re-parent or tag the objects they changed.
+    data = bpy.data.objects
+    flat = np.empty(len(data) * size, dtype=np.float32)
+    data.foreach_get(prop, flat)
+    _, rows = object_rows(objects)
+    flat.reshape(-1, size)[rows] = values
+    data.foreach_set(prop, flat)
+
+def fit_scales(scales, target):
+    """Scales each row uniformly so it fits inside `target`, keeping its proportions.
+
+    Zero axes don't limit the fit. Returns (fitted, valid); rows that are zero on every
+    axis can't be fitted and come back unchanged with valid False.
+    """
+    scales = np.asarray(scales, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        factors = np.where(scales != 0, np.asarray(target, dtype=np.float64) / scales, np.inf).min(axis=1)
+    valid = np.isfinite(factors)
+    fitted = np.where(valid[:, None], scales * np.where(valid, factors, 1.0)[:, None], scales)
+    return fitted, valid
+
+def pack_grid(sizes, spacing=0.0):
+    """Centers for boxes of the given (n, 3) sizes on a square grid of equal cells.
+
+    Rows run along -Y, boxes rest on the Z = 0 plane.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    if not len(sizes):
+        return np.zeros((0, 3))
+    columns = math.ceil(math.sqrt(len(sizes)))
+    cell = sizes[:, :2].max(axis=0) + spacing
+    index = np.arange(len(sizes))
+    return np.column_stack((index % columns * cell[0], -(index // columns) * cell[1], sizes[:, 2] / 2))
+
+def pack_shelf(sizes, spacing=0.0, width=None):
+    """Centers for boxes of the given (n, 3) sizes packed on shelves, deepest boxes first.
+
+    Each shelf fills along +X up to `width` (by default about the side of a square holding
+    every box), the next one starts behind the deepest box of the last. Boxes rest on Z = 0.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    positions = np.zeros((len(sizes), 3))
+    if not len(sizes):
+        return positions
+    footprint = sizes[:, :2] + spacing
+    if width is None:
+        width = max(math.sqrt(float((footprint[:, 0] * footprint[:, 1]).sum())), float(footprint[:, 0].max()))
+    x = y = depth = 0.0
+    for k in np.argsort(-footprint[:, 1], kind='stable'):
+        if x and x + footprint[k, 0] > width:
+            x, y, depth = 0.0, y - depth, 0.0
+        positions[k] = (x + sizes[k, 0] / 2, y - sizes[k, 1] / 2, sizes[k, 2] / 2)
+        x += footprint[k, 0]
+        depth = max(depth, footprint[k, 1])
+    return positions
+
+classes = ()
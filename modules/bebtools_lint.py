@@ -0,0 +1,137 @@
+import re
+import ast
+
+# Patterns that make scripts slow on big scenes. Each finding is (line, severity, message),
+# the message ends with a rough cost estimate.
+SEVERITY_ORDER = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
+# Collection properties whose `in` checks walk every item
+LINEAR_COLLECTIONS = {"objects", "all_objects", "children", "children_recursive"}
+LOOP_NODES = (ast.For, ast.AsyncFor, ast.While, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+# Scripts opt out of bpy with a header comment or a module-level flag
+NO_BPY_COMMENT = re.compile(r"#\s*bebtools:\s*no-bpy\b")
+NO_BPY_FLAG = re.compile(r"^BEBTOOLS_USES_BPY\s*=\s*False\b", re.MULTILINE)
+
+
+def dotted_name(node):
+    # "bpy.ops.object.empty_add" for nested attributes, None for anything else
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return None
+
+def called_function(call):
+    # Name of a function or self method a call refers to
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name) and call.func.value.id == "self":
+        return call.func.attr
+    return None
+
+
+class _LoopScanner(ast.NodeVisitor):
+    # Walks one body, tracking how deeply it is nested in loops. Function bodies are
+    # scanned separately, with a loop depth of 1 when the function is called from a loop.
+    def __init__(self, depth, via):
+        self.depth = depth
+        self.via = via
+        self.findings = []
+        self.loop_calls = set()
+
+    def scan(self, nodes):
+        for node in nodes:
+            self.visit(node)
+        return self
+
+    def add(self, node, severity, message):
+        if self.via:
+            message += f", via {self.via}"
+        self.findings.append((node.lineno, severity, message))
+
+    def generic_visit(self, node):
+        if isinstance(node, LOOP_NODES):
+            self.depth += 1
+            super().generic_visit(node)
+            self.depth -= 1
+        else:
+            super().generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        pass
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_ClassDef = visit_FunctionDef
+
+    def visit_Call(self, node):
+        if self.depth:
+            name = dotted_name(node.func)
+            if name and name.startswith("bpy.ops."):
+                self.add(node, 'HIGH', f"{name} in a loop (high: ~1 ms+ per call, updates the scene)")
+            elif name == "print":
+                self.add(node, 'LOW', "print in a loop (low: console I/O per item, use log.debug)")
+            function = called_function(node)
+            if function:
+                self.loop_calls.add((function, node.lineno))
+        self.generic_visit(node)
+
+    def visit_Compare(self, node):
+        if self.depth:
+            for op, comparator in zip(node.ops, node.comparators):
+                if isinstance(op, (ast.In, ast.NotIn)) and isinstance(comparator, ast.Attribute) \
+                        and comparator.attr in LINEAR_COLLECTIONS:
+                    self.add(node, 'MEDIUM', f"'in {dotted_name(comparator) or comparator.attr}' in a loop "
+                                             f"(medium: linear search, O(n²) overall, use a set)")
+        self.generic_visit(node)
+
+
+def collect_functions(tree):
+    functions = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.setdefault(node.name, []).append(node)
+    return functions
+
+def lint_tree(tree):
+    functions = collect_functions(tree)
+    # Functions reached from a loop, with the first call site, until no new ones turn up
+    loop_called = {}
+    while True:
+        scanners = [_LoopScanner(0, None).scan(tree.body)]
+        for name, nodes in functions.items():
+            via = loop_called.get(name)
+            for node in nodes:
+                scanners.append(_LoopScanner(1 if via else 0, via).scan(node.body))
+        new = {}
+        for scanner in scanners:
+            for name, line in sorted(scanner.loop_calls):
+                if name in functions and name not in loop_called:
+                    new.setdefault(name, f"{name}() called in a loop at line {line}")
+        if not new:
+            break
+        loop_called.update(new)
+    findings = {(line, severity, message) for scanner in scanners for line, severity, message in scanner.findings}
+    return sorted(findings, key=lambda f: (f[0], SEVERITY_ORDER[f[1]]))
+
+def declares_no_bpy(source):
+    # The comment counts in the leading comment block only, the flag anywhere at module level
+    for line in source.splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            break
+        if NO_BPY_COMMENT.match(stripped):
+            return True
+    return NO_BPY_FLAG.search(source) is not None
+
+def lint_source(source, path="<script>"):
+    try:
+        tree = ast.parse(source, path)
+    except SyntaxError as e:
+        return [(e.lineno or 1, 'HIGH', f"Syntax error: {e.msg}")]
+    except ValueError as e:  # Null bytes in the source
+        return [(1, 'HIGH', f"Unreadable source: {e}")]
+    return lint_tree(tree)
+
+classes = ()
@@ -0,0 +1,121 @@
+import sys
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# 'DEBUG' is per-item output (every object, material, list entry), 'INFO' one line per
+# script or folder, 'WARNING' is quiet mode
+LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40}
+# Records kept while a run is buffering; the oldest are dropped past this
+BUFFER_SIZE = 10000
+
+_level = LEVELS['INFO']
+_log_file = ""
+_buffer = deque(maxlen=BUFFER_SIZE)
+_dropped = 0
+_run_depth = 0
+_lock = threading.Lock()
+
+
+class Logger:
+    # Same call signatures as logging.Logger so scripts can fall back to it outside the add-on
+    def __init__(self, source):
+        self.source = source
+
+    def debug(self, message, *args):
+        log('DEBUG', self.source, message, *args)
+
+    def info(self, message, *args):
+        log('INFO', self.source, message, *args)
+
+    def warning(self, message, *args):
+        log('WARNING', self.source, message, *args)
+
+    def error(self, message, *args):
+        log('ERROR', self.source, message, *args)
+
+def get_logger(source):
+    return Logger(source)
+
+def configure(level, log_file=""):
+    # Returns the settings it replaced, for restore()
+    global _level, _log_file
+    with _lock:
+        previous = (_level, _log_file)
+        _level = LEVELS[level]
+        _log_file = log_file
+    return previous
+
+def restore(previous):
+    global _level, _log_file
+    with _lock:
+        _level, _log_file = previous
+
+def log(level, source, message, *args):
+    # Filtered records cost one comparison; outside a run they are written out right away
+    global _dropped
+    if LEVELS[level] < _level:
+        return
+    record = {
+        "time": time.time(),
+        "level": level,
+        "source": source,
+        "thread": threading.current_thread().name,
+        "message": str(message) % args if args else str(message),
+    }
+    with _lock:
+        if len(_buffer) == _buffer.maxlen:
+            _dropped += 1
+        _buffer.append(record)
+        buffering = _run_depth > 0
+    if not buffering:
+        flush()
+
+def format_record(record):
+    if record["level"] in ('DEBUG', 'INFO'):
+        return f"{record['source']}: {record['message']}"
+    return f"{record['level']} {record['source']}: {record['message']}"
+
+def flush():
+    # One console write for everything buffered, plus one append to the JSON-lines file
+    global _dropped
+    with _lock:
+        records = list(_buffer)
+        _buffer.clear()
+        dropped, _dropped = _dropped, 0
+        log_file = _log_file
+    if not records:
+        return
+    lines = [format_record(record) for record in records]
+    if dropped:
+        lines.insert(0, f"Beb.Tools: {dropped} earlier log lines dropped")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    if log_file:
+        try:
+            with open(log_file, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(record) + "\n" for record in records))
+        except OSError as e:
+            sys.stdout.write(f"Beb.Tools: could not write log file {log_file}: {e}\n")
+
+@contextmanager
+def run_log(level, log_file=""):
+    # Buffers everything logged during a script or queue run and flushes it once at the end,
+    # then puts back the level and log file that were set before the run
+    global _run_depth
+    previous = configure(level, log_file)
+    with _lock:
+        _run_depth += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _run_depth -= 1
+            outermost = _run_depth == 0
+        if outermost:
+            flush()
+        restore(previous)
+
+classes = ()
@@ -0,0 +1,46 @@
+import bpy
+from .bebtools_utils import process_rss, format_bytes
+
+# bpy.data collections counted between queue steps, the ones scripts create and leave orphaned
+TRACKED_DATA = ("objects", "meshes", "materials", "images", "textures", "node_groups", "collections",
+                "curves", "cameras", "lights", "actions", "worlds")
+
+
+def snapshot():
+    # {collection name: len()} plus the process RSS under "rss"
+    counts = {name: len(getattr(bpy.data, name)) for name in TRACKED_DATA if hasattr(bpy.data, name)}
+    counts["rss"] = process_rss()
+    return counts
+
+def diff(before, after):
+    # Keys that changed between two snapshots, with their signed difference
+    return {key: after[key] - before.get(key, 0) for key in after if after[key] != before.get(key, 0)}
+
+def format_delta(delta):
+    # "meshes +3, materials +1, RSS +12.4 MB", or "no change"
+    parts = [f"{key} {value:+d}" for key, value in delta.items() if key != "rss"]
+    if "rss" in delta:
+        parts.append(f"RSS {format_bytes(delta['rss'])}")
+    return ", ".join(parts) if parts else "no change"
+
+def orphans():
+    # Data blocks nothing uses anymore and that aren't kept by a fake user
+    found = []
+    for name in TRACKED_DATA:
+        if name != "objects" and hasattr(bpy.data, name):
+            found.extend(block for block in getattr(bpy.data, name) if block.users == 0 and not block.use_fake_user)
+    return found
+
+def purge_orphans():
+    # Removes orphaned data recursively (a freed mesh can orphan its materials), returns how many
+    if hasattr(bpy.data, "orphans_purge"):
+        return bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True) or 0
+    removed = 0
+    found = orphans()
+    while found:
+        bpy.data.batch_remove(found)
+        removed += len(found)
+        found = orphans()
+    return removed
+
+classes = ()
@@ -0,0 +1,242 @@
+# Mirrors a remote scripts source (e.g. a network share) into the local scripts and queues folders.
+#
+# The remote folder holds scripts/ and queues/ laid out like the add-on's. A background thread
+# copies what changed, judged by the remote file's mtime and size, so Blender itself only ever
+# reads the local folders and never waits on the share. Files edited locally since their last
+# sync are left alone and reported as conflicts; local files the mirror never synced are copied
+# into the version history before being replaced. The source and what was synced are kept in
+# mirror.json in the Beb.Tools config folder.
+import bpy
+import os
+import json
+import time
+import shutil
+import filecmp
+import threading
+from .bebtools_utils import SCRIPTS_DIR, QUEUES_DIR, CONFIG_DIR
+from .bebtools_files import save_version, atomic_write
+from .bebtools_bundle import touch, drop_generation
+from .bebtools_log import get_logger
+
+STATE_PATH = os.path.join(CONFIG_DIR, "mirror.json")
+# Remote subfolder -> local folder
+MIRRORED = {"scripts": SCRIPTS_DIR, "queues": QUEUES_DIR}
+SYNC_INTERVAL = 60
+# The mirror counts as stale when no sync succeeded for this long
+STALE_AFTER = 3 * SYNC_INTERVAL
+# Versions kept of a local file the first sync replaces
+BACKUP_VERSIONS = 5
+
+_lock = threading.Lock()
+# Each sync thread gets its own wake and stop events, so a stopped thread can't outlive its stop
+_wake = None
+_stopped = None
+_thread = None
+_state = None
+# Set by the sync thread when files changed or a sync failed, handled by _poll on the main thread
+_report = None
+
+log = get_logger("Beb.Tools")
+
+
+def load_state():
+    global _state
+    if _state is None:
+        try:
+            with open(STATE_PATH, "r") as f:
+                _state = json.load(f)
+        except (OSError, ValueError):
+            _state = {}
+    return _state
+
+def save_state(state):
+    # Written from the sync thread too, atomically so Blender quitting mid-write can't truncate it
+    global _state
+    atomic_write(STATE_PATH, json.dumps(state, indent=2))
+    _state = state
+
+def get_remote():
+    return load_state().get("remote", "")
+
+def set_remote(remote):
+    # Switching sources starts over, files synced from the old one are kept as they are
+    remote = os.path.normpath(bpy.path.abspath(remote)) if remote else ""
+    if remote == get_remote():
+        return
+    state = {"remote": remote, "files": {}} if remote else {}
+    with _lock:
+        save_state(state)
+    stop()
+    if remote:
+        start()
+
+def _remote_files(remote):
+    # "subfolder/relative/path" -> (mtime_ns, size) of every mirrored remote file
+    files = {}
+    for sub in MIRRORED:
+        base = os.path.join(remote, sub)
+        # A folder that can't be seen is an unreachable share, not every file deleted
+        if not os.path.isdir(base):
+            raise FileNotFoundError(f"Remote folder {base} is not available")
+        for directory, dirs, names in os.walk(base, onerror=_raise):
+            dirs[:] = [d for d in dirs if not d.startswith(("__", "."))]
+            for name in names:
+                if name.startswith(("__", ".")):
+                    continue
+                stat = os.stat(os.path.join(directory, name))
+                rel = os.path.relpath(os.path.join(directory, name), base).replace(os.sep, "/")
+                files[f"{sub}/{rel}"] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+def _raise(error):
+    raise error
+
+def _local_path(key):
+    sub, rel = key.split("/", 1)
+    return os.path.join(MIRRORED[sub], *rel.split("/"))
+
+def _local_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def sync(remote, stopped=None):
+    """Brings the local folders up to date with remote, returns (copied, removed, conflicts, backed_up).
+
+    A synced file is recorded with the remote mtime and size it was copied from and the local
+    mtime it got, so later changes on either side can be told apart. Setting the stopped event
+    ends the sync after the file being copied.
+    """
+    if not os.path.isdir(remote):
+        raise FileNotFoundError(f"Remote scripts source {remote} is not available")
+    with _lock:
+        synced = dict(load_state().get("files", {}))
+    copied, removed, conflicts, backed_up = [], [], [], []
+    remote_files = _remote_files(remote)
+    for key, (mtime, size) in remote_files.items():
+        if stopped is not None and stopped.is_set():
+            break
+        record = synced.get(key)
+        if record and record[0] == mtime and record[1] == size:
+            continue
+        local = _local_path(key)
+        remote_path = os.path.join(remote, *key.split("/"))
+        local_mtime = _local_mtime(local)
+        if local_mtime is not None and record and local_mtime != record[2]:
+            conflicts.append(key)
+            continue
+        if local_mtime is not None and not record:
+            # Never synced: identical files are just recorded, others are kept in the history first
+            if filecmp.cmp(local, remote_path, shallow=False):
+                synced[key] = [mtime, size, local_mtime]
+                continue
+            save_version(local, BACKUP_VERSIONS)
+            backed_up.append(key)
+        os.makedirs(os.path.dirname(local), exist_ok=True)
+        # Copied beside the target and renamed over it, readers never see half a file
+        temp_path = local + ".bebtools_sync"
+        shutil.copy2(remote_path, temp_path)
+        os.replace(temp_path, local)
+        synced[key] = [mtime, size, _local_mtime(local)]
+        copied.append(key)
+    for key in [key for key in synced if key not in remote_files]:
+        if stopped is not None and stopped.is_set():
+            break
+        local = _local_path(key)
+        local_mtime = _local_mtime(local)
+        if local_mtime is not None and local_mtime != synced[key][2]:
+            conflicts.append(key)
+        elif local_mtime is not None:
+            os.remove(local)
+            removed.append(key)
+        del synced[key]
+    if any(key.startswith("scripts/") for key in copied + removed):
+        drop_generation()
+    with _lock:
+        state = dict(load_state())
+        if state.get("remote") == remote:
+            state.update(files=synced, synced_at=time.time(), error="")
+            save_state(state)
+    return copied, removed, conflicts, backed_up
+
+def _run(wake, stopped):
+    global _report
+    while not stopped.is_set():
+        remote = get_remote()
+        try:
+            copied, removed, conflicts, backed_up = sync(remote, stopped)
+            if copied or removed or conflicts:
+                _report = (copied, removed, conflicts, backed_up, None)
+        except OSError as e:
+            with _lock:
+                state = dict(load_state())
+                if state.get("remote") == remote:
+                    state["error"] = str(e)
+                    save_state(state)
+            _report = ([], [], [], [], str(e))
+        wake.wait(SYNC_INTERVAL)
+        wake.clear()
+
+def _poll():
+    # Main thread: logs what the last sync did and refreshes the script list if files changed
+    global _report
+    report, _report = _report, None
+    if report:
+        copied, removed, conflicts, backed_up, error = report
+        if error:
+            log.warning("Scripts mirror is out of date: %s", error)
+        else:
+            log.info("Scripts mirror: %s updated, %s removed", len(copied), len(removed))
+        for key in conflicts:
+            log.warning("Scripts mirror kept the local edit of %s, it changed remotely too", key)
+        for key in backed_up:
+            log.warning("Scripts mirror replaced the local %s, the previous version is in the history folder", key)
+        for key in copied + removed:
+            if key.startswith("scripts/"):
+                touch(_local_path(key))
+        wm = bpy.context.window_manager
+        if (copied or removed) and wm.bebtools_scripts and not wm.bebtools_search_active:
+            bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT', directory=wm.bebtools_current_dir)
+    return 1.0 if _thread else None
+
+def start():
+    # Needs the main thread, for the timer
+    global _thread, _wake, _stopped
+    if _thread is None and get_remote():
+        _wake, _stopped = threading.Event(), threading.Event()
+        _thread = threading.Thread(target=_run, args=(_wake, _stopped), name="bebtools_mirror", daemon=True)
+        _thread.start()
+    if _thread and not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, first_interval=1.0, persistent=True)
+
+def stop():
+    # The thread finishes the file it is copying and exits, without waiting for it here
+    global _thread, _wake, _stopped
+    if _thread is not None:
+        _stopped.set()
+        _wake.set()
+    _thread = _wake = _stopped = None
+    if bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.unregister(_poll)
+
+def sync_now():
+    if _wake is not None:
+        _wake.set()
+
+def status():
+    # (stale, text) for the panel, None when no remote source is set
+    state = load_state()
+    if not state.get("remote"):
+        return None
+    synced_at = state.get("synced_at")
+    if state.get("error"):
+        return True, f"Mirror stale: {state['error']}"
+    if synced_at is None:
+        return True, "Mirror not synced yet"
+    age = time.time() - synced_at
+    if age > STALE_AFTER:
+        return True, f"Mirror stale, last synced {age / 60:.0f} min ago"
+    return False, f"Mirror synced {age:.0f}s ago"
+
+classes = ()
@@ -1,7 +1,14 @@
 import bpy
 import os
-from bpy.props import StringProperty, IntProperty, CollectionProperty, BoolProperty, EnumProperty
-from .bebtools_utils import update_info_text, get_scripts
+from bpy.props import StringProperty, IntProperty, CollectionProperty, BoolProperty, EnumProperty, FloatProperty
+from .bebtools_utils import QUEUES_DIR, update_info_text, get_scripts
+from .bebtools_log import configure as configure_log
+from .bebtools_rpc import update_rpc, DEFAULT_PORT
+from .bebtools_mirror import get_remote, set_remote
+
+def update_log_settings(self, context):
+    wm = context.window_manager
+    configure_log(wm.bebtools_log_level, bpy.path.abspath(wm.bebtools_log_file) if wm.bebtools_log_file else "")
 
 def update_active_index(self, context):
     wm = context.window_manager
@@ -17,6 +24,14 @@ class BebToolsScriptItem(bpy.types.PropertyGroup):
 class BebToolsQueueItem(bpy.types.PropertyGroup):
     name: StringProperty(name="Script Name")
     path: StringProperty(name="Full Path")
+    params: StringProperty(name="Parameters", description="Operator keyword arguments as a JSON object")
+    inputs: StringProperty(name="Inputs", description="Comma separated collections, scenes or files this step reads")
+    outputs: StringProperty(name="Outputs", description="Comma separated collections, scenes or files this step writes")
+    uses_bpy: BoolProperty(name="Uses bpy", default=True, description="Step touches Blender data and must run on the main thread")
+    checkpoint: BoolProperty(name="Checkpoint After", default=False, description="Snapshot the scene to a temporary .blend after this step so the queue can resume from here")
+    last_duration: FloatProperty(name="Last Duration", default=0.0, description="Seconds the step took on its last run")
+    purge_after: BoolProperty(name="Purge After", default=False, description="Remove orphaned data after this step when the purge mode is Marked Steps")
+    last_memory: StringProperty(name="Last Memory", default="", description="Data block and memory change of the step on its last tracked run")
 
 class BebToolsTextLine(bpy.types.PropertyGroup):
     name: StringProperty(name="Text Line")
@@ -28,9 +43,9 @@ classes = (
 )
 
 def get_queue_files(self, context):
-    queues_dir = os.path.join(os.path.dirname(__file__), "..", "queues")
-    os.makedirs(queues_dir, exist_ok=True)
-    return [(os.path.join(queues_dir, f), f[:-4], "") for f in os.listdir(queues_dir) if f.endswith(".txt")]
+    os.makedirs(QUEUES_DIR, exist_ok=True)
+    return [(os.path.join(QUEUES_DIR, f), os.path.splitext(f)[0], "JSON queue" if f.endswith(".json") else "Legacy queue")
+            for f in sorted(os.listdir(QUEUES_DIR)) if f.endswith((".txt", ".json"))]
 
 def register_properties():
     for cls in classes:
@@ -85,6 +100,79 @@ def register_properties():
         update=lambda self, context: bpy.ops.bebtools.search_scripts('INVOKE_DEFAULT'),  # Trigger search on any change
         search=lambda self, context, edit_text: None  # Enables the "X" inside the field (no autocomplete needed)
     )
+    bpy.types.WindowManager.bebtools_undo_mode = EnumProperty(
+        name="Undo",
+        description="How script and queue runs are recorded in the undo history",
+        items=[
+            ('SINGLE', "Single Undo Step", "Suspend undo pushes during the run and record it as one step"),
+            ('STEP', "Per Operator", "Let every operator inside the scripts push its own undo step"),
+            ('NONE', "No Undo", "Suspend undo during the run and record nothing, fastest on big scenes"),
+        ],
+        default='SINGLE'
+    )
+    bpy.types.WindowManager.bebtools_log_level = EnumProperty(
+        name="Log",
+        description="How much scripts and queue runs print to the console",
+        items=[
+            ('DEBUG', "Verbose", "Print a line for every object, material and list entry"),
+            ('INFO', "Normal", "Print a summary line per script"),
+            ('WARNING', "Quiet", "Print only warnings and errors"),
+        ],
+        default='INFO',
+        update=update_log_settings
+    )
+    bpy.types.WindowManager.bebtools_log_file = StringProperty(
+        name="Log File",
+        description="Also append log records to this JSON-lines file, leave empty to only use the console",
+        default="",
+        subtype='FILE_PATH',
+        update=update_log_settings
+    )
+    bpy.types.WindowManager.bebtools_history_size = IntProperty(
+        name="Versions Kept",
+        description="Previous versions kept in the history folder for every saved script and instructions file",
+        default=5,
+        min=0,
+        max=100
+    )
+    bpy.types.WindowManager.bebtools_track_memory = BoolProperty(
+        name="Track Memory",
+        description="Count data blocks and process memory before and after every queue step and report the change",
+        default=False
+    )
+    bpy.types.WindowManager.bebtools_purge_mode = EnumProperty(
+        name="Purge",
+        description="When queue runs remove orphaned meshes, materials, images and other unused data",
+        items=[
+            ('NEVER', "Never", "Keep orphaned data, it is dropped on save and reload"),
+            ('MARKED', "Marked Steps", "Purge after steps that have Purge After set"),
+            ('EVERY_STEP', "Every Step", "Purge after every step that uses Blender data"),
+            ('END', "End of Queue", "Purge once when the queue finishes"),
+        ],
+        default='NEVER'
+    )
+    bpy.types.WindowManager.bebtools_rpc_enabled = BoolProperty(
+        name="Remote Control",
+        description="Accept queue runs from local pipeline tools on 127.0.0.1, see bebtools_rpc.py for the protocol",
+        default=False,
+        update=update_rpc
+    )
+    bpy.types.WindowManager.bebtools_rpc_port = IntProperty(
+        name="Port",
+        description="Local TCP port the remote control listens on",
+        default=DEFAULT_PORT,
+        min=1024,
+        max=65535,
+        update=update_rpc
+    )
+    bpy.types.WindowManager.bebtools_remote_dir = StringProperty(
+        name="Remote Scripts",
+        description="Folder with scripts/ and queues/ mirrored into the add-on in the background, leave empty to use the local folders only",
+        subtype='DIR_PATH',
+        # Kept in mirror.json so the source outlives the session
+        get=lambda self: get_remote(),
+        set=lambda self, value: set_remote(value)
+    )
     bpy.types.WindowManager.bebtools_search_active = BoolProperty(
         name="Search Active",
         default=False,
@@ -105,6 +193,15 @@ def unregister_properties():
     del bpy.types.WindowManager.bebtools_folder_mode
     del bpy.types.WindowManager.bebtools_search_query
     del bpy.types.WindowManager.bebtools_search_active
+    del bpy.types.WindowManager.bebtools_undo_mode
+    del bpy.types.WindowManager.bebtools_log_level
+    del bpy.types.WindowManager.bebtools_log_file
+    del bpy.types.WindowManager.bebtools_history_size
+    del bpy.types.WindowManager.bebtools_track_memory
+    del bpy.types.WindowManager.bebtools_purge_mode
+    del bpy.types.WindowManager.bebtools_rpc_enabled
+    del bpy.types.WindowManager.bebtools_rpc_port
+    del bpy.types.WindowManager.bebtools_remote_dir
     
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
\ No newline at end of file
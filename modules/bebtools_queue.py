@@ -1,8 +1,119 @@
 import bpy
 import os
+import json
 from bpy.types import Operator
 from bpy.props import StringProperty, BoolProperty  # Added BoolProperty
-from .bebtools_utils import SCRIPTS_DIR
+from .bebtools_utils import SCRIPTS_DIR, QUEUES_DIR
+from .bebtools_runner import file_hash, run_script, get_step_params, undo_scope, log_scope
+from .bebtools_graph import parse_resources
+from .bebtools_catalog import list_dir
+from .bebtools_sandbox import is_sandboxed, run_detached, clear_output
+
+QUEUE_FORMAT_VERSION = 1
+
+
+class QueueIndex:
+    """Path-keyed mirror of wm.bebtools_queue for constant time membership checks."""
+
+    def __init__(self):
+        self.paths = set()
+        self.length = -1
+
+    @staticmethod
+    def key(path):
+        return os.path.normcase(os.path.normpath(path))
+
+    def sync(self, queue):
+        # Rebuild whenever the RNA collection changed behind the index's back
+        if len(queue) != self.length:
+            self.paths = {self.key(item.path) for item in queue}
+            self.length = len(queue)
+
+    def invalidate(self):
+        self.length = -1
+
+    def contains(self, queue, path):
+        self.sync(queue)
+        return self.key(path) in self.paths
+
+    def add_many(self, queue, scripts):
+        # scripts: iterable of (name, path); returns how many were not queued yet
+        self.sync(queue)
+        added = 0
+        for name, path in scripts:
+            key = self.key(path)
+            if key in self.paths:
+                continue
+            item = queue.add()
+            item.name = name
+            item.path = path
+            self.paths.add(key)
+            added += 1
+        self.length = len(queue)
+        return added
+
+
+queue_index = QueueIndex()
+
+def collect_folder_scripts(folder_path, recursive):
+    # (name, path) of every script in a folder, sorted, subfolders after their parent
+    entries = sorted(list_dir(folder_path), key=lambda entry: entry["name"])
+    scripts = [(entry["name"], entry["path"]) for entry in entries if not entry["is_folder"]]
+    if recursive:
+        for entry in entries:
+            if entry["is_folder"]:
+                scripts.extend(collect_folder_scripts(entry["path"], recursive))
+    return scripts
+
+def write_queue_file(queue_path, queue_items):
+    # Steps are pinned by their path relative to /scripts/ plus a content hash
+    steps = []
+    for item in queue_items:
+        steps.append({
+            "name": item.name,
+            "path": os.path.relpath(item.path, SCRIPTS_DIR).replace(os.sep, "/"),
+            "hash": file_hash(item.path),
+            "params": get_step_params(item),
+            "inputs": sorted(parse_resources(item.inputs)),
+            "outputs": sorted(parse_resources(item.outputs)),
+            "uses_bpy": item.uses_bpy,
+            "checkpoint": item.checkpoint,
+            "purge_after": item.purge_after,
+            "duration": round(item.last_duration, 3),
+        })
+    with open(queue_path, "w") as f:
+        json.dump({"version": QUEUE_FORMAT_VERSION, "steps": steps}, f, indent=2)
+
+def read_queue_file(queue_path):
+    # Returns the step dicts with "path" resolved to a full path (None for a missing script)
+    # and "hash_ok" telling whether the script still matches the saved content hash
+    with open(queue_path, "r") as f:
+        data = json.load(f)
+    steps = []
+    for step in data.get("steps", []):
+        path = os.path.join(SCRIPTS_DIR, *step["path"].split("/"))
+        step = dict(step)
+        step.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+        if os.path.isfile(path):
+            expected = step.get("hash")
+            step["path"] = path
+            step["hash_ok"] = not expected or file_hash(path) == expected
+        else:
+            step["path"] = None
+            step["hash_ok"] = False
+        steps.append(step)
+    return steps
+
+def fill_queue_item(item, step):
+    item.name = step["name"]
+    item.path = step["path"]
+    item.params = json.dumps(step["params"]) if step.get("params") else ""
+    item.inputs = ", ".join(step.get("inputs", []))
+    item.outputs = ", ".join(step.get("outputs", []))
+    item.uses_bpy = step.get("uses_bpy", True)
+    item.checkpoint = step.get("checkpoint", False)
+    item.purge_after = step.get("purge_after", False)
+    item.last_duration = step.get("duration", 0.0)
 
 class BEBTOOLS_OT_Queue(Operator):
     bl_idname = "bebtools.queue"
@@ -17,10 +128,7 @@ class BEBTOOLS_OT_Queue(Operator):
                 self.report({'WARNING'}, "Select a script to queue")
                 return {'CANCELLED'}
             script_name = script_item.name
-            if not any(item.name == script_name for item in wm.bebtools_queue):
-                item = wm.bebtools_queue.add()
-                item.name = script_name
-                item.path = script_item.path
+            if queue_index.add_many(wm.bebtools_queue, [(script_name, script_item.path)]):
                 wm.bebtools_queue_index = len(wm.bebtools_queue) - 1
                 self.report({'INFO'}, f"Queued {script_name}")
                 for area in context.screen.areas:
@@ -40,6 +148,7 @@ class BEBTOOLS_OT_RemoveFromQueue(Operator):
         if wm.bebtools_queue_index >= 0 and wm.bebtools_queue:
             script_name = wm.bebtools_queue[wm.bebtools_queue_index].name
             wm.bebtools_queue.remove(wm.bebtools_queue_index)
+            queue_index.invalidate()
             wm.bebtools_queue_index = min(wm.bebtools_queue_index, len(wm.bebtools_queue) - 1)
             if not wm.bebtools_queue:
                 wm.bebtools_queue_index = -1
@@ -99,22 +208,19 @@ class BEBTOOLS_OT_SaveQueue(Operator):
         if not name:
             self.report({'WARNING'}, "Please enter a queue name")
             return {'CANCELLED'}
-        if name.endswith(".txt"):
-            name = name[:-4]
+        if name.endswith((".txt", ".json")):
+            name = os.path.splitext(name)[0]
         
-        queues_dir = os.path.join(os.path.dirname(__file__), "..", "queues")
-        os.makedirs(queues_dir, exist_ok=True)
+        os.makedirs(QUEUES_DIR, exist_ok=True)
         
-        queue_path = os.path.join(queues_dir, f"{name}.txt")
+        queue_path = os.path.join(QUEUES_DIR, f"{name}.json")
         if os.path.exists(queue_path):
-            self.report({'WARNING'}, f"Queue '{name}.txt' already exists")
+            self.report({'WARNING'}, f"Queue '{name}.json' already exists")
             return {'CANCELLED'}
 
         try:
-            with open(queue_path, "w") as f:
-                for item in wm.bebtools_queue:
-                    f.write(f"{item.name}\n")
-            self.report({'INFO'}, f"Saved queue to {name}.txt")
+            write_queue_file(queue_path, wm.bebtools_queue)
+            self.report({'INFO'}, f"Saved queue to {name}.json")
         except Exception as e:
             self.report({'ERROR'}, f"Error saving queue: {str(e)}")
             return {'CANCELLED'}
@@ -128,12 +234,11 @@ class BEBTOOLS_OT_LoadQueue(Operator):
     bl_options = {'REGISTER'}
 
     filepath: StringProperty(subtype="FILE_PATH")
-    filter_glob: StringProperty(default="*.txt", options={'HIDDEN'})
+    filter_glob: StringProperty(default="*.json;*.txt", options={'HIDDEN'})
 
     def invoke(self, context, event):
-        queues_dir = os.path.join(os.path.dirname(__file__), "..", "queues")
-        os.makedirs(queues_dir, exist_ok=True)
-        self.filepath = queues_dir
+        os.makedirs(QUEUES_DIR, exist_ok=True)
+        self.filepath = QUEUES_DIR
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
 
@@ -143,6 +248,56 @@ class BEBTOOLS_OT_LoadQueue(Operator):
             self.report({'WARNING'}, "Selected file does not exist")
             return {'CANCELLED'}
 
+        if self.filepath.endswith(".json"):
+            return self.load_json(context)
+        return self.load_legacy(context)
+
+    def finish_load(self, context, missing_scripts):
+        wm = context.window_manager
+        queue_index.invalidate()
+        if wm.bebtools_queue:
+            wm.bebtools_queue_index = 0
+            self.report({'INFO'}, f"Loaded queue from {os.path.basename(self.filepath)}")
+            if missing_scripts:
+                self.report({'WARNING'}, f"Could not find scripts: {', '.join(missing_scripts)}")
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+        else:
+            self.report({'WARNING'}, "No matching scripts found in /scripts/")
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+    def load_json(self, context):
+        wm = context.window_manager
+        try:
+            steps = read_queue_file(self.filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Error reading queue file: {str(e)}")
+            return {'CANCELLED'}
+
+        if not steps:
+            self.report({'WARNING'}, "Queue file is empty")
+            return {'CANCELLED'}
+
+        wm.bebtools_queue.clear()
+        missing_scripts = []
+        changed_scripts = []
+        for step in steps:
+            if step["path"] is None:
+                missing_scripts.append(step["name"])
+                continue
+            fill_queue_item(wm.bebtools_queue.add(), step)
+            if not step["hash_ok"]:
+                changed_scripts.append(step["name"])
+
+        if changed_scripts:
+            self.report({'WARNING'}, f"Scripts changed since the queue was saved: {', '.join(changed_scripts)}")
+        return self.finish_load(context, missing_scripts)
+
+    def load_legacy(self, context):
+        wm = context.window_manager
         script_names = []
         try:
             with open(self.filepath, "r") as f:
@@ -173,24 +328,13 @@ class BEBTOOLS_OT_LoadQueue(Operator):
             else:
                 missing_scripts.append(name)
 
-        if wm.bebtools_queue:
-            wm.bebtools_queue_index = 0
-            self.report({'INFO'}, f"Loaded queue from {os.path.basename(self.filepath)}")
-            if missing_scripts:
-                self.report({'WARNING'}, f"Could not find scripts: {', '.join(missing_scripts)}")
-            for area in context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    area.tag_redraw()
-        else:
-            self.report({'WARNING'}, "No matching scripts found in /scripts/")
-            return {'CANCELLED'}
-
-        return {'FINISHED'}
+        return self.finish_load(context, missing_scripts)
 
 class BEBTOOLS_OT_RunSelected(Operator):
     bl_idname = "bebtools.run_selected"
     bl_label = "Run Selected"
     bl_description = "Run the selected script from the queue"
+    # Blender pushes the run's undo step, undo_scope suspends or skips it per the Undo run mode
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
@@ -198,9 +342,13 @@ class BEBTOOLS_OT_RunSelected(Operator):
         if wm.bebtools_queue_index >= 0 and wm.bebtools_queue_index < len(wm.bebtools_queue):
             script_item = wm.bebtools_queue[wm.bebtools_queue_index]
             script_path = script_item.path
+            if is_sandboxed(script_path):
+                run_detached(script_path, get_step_params(script_item), script_item.name)
+                self.report({'INFO'}, f"Running {script_item.name} in the background")
+                return {'FINISHED'}
             try:
-                with open(script_path, "r") as f:
-                    exec(f.read(), globals())
+                with log_scope(wm), undo_scope(wm.bebtools_undo_mode, f"Beb.Tools: {script_item.name}", in_operator=True):
+                    run_script(script_path, get_step_params(script_item))
                 self.report({'INFO'}, f"Executed script: {script_item.name}")
             except Exception as e:
                 self.report({'ERROR'}, f"Error running {script_item.name}: {str(e)}")
@@ -221,7 +369,7 @@ class BEBTOOLS_OT_LoadSelectedQueue(Operator):
         wm = context.window_manager
         if wm.bebtools_selected_queue:
             bpy.ops.bebtools.load_queue(filepath=wm.bebtools_selected_queue)
-            self.report({'INFO'}, f"Loaded queue: {os.path.basename(wm.bebtools_selected_queue)[:-4]}")
+            self.report({'INFO'}, f"Loaded queue: {os.path.splitext(os.path.basename(wm.bebtools_selected_queue))[0]}")
         else:
             self.report({'WARNING'}, "No queue selected")
         return {'FINISHED'}
@@ -235,6 +383,7 @@ class BEBTOOLS_OT_ClearQueue(Operator):
         wm = context.window_manager
         if wm.bebtools_queue:
             wm.bebtools_queue.clear()
+            queue_index.invalidate()
             wm.bebtools_queue_index = -1
             self.report({'INFO'}, "Queue cleared")
             for area in context.screen.areas:
@@ -245,6 +394,18 @@ class BEBTOOLS_OT_ClearQueue(Operator):
             self.report({'INFO'}, "Queue is already empty")
         return {'FINISHED'}
 
+class BEBTOOLS_OT_ClearOutput(Operator):
+    bl_idname = "bebtools.clear_output"
+    bl_label = "Clear Output"
+    bl_description = "Clear the output of scripts that ran in the background"
+
+    def execute(self, context):
+        clear_output()
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        return {'FINISHED'}
+
 class BEBTOOLS_OT_DeleteQueue(Operator):
     bl_idname = "bebtools.delete_queue"
     bl_label = "Delete Queue"
@@ -263,9 +424,10 @@ class BEBTOOLS_OT_DeleteQueue(Operator):
             queue_path = wm.bebtools_selected_queue
             try:
                 os.remove(queue_path)
-                self.report({'INFO'}, f"Deleted queue: {os.path.basename(queue_path)[:-4]}")
+                self.report({'INFO'}, f"Deleted queue: {os.path.splitext(os.path.basename(queue_path))[0]}")
                 if wm.bebtools_queue and wm.bebtools_queue[0].path.startswith(os.path.dirname(queue_path)):
                     wm.bebtools_queue.clear()
+                    queue_index.invalidate()
                     wm.bebtools_queue_index = -1
                 for area in context.screen.areas:
                     if area.type == 'VIEW_3D':
@@ -276,6 +438,67 @@ class BEBTOOLS_OT_DeleteQueue(Operator):
                 return {'CANCELLED'}
         return {'FINISHED'}
 
+class BEBTOOLS_OT_EditStepParams(Operator):
+    bl_idname = "bebtools.edit_step_params"
+    bl_label = "Step Settings"
+    bl_description = "Set the selected step's operator parameters and the data it reads and writes"
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    params: StringProperty(name="Parameters", default="")
+    inputs: StringProperty(name="Inputs", default="")
+    outputs: StringProperty(name="Outputs", default="")
+    uses_bpy: BoolProperty(name="Uses bpy", default=True)
+    checkpoint: BoolProperty(name="Checkpoint After", default=False)
+    purge_after: BoolProperty(name="Purge After", default=False)
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        if wm.bebtools_queue_index >= 0 and wm.bebtools_queue_index < len(wm.bebtools_queue):
+            item = wm.bebtools_queue[wm.bebtools_queue_index]
+            self.params = item.params
+            self.inputs = item.inputs
+            self.outputs = item.outputs
+            self.uses_bpy = item.uses_bpy
+            self.checkpoint = item.checkpoint
+            self.purge_after = item.purge_after
+            return wm.invoke_props_dialog(self, width=400)
+        self.report({'WARNING'}, "No script selected in queue")
+        return {'CANCELLED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text='Parameters (JSON object, e.g. {"directory": "//exports/"})')
+        layout.prop(self, "params", text="")
+        layout.separator()
+        layout.label(text="Inputs / Outputs (e.g. collection:Props, file:/tmp/a.fbx)")
+        layout.prop(self, "inputs")
+        layout.prop(self, "outputs")
+        layout.prop(self, "uses_bpy")
+        layout.prop(self, "checkpoint")
+        layout.prop(self, "purge_after")
+
+    def execute(self, context):
+        wm = context.window_manager
+        if wm.bebtools_queue_index >= 0 and wm.bebtools_queue_index < len(wm.bebtools_queue):
+            text = self.params.strip()
+            try:
+                params = json.loads(text) if text else {}
+            except ValueError as e:
+                self.report({'ERROR'}, f"Invalid parameters: {str(e)}")
+                return {'CANCELLED'}
+            if not isinstance(params, dict):
+                self.report({'ERROR'}, "Parameters must be a JSON object")
+                return {'CANCELLED'}
+            item = wm.bebtools_queue[wm.bebtools_queue_index]
+            item.params = json.dumps(params) if params else ""
+            item.inputs = ", ".join(sorted(parse_resources(self.inputs)))
+            item.outputs = ", ".join(sorted(parse_resources(self.outputs)))
+            item.uses_bpy = self.uses_bpy
+            item.checkpoint = self.checkpoint
+            item.purge_after = self.purge_after
+            self.report({'INFO'}, f"Updated settings for {item.name}")
+        return {'FINISHED'}
+
 # New operator to queue all scripts in a folder
 class BEBTOOLS_OT_QueueFolder(Operator):
     bl_idname = "bebtools.queue_folder"
@@ -311,29 +534,9 @@ class BEBTOOLS_OT_QueueFolder(Operator):
             if not folder_item.is_folder or folder_item.name == "Back":
                 self.report({'WARNING'}, "Select a folder to queue")
                 return {'CANCELLED'}
-            folder_path = folder_item.path
-            # Use os.walk for recursive, os.listdir for non-recursive
-            if self.recursive:
-                for root, _, files in os.walk(folder_path):
-                    for file in sorted(files):  # Sort for consistent order
-                        if file.endswith(".py") and not file.startswith("__"):
-                            script_name = file[:-3]
-                            script_path = os.path.join(root, file)
-                            if not any(item.name == script_name for item in wm.bebtools_queue):
-                                item = wm.bebtools_queue.add()
-                                item.name = script_name
-                                item.path = script_path
-            else:
-                for file in sorted(os.listdir(folder_path)):
-                    full_path = os.path.join(folder_path, file)
-                    if os.path.isfile(full_path) and file.endswith(".py") and not file.startswith("__"):
-                        script_name = file[:-3]
-                        if not any(item.name == script_name for item in wm.bebtools_queue):
-                            item = wm.bebtools_queue.add()
-                            item.name = script_name
-                            item.path = full_path
+            added = queue_index.add_many(wm.bebtools_queue, collect_folder_scripts(folder_item.path, self.recursive))
             wm.bebtools_queue_index = len(wm.bebtools_queue) - 1
-            self.report({'INFO'}, f"Queued all scripts from '{folder_item.name}'{' and subfolders' if self.recursive else ''}")
+            self.report({'INFO'}, f"Queued {added} scripts from '{folder_item.name}'{' and subfolders' if self.recursive else ''}")
             for area in context.screen.areas:
                 if area.type == 'VIEW_3D':
                     area.tag_redraw()
@@ -345,10 +548,12 @@ classes = (
     BEBTOOLS_OT_MoveUp,
     BEBTOOLS_OT_MoveDown,
     BEBTOOLS_OT_ClearQueue,
+    BEBTOOLS_OT_ClearOutput,
     BEBTOOLS_OT_SaveQueue,
     BEBTOOLS_OT_LoadQueue,
     BEBTOOLS_OT_RunSelected,
     BEBTOOLS_OT_LoadSelectedQueue,
     BEBTOOLS_OT_DeleteQueue,
     BEBTOOLS_OT_QueueFolder,  # Register new operator
+    BEBTOOLS_OT_EditStepParams,
 )
\ No newline at end of file
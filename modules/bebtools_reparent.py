@@ -0,0 +1,93 @@
+import bpy
+import numpy as np
+from .bebtools_scene_index import scene_index
+
+# Basis matrices with a smaller determinant can't be inverted reliably
+SINGULAR_DET = 1e-12
+
+
+def read_matrices(collection, prop):
+    # All 4x4 matrices of `prop` in one call, row-major like mathutils (Blender stores columns)
+    flat = np.empty(len(collection) * 16, dtype=np.float32)
+    collection.foreach_get(prop, flat)
+    return flat.reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+
+def write_matrices(collection, prop, matrices):
+    flat = np.ascontiguousarray(matrices.transpose(0, 2, 1), dtype=np.float32).ravel()
+    collection.foreach_set(prop, flat)
+
+def object_rows(objects):
+    # Positions of objects in bpy.data.objects, the order foreach_get reads them in
+    positions = {obj: i for i, obj in enumerate(bpy.data.objects)}
+    return positions, np.fromiter((positions[obj] for obj in objects), dtype=np.int64, count=len(objects))
+
+def ancestors(obj):
+    result = set()
+    while obj is not None:
+        result.add(obj)
+        obj = obj.parent
+    return result
+
+def reparent(objects, parent, keep_transform=True):
+    """Parents objects with one matrix pass for all of them.
+
+    `parent` is one object (None to clear) for all of them, or a list with a parent per
+    object. keep_transform leaves every world matrix where it was by solving for the parent
+    inverse, so location, rotation and scale stay untouched. Objects whose basis can't be
+    inverted, or that lose their parent, get their world matrix written to the basis
+    instead. Without keep_transform the parent inverse is reset and local transforms
+    become relative to the parent. Returns the number of objects re-parented.
+    """
+    objects = list(objects)
+    parents = list(parent) if isinstance(parent, (list, tuple)) else [parent] * len(objects)
+    # A parent that is the object itself or one of its children would form a cycle
+    chains = {}
+    pairs = []
+    for obj, par in zip(objects, parents):
+        if par not in chains:
+            chains[par] = ancestors(par)
+        if obj not in chains[par]:
+            pairs.append((obj, par))
+    if not pairs:
+        return 0
+    objects = [obj for obj, _ in pairs]
+    parents = [par for _, par in pairs]
+
+    data = bpy.data.objects
+    positions, rows = object_rows(objects)
+    # Everything is read before the first parent change, setting a parent resets its inverse
+    inverse = read_matrices(data, "matrix_parent_inverse")
+    # Objects whose world matrix goes into their basis, written one by one: assigning a basis
+    # re-derives location, rotation and scale, so the untouched objects are left out of it
+    rewritten = []
+    if keep_transform:
+        world_all = read_matrices(data, "matrix_world")
+        world = world_all[rows]
+        local = read_matrices(data, "matrix_basis")[rows]
+        cleared = np.array([par is None for par in parents])
+        # One inverse per distinct parent, no parent counts as the identity
+        distinct = {par: k for k, par in enumerate(dict.fromkeys(parents))}
+        parent_world = np.stack([world_all[positions[par]] if par is not None else np.identity(4)
+                                 for par in distinct])
+        parent_inverse = np.linalg.pinv(parent_world)[[distinct[par] for par in parents]]
+        # world = parent_world @ parent_inverse @ basis, solved for parent_inverse
+        singular = np.abs(np.linalg.det(local)) < SINGULAR_DET
+        local[singular] = np.identity(4)
+        solved = parent_inverse @ world @ np.linalg.inv(local)
+        rewritten = np.flatnonzero(singular | cleared)
+        solved[rewritten] = parent_inverse[rewritten]
+        inverse[rows] = solved
+    else:
+        inverse[rows] = np.identity(4)
+
+    # Only objects that changed parent are re-filed in the index, each in O(1)
+    moved = [obj for obj, par in pairs if obj.parent != par]
+    for obj, par in pairs:
+        obj.parent = par
+    write_matrices(data, "matrix_parent_inverse", inverse)
+    for k in rewritten:
+        objects[k].matrix_basis = world[k].tolist()
+    scene_index.update_parents(moved)
+    return len(objects)
+
+classes = ()
@@ -0,0 +1,234 @@
+# Lets pipeline tools run saved queues in this Blender session without starting a new one.
+#
+# Opt-in from the queue panel. The server only listens on 127.0.0.1 and speaks JSON lines:
+#   -> {"token": "...", "id": 1, "queue": "Cleanup", "params": {"2": {...}, "Export All Collections": {...}}}
+#   -> {"token": "...", "id": 2, "ping": true}
+#   <- {"id": 1, "event": "step", "step": 1, "name": "...", "error": null, "duration": 0.12}
+#   <- {"id": 1, "event": "done", "ok": true, "elapsed": 0.5}
+# "queue" names a file saved with Save Queue, "params" overrides the saved parameters of
+# steps given by number (from 1) or name. Every request carries the token written to TOKEN_PATH
+# when the server starts, readable by the current user only; a request without it, or anything
+# that isn't a JSON object, closes the connection. Connection threads only parse and reply; the
+# steps run one job at a time on the main thread, drained from a bpy.app.timers callback, without
+# dialogs: scripts run as EXEC_DEFAULT with their saved or overridden parameters.
+import bpy
+import os
+import json
+import hmac
+import time
+import queue
+import socket
+import secrets
+import threading
+from contextlib import nullcontext
+from .bebtools_utils import QUEUES_DIR, CONFIG_DIR
+from .bebtools_runner import run_script, undo_scope, log_scope
+from .bebtools_sandbox import is_sandboxed, submit
+from .bebtools_queue import read_queue_file
+from .bebtools_scene_index import scene_index
+from .bebtools_log import get_logger
+
+DEFAULT_PORT = 47800
+# Holds the token of the running server, clients read it from here
+TOKEN_PATH = os.path.join(CONFIG_DIR, "rpc_token")
+# Seconds between drains while the server runs
+DRAIN_INTERVAL = 0.02
+
+_jobs = queue.Queue()
+_server = None
+_token = None
+
+log = get_logger("Beb.Tools")
+
+
+class _Connection:
+    """One client; replies go through a queue so the main thread never blocks on a socket."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.replies = queue.Queue()
+        threading.Thread(target=self.write, name="bebtools_rpc_write", daemon=True).start()
+        threading.Thread(target=self.read, name="bebtools_rpc_read", daemon=True).start()
+
+    def send(self, message):
+        self.replies.put(message)
+
+    def write(self):
+        while True:
+            message = self.replies.get()
+            if message is None:
+                break
+            try:
+                self.sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            except OSError:
+                break
+        self.sock.close()
+
+    def read(self):
+        with self.sock.makefile("r", encoding="utf-8") as lines:
+            try:
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                        if not isinstance(request, dict):
+                            raise ValueError("Request must be a JSON object")
+                    except ValueError as e:
+                        self.send({"event": "error", "message": str(e)})
+                        break
+                    token = request.pop("token", None)
+                    if not isinstance(token, str) or not _token or not hmac.compare_digest(token, _token):
+                        self.send({"event": "error", "message": "Invalid token"})
+                        break
+                    _jobs.put((self, request))
+            except OSError:
+                pass
+        # Jobs already queued still run, their replies are dropped once the writer stops
+        self.replies.put(None)
+
+
+class _Server:
+    def __init__(self, port):
+        self.sock = socket.create_server(("127.0.0.1", port))
+        # Wakes accept() up now and then so close() ends the thread on every platform
+        self.sock.settimeout(0.5)
+        self.port = self.sock.getsockname()[1]
+        self.closed = False
+        threading.Thread(target=self.accept, name="bebtools_rpc", daemon=True).start()
+
+    def accept(self):
+        while not self.closed:
+            try:
+                sock, _ = self.sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            sock.settimeout(None)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            _Connection(sock)
+
+    def close(self):
+        self.closed = True
+        self.sock.close()
+
+
+def queue_path(name):
+    # Saved queues only, a request can't point the server at arbitrary files
+    path = os.path.join(QUEUES_DIR, f"{os.path.basename(name)}.json")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Queue '{name}' not found")
+    return path
+
+def step_params(step, number, overrides):
+    params = dict(step.get("params") or {})
+    params.update(overrides.get(str(number), overrides.get(step["name"], {})))
+    return params
+
+def run_job(connection, request):
+    # Runs one request on the main thread, streaming a reply per step
+    job_id = request.get("id")
+    if request.get("ping"):
+        connection.send({"id": job_id, "event": "done", "ok": True, "elapsed": 0.0})
+        return
+    start = time.perf_counter()
+    try:
+        steps = read_queue_file(queue_path(str(request.get("queue", ""))))
+        overrides = request.get("params") or {}
+        if not isinstance(overrides, dict):
+            raise ValueError("params must map step numbers or names to parameters")
+    except (OSError, ValueError) as e:
+        connection.send({"id": job_id, "event": "done", "ok": False, "error": str(e), "elapsed": 0.0})
+        return
+    wm = bpy.context.window_manager
+    ok = True
+    # Timers run without a window, operators inside the scripts need one
+    window_scope = bpy.context.temp_override(window=wm.windows[0]) if wm.windows else nullcontext()
+    with window_scope, log_scope(wm), undo_scope(wm.bebtools_undo_mode, f"Beb.Tools: {request['queue']}"):
+        for number, step in enumerate(steps, 1):
+            step_start = time.perf_counter()
+            error = None
+            try:
+                if step["path"] is None:
+                    raise FileNotFoundError(f"Script {step['name']} not found")
+                params = step_params(step, number, overrides)
+                if is_sandboxed(step["path"]):
+                    error = submit(step["path"], params, step["name"]).result()
+                else:
+                    run_script(step["path"], params, invoke=False)
+                    scene_index.sync()
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            connection.send({"id": job_id, "event": "step", "step": number, "name": step["name"],
+                             "error": error, "duration": time.perf_counter() - step_start})
+            if error:
+                log.error("Error running %s: %s", step['name'], error)
+                ok = False
+                break
+    elapsed = time.perf_counter() - start
+    log.info("Remote run of queue %s finished in %.2fs", request['queue'], elapsed)
+    connection.send({"id": job_id, "event": "done", "ok": ok, "elapsed": elapsed})
+
+def _drain():
+    # Jobs waiting when the timer fires run back to back, later ones wait for the next tick
+    for _ in range(_jobs.qsize()):
+        try:
+            connection, request = _jobs.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            run_job(connection, request)
+        except Exception as e:
+            connection.send({"id": request.get("id"), "event": "done", "ok": False, "error": str(e)})
+    return DRAIN_INTERVAL if _server else None
+
+def is_running():
+    return _server is not None
+
+def _write_token():
+    # A new token per server start, in a file only the current user can read
+    global _token
+    _token = secrets.token_hex(32)
+    if os.path.exists(TOKEN_PATH):
+        os.remove(TOKEN_PATH)
+    fd = os.open(TOKEN_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(_token)
+
+def start(port=DEFAULT_PORT):
+    # Returns the port listened on, pass 0 to pick a free one
+    global _server
+    if _server is None:
+        _write_token()
+        _server = _Server(port)
+        log.info("Beb.Tools remote control listening on 127.0.0.1:%s, token in %s", _server.port, TOKEN_PATH)
+    if not bpy.app.timers.is_registered(_drain):
+        bpy.app.timers.register(_drain, first_interval=DRAIN_INTERVAL, persistent=True)
+    return _server.port
+
+def stop():
+    global _server, _token
+    if _server is not None:
+        _server.close()
+        _server = None
+        _token = None
+        try:
+            os.remove(TOKEN_PATH)
+        except OSError:
+            pass
+    if bpy.app.timers.is_registered(_drain):
+        bpy.app.timers.unregister(_drain)
+
+def update_rpc(self, context):
+    # Toggling or changing the port restarts the server
+    wm = context.window_manager
+    stop()
+    if wm.bebtools_rpc_enabled:
+        try:
+            start(wm.bebtools_rpc_port)
+        except OSError as e:
+            log.error("Could not start remote control on port %s: %s", wm.bebtools_rpc_port, e)
+            wm.bebtools_rpc_enabled = False
+
+classes = ()
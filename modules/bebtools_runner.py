@@ -0,0 +1,103 @@
+import bpy
+import os
+import json
+import hashlib
+from contextlib import contextmanager
+from .bebtools_log import run_log, get_logger
+from . import bebtools_bundle as bundle
+
+# Compiled scripts keyed by path, validated by mtime and size
+_code_cache = {}
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def parse_params(text):
+    return json.loads(text) if text.strip() else {}
+
+def get_step_params(item):
+    # Queue items keep their operator keyword arguments as a JSON object string
+    return parse_params(item.params)
+
+def get_code(path):
+    # Scripts of a mounted bundle come precompiled from memory, without touching the disk
+    code = bundle.get_code(path)
+    if code is not None:
+        return code
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _code_cache.get(path)
+    if cached and cached[0] == version:
+        return cached[1]
+    with open(path, "r") as f:
+        code = compile(f.read(), path, "exec")
+    _code_cache[path] = (version, code)
+    return code
+
+def store_code(path, source):
+    # Compiles a script Beb.Tools just saved; scripts with syntax errors are compiled again at run time
+    _code_cache.pop(path, None)
+    bundle.store(path, source)
+    try:
+        stat = os.stat(path)
+        code = compile(source, path, "exec")
+    except (OSError, SyntaxError, ValueError):
+        return
+    _code_cache[path] = ((stat.st_mtime_ns, stat.st_size), code)
+
+def run_script(path, params=None, invoke=True):
+    # Scripts see their queue step parameters as BEBTOOLS_PARAMS and can import
+    # Beb.Tools modules relatively (e.g. "from .bebtools_dirty import ...").
+    # BEBTOOLS_INVOKE False tells operator scripts to run EXEC_DEFAULT even without parameters.
+    # `log` is a buffered logger named after the script.
+    code = get_code(path)
+    namespace = {
+        "__name__": "__main__",
+        "__file__": path,
+        "__package__": __package__,
+        "__builtins__": __builtins__,
+        "BEBTOOLS_PARAMS": dict(params) if params else {},
+        "BEBTOOLS_INVOKE": invoke,
+        "log": get_logger(os.path.splitext(os.path.basename(path))[0]),
+    }
+    exec(code, namespace)
+
+def log_scope(wm):
+    # Buffers script output for the run at the panel's log level, flushed when the run ends
+    log_file = bpy.path.abspath(wm.bebtools_log_file) if wm.bebtools_log_file else ""
+    return run_log(wm.bebtools_log_level, log_file)
+
+def set_global_undo(value):
+    # Keeps the preferences' dirty flag, so suspending undo doesn't get them auto-saved on quit
+    prefs = bpy.context.preferences
+    is_dirty = prefs.is_dirty
+    prefs.edit.use_global_undo = value
+    prefs.is_dirty = is_dirty
+
+@contextmanager
+def undo_scope(mode, message, in_operator=False):
+    # 'STEP': inner operators may push their own undo steps, one more is pushed at the end
+    # 'SINGLE': global undo is suspended during the run and a single step is pushed at the end
+    # 'NONE': global undo is suspended and nothing is pushed, the run can't be undone
+    # in_operator: called from an operator with the UNDO flag, which pushes the final step itself
+    use_global_undo = bpy.context.preferences.edit.use_global_undo
+    suspend = mode != 'STEP' and use_global_undo
+    if suspend:
+        set_global_undo(False)
+    try:
+        yield
+    finally:
+        if suspend and mode == 'NONE' and in_operator:
+            # Back on after the operator finished, so its own push is skipped as well
+            bpy.app.timers.register(lambda: set_global_undo(True), first_interval=0.0)
+        elif suspend:
+            set_global_undo(True)
+        if not in_operator and mode != 'NONE' and use_global_undo:
+            bpy.ops.ed.undo_push(message=message)
+
+classes = ()
@@ -0,0 +1,242 @@
+import bpy
+import os
+import sys
+import json
+import time
+import itertools
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import Future
+from .bebtools_catalog import get_entry
+from .bebtools_lint import declares_no_bpy
+from .bebtools_log import get_logger
+from . import bebtools_bundle as bundle
+
+# Scripts that declare they don't use bpy run in these long-lived processes, off Blender's
+# main thread and outside its GIL. See bebtools_sandbox_worker.py for the protocol.
+WORKER_PATH = os.path.join(os.path.dirname(__file__), "bebtools_sandbox_worker.py")
+POOL_SIZE = max(1, min(4, (os.cpu_count() or 2) - 1))
+# Lines of script output kept for the queue panel
+OUTPUT_LINES = 200
+
+_lock = threading.Lock()
+_workers = []
+_pending = deque()
+_jobs = {}
+_job_ids = itertools.count(1)
+_output = deque(maxlen=OUTPUT_LINES)
+# Callbacks of finished background work, run on the main thread by _poll
+_done_callbacks = deque()
+_background_threads = 0
+
+log = get_logger("Beb.Tools")
+
+
+class _Worker:
+    def __init__(self):
+        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        self.process = subprocess.Popen([sys.executable, "-u", WORKER_PATH], stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, text=True, bufsize=1, creationflags=flags)
+        self.job = None
+        threading.Thread(target=self.read, name="bebtools_sandbox", daemon=True).start()
+
+    def send(self, job):
+        self.job = job
+        self.process.stdin.write(json.dumps({"id": job["id"], "path": job["path"], "params": job["params"],
+                                               "source": job["source"]}) + "\n")
+        self.process.stdin.flush()
+
+    def read(self):
+        for line in self.process.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if message.get("done"):
+                _finish(self, message.get("error"))
+            elif "stream" in message:
+                job = _jobs.get(message["id"])
+                _output.append((job["name"] if job else "?", message["stream"], message["text"]))
+        # The process ended, whatever it was running failed
+        with _lock:
+            if self in _workers:
+                _workers.remove(self)
+        if self.job:
+            _finish(self, "Sandbox worker exited")
+
+def _drop(worker):
+    # A worker whose pipe broke; its reader thread sees it exit with no job to fail
+    worker.job = None
+    if worker in _workers:
+        _workers.remove(worker)
+    try:
+        worker.process.kill()
+    except OSError:
+        pass
+
+def _dispatch(job, front=False):
+    # With _lock held: hands the job to an idle worker, starting one if the pool has room, or
+    # queues it. Returns an error message when no worker would take it.
+    for _ in range(POOL_SIZE + 1):
+        worker = next((w for w in _workers if w.job is None), None)
+        if worker is None and len(_workers) < POOL_SIZE:
+            try:
+                worker = _Worker()
+            except OSError as e:
+                return f"Could not start a sandbox worker: {e}"
+            _workers.append(worker)
+        if worker is None:
+            if front:
+                _pending.appendleft(job)
+            else:
+                _pending.append(job)
+            return None
+        try:
+            worker.send(job)
+            return None
+        except OSError:
+            _drop(worker)
+    return "Sandbox workers exited before taking the job"
+
+def _fail(job, error):
+    _jobs.pop(job["id"], None)
+    job["future"].set_result(error)
+
+def _finish(worker, error):
+    failed = []
+    with _lock:
+        job, worker.job = worker.job, None
+        if job is None:
+            return
+        _jobs.pop(job["id"], None)
+        if _pending:
+            next_job = _pending.popleft()
+            next_error = _dispatch(next_job, front=True)
+            if next_error:
+                # No worker can be started, the queued jobs would wait forever
+                failed = [(next_job, next_error)] + [(pending, next_error) for pending in _pending]
+                _pending.clear()
+    job["future"].set_result(error)
+    for failed_job, failed_error in failed:
+        _fail(failed_job, failed_error)
+
+def is_sandboxed(path):
+    # Declared with "# bebtools: no-bpy" in the header or BEBTOOLS_USES_BPY = False
+    entry = get_entry(path)
+    if entry and "no_bpy" in entry:
+        return entry["no_bpy"]
+    try:
+        with open(path, "r") as f:
+            return declares_no_bpy(f.read())
+    except (OSError, UnicodeDecodeError):
+        return False
+
+def submit(path, params=None, name=None):
+    # Returns a Future resolving to None on success or the error message
+    job = {
+        "id": next(_job_ids),
+        "path": path,
+        "params": dict(params) if params else {},
+        # Bundled scripts are sent along, the worker can't read the bundle
+        "source": bundle.read_text(path),
+        "name": name or os.path.splitext(os.path.basename(path))[0],
+        "future": Future(),
+    }
+    with _lock:
+        _jobs[job["id"]] = job
+        error = _dispatch(job)
+    if error:
+        _fail(job, error)
+    _ensure_polling()
+    return job["future"]
+
+def start_background(target, on_done):
+    # Runs target() on a thread; on_done(result, error) is called on the main thread afterwards
+    global _background_threads
+
+    def run():
+        global _background_threads
+        try:
+            result, error = target(), None
+        except Exception as e:
+            result, error = None, str(e)
+        _done_callbacks.append((on_done, result, error))
+        with _lock:
+            _background_threads -= 1
+
+    with _lock:
+        _background_threads += 1
+    threading.Thread(target=run, name="bebtools_background", daemon=True).start()
+    _ensure_polling()
+
+def run_detached(path, params=None, name=None):
+    # Starts a sandboxed script and returns at once, the outcome is logged when it ends
+    name = name or os.path.splitext(os.path.basename(path))[0]
+
+    def wait():
+        start = time.perf_counter()
+        error = submit(path, params, name).result()
+        if error:
+            raise RuntimeError(error)
+        return time.perf_counter() - start
+
+    def done(duration, error):
+        if error:
+            log.error("Error running %s: %s", name, error)
+        else:
+            log.info("Executed script: %s (%.2fs in the background)", name, duration)
+
+    start_background(wait, done)
+
+def is_busy():
+    return bool(_jobs) or _background_threads > 0
+
+def recent_output(count):
+    return list(_output)[-count:]
+
+def add_output(name, text, stream="stdout"):
+    # For other background work reporting into the same panel, safe from any thread
+    _output.append((name, stream, text))
+
+def clear_output():
+    _output.clear()
+
+def _tag_redraw():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def _poll():
+    # Streams output into the panel while work is running and reports finished work
+    while _done_callbacks:
+        on_done, result, error = _done_callbacks.popleft()
+        on_done(result, error)
+    _tag_redraw()
+    return 0.25 if is_busy() or _done_callbacks else None
+
+def _ensure_polling():
+    # Timers can only be registered from the main thread; queue steps submitted from worker
+    # threads are waited on by the queue run itself
+    if threading.current_thread() is threading.main_thread() and not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, first_interval=0.1)
+
+def shutdown():
+    with _lock:
+        workers = list(_workers)
+        _workers.clear()
+        pending = list(_pending)
+        _pending.clear()
+    for job in pending:
+        job["future"].set_result("Sandbox shut down")
+    for worker in workers:
+        try:
+            worker.process.stdin.close()
+            worker.process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            worker.process.kill()
+    if bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.unregister(_poll)
+
+classes = ()
@@ -0,0 +1,79 @@
+# Runs Beb.Tools scripts that declare they don't use bpy, outside Blender.
+#
+# Started by bebtools_sandbox with Blender's Python, it stays alive and reads one JSON job per
+# line from stdin: {"id", "path", "params", "source"}, source is set for scripts of a mounted
+# bundle and read from path otherwise. Everything a script prints comes back on stdout
+# as {"id", "stream", "text"} lines, followed by {"id", "done": true, "error"} when it ends.
+# Scripts get a `log` writing to stderr, like the add-on's buffered one does in Blender.
+# Standalone on purpose: importing the add-on package here would import bpy.
+import os
+import sys
+import json
+import logging
+import traceback
+
+_protocol = sys.stdout
+_job_id = None
+
+
+def send(message):
+    _protocol.write(json.dumps(message) + "\n")
+    _protocol.flush()
+
+class _Stream:
+    # Line-buffered stand-in for stdout/stderr that tags every line with the running job
+    def __init__(self, name):
+        self.name = name
+        self.pending = ""
+
+    def write(self, text):
+        self.pending += text
+        while "\n" in self.pending:
+            line, self.pending = self.pending.split("\n", 1)
+            send({"id": _job_id, "stream": self.name, "text": line})
+        return len(text)
+
+    def flush(self):
+        if self.pending:
+            send({"id": _job_id, "stream": self.name, "text": self.pending})
+            self.pending = ""
+
+def run_job(job):
+    source = job.get("source")
+    if source is None:
+        with open(job["path"], "r") as f:
+            source = f.read()
+    code = compile(source, job["path"], "exec")
+    namespace = {
+        "__name__": "__main__",
+        "__file__": job["path"],
+        "__builtins__": __builtins__,
+        "BEBTOOLS_PARAMS": job.get("params") or {},
+        "log": logging.getLogger(os.path.splitext(os.path.basename(job["path"]))[0]),
+    }
+    exec(code, namespace)
+
+def main():
+    global _job_id
+    stdout, stderr = _Stream("stdout"), _Stream("stderr")
+    sys.stdout, sys.stderr = stdout, stderr
+    # The worker is its own process, configuring the root logger touches nothing else
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=stderr)
+    for line in sys.stdin:
+        job = json.loads(line)
+        _job_id = job["id"]
+        error = None
+        try:
+            run_job(job)
+        except SystemExit as e:  # Ends the job, not the worker
+            if e.code not in (None, 0):
+                error = f"Exited with status {e.code}"
+        except Exception as e:
+            stderr.write(traceback.format_exc())
+            error = str(e) or type(e).__name__
+        stdout.flush()
+        stderr.flush()
+        send({"id": _job_id, "done": True, "error": error})
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import bpy
+from bpy.app.handlers import persistent
+
+
+def alive(objects):
+    # Removed objects raise ReferenceError on any access
+    result = []
+    for obj in objects:
+        try:
+            obj.name
+        except ReferenceError:
+            continue
+        result.append(obj)
+    return result
+
+
+class SceneIndex:
+    """Type, parent and collection maps of bpy.data.objects, shared by scripts and queue steps.
+
+    Built by one scan on first use, then kept current from depsgraph_update_post, which drops
+    it when an object or collection it doesn't know shows up. Objects added or removed without
+    a depsgraph update are caught by comparing counts, undo and file loads drop the index.
+    Children are kept as dicts used as ordered sets, so re-parenting is O(1) per object.
+    Queries without a scene cover bpy.data.objects, like the scans they replace; the objects
+    of a scene are gathered on its first query and dropped when a collection changes.
+    """
+
+    def __init__(self):
+        # False makes every query scan bpy.data again, as scripts did before the index
+        self.enabled = True
+        self.valid = False
+        self.object_count = -1
+        self.collection_count = -1
+        self.by_type = {}
+        self.parents = {}
+        self.children_of = {}
+        self.collections = {}
+        self.scene_objects = {}
+
+    def invalidate(self):
+        self.valid = False
+        self.by_type = {}
+        self.parents = {}
+        self.children_of = {}
+        self.collections = {}
+        self.scene_objects = {}
+
+    def in_scene(self, objects, scene):
+        # All objects when scene is None, otherwise the ones linked to it; removed ones are dropped
+        if scene is None:
+            return alive(objects)
+        members = self.scene_objects.get(scene)
+        if members is None:
+            members = self.scene_objects[scene] = set(scene.objects)
+        return [obj for obj in objects if obj in members]
+
+    def build(self):
+        objects = bpy.data.objects
+        by_type = {}
+        parents = {}
+        children_of = {}
+        for obj in objects:
+            by_type.setdefault(obj.type, []).append(obj)
+            parent = obj.parent
+            parents[obj] = parent
+            children_of.setdefault(parent, {})[obj] = None
+        collections = {coll: list(coll.objects) for coll in bpy.data.collections}
+        for scene in bpy.data.scenes:
+            collections[scene.collection] = list(scene.collection.objects)
+        self.by_type = by_type
+        self.parents = parents
+        self.children_of = children_of
+        self.collections = collections
+        self.scene_objects = {}
+        self.object_count = len(objects)
+        self.collection_count = len(bpy.data.collections)
+        self.valid = True
+
+    def ensure(self):
+        if (not self.enabled or not self.valid or len(bpy.data.objects) != self.object_count
+                or len(bpy.data.collections) != self.collection_count):
+            self.build()
+
+    def objects_of_type(self, obj_type, scene=None):
+        self.ensure()
+        return self.in_scene(self.by_type.get(obj_type, ()), scene)
+
+    def roots(self, obj_type=None, scene=None):
+        # Objects without a parent, optionally only of one type
+        self.ensure()
+        roots = self.in_scene(self.children_of.get(None, ()), scene)
+        return [obj for obj in roots if obj_type is None or obj.type == obj_type]
+
+    def children(self, obj):
+        self.ensure()
+        return alive(self.children_of.get(obj, ()))
+
+    def descendants(self, obj):
+        self.ensure()
+        result = []
+        stack = list(self.children_of.get(obj, ()))
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(self.children_of.get(child, ()))
+        return alive(result)
+
+    def collection_objects(self, coll):
+        self.ensure()
+        objects = self.collections.get(coll)
+        return alive(objects) if objects is not None else list(coll.objects)
+
+    def update_parents(self, objects):
+        # Re-files objects whose parent changed; scripts call this after re-parenting in bulk
+        if not self.valid:
+            return
+        for obj in objects:
+            old_parent = self.parents.get(obj)
+            new_parent = obj.parent
+            if obj in self.parents and old_parent == new_parent:
+                continue
+            if obj in self.parents:
+                siblings = self.children_of.get(old_parent)
+                if siblings is not None:
+                    siblings.pop(obj, None)
+            self.parents[obj] = new_parent
+            self.children_of.setdefault(new_parent, {})[obj] = None
+
+    def update_collections(self, collections):
+        if not self.valid:
+            return
+        for coll in collections:
+            self.collections[coll] = list(coll.objects)
+        if collections:
+            # Linking or unlinking objects anywhere may change what a scene holds
+            self.scene_objects = {}
+
+    def sync(self):
+        # Evaluates pending changes so the depsgraph handler refreshes the index, used
+        # between queue steps where no redraw happens; free when the index isn't built
+        if self.valid and self.enabled:
+            bpy.context.view_layer.update()
+
+
+scene_index = SceneIndex()
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    if not scene_index.valid:
+        return
+    if len(bpy.data.objects) != scene_index.object_count or len(bpy.data.collections) != scene_index.collection_count:
+        scene_index.invalidate()
+        return
+    objects = []
+    collections = []
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        # An ID the index doesn't know was added, possibly in place of a removed one
+        if isinstance(id_data, bpy.types.Object):
+            if id_data not in scene_index.parents:
+                scene_index.invalidate()
+                return
+            objects.append(id_data)
+        elif isinstance(id_data, bpy.types.Collection):
+            if id_data not in scene_index.collections:
+                scene_index.invalidate()
+                return
+            collections.append(id_data)
+        elif isinstance(id_data, bpy.types.Scene):
+            collections.append(id_data.collection)
+    scene_index.update_parents(objects)
+    scene_index.update_collections(collections)
+
+@persistent
+def on_invalidate(*args):
+    scene_index.invalidate()
+
+def register_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(on_invalidate)
+
+def unregister_handlers():
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if on_invalidate in handlers:
+            handlers.remove(on_invalidate)
+
+classes = ()
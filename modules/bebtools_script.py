@@ -3,6 +3,13 @@ import os
 from bpy.types import Operator
 from bpy.props import StringProperty, BoolProperty, EnumProperty
 from .bebtools_utils import SCRIPTS_DIR, update_info_text, open_or_reuse_text_editor, get_scripts
+from .bebtools_log import get_logger
+from .bebtools_files import save_script
+from .bebtools_texts import get_text, set_contents, mark_synced, is_text_for
+from . import bebtools_bundle as bundle
+from .bebtools_mirror import sync_now, get_remote
+
+log = get_logger("Beb.Tools")
 
 class BEBTOOLS_OT_MoveTo(Operator):
     bl_idname = "bebtools.move_to"
@@ -71,6 +78,8 @@ class BEBTOOLS_OT_MoveTo(Operator):
                 os.rename(src_py, dest_py)
                 if os.path.exists(src_txt):
                     os.rename(src_txt, dest_txt)
+                for path in (src_py, src_txt, dest_py, dest_txt):
+                    bundle.touch(path)
                 self.report({'INFO'}, f"Moved '{script_item.name}' to {dest_dir}")
                 bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT', directory=wm.bebtools_current_dir)
                 wm.bebtools_active_index = -1
@@ -94,12 +103,8 @@ class BEBTOOLS_OT_EditScript(Operator):
                 return {'CANCELLED'}
             script_path = script_item.path
             script_name = script_item.name
-            text_block = bpy.data.texts.get(script_name + ".py")
-            if not text_block and os.path.exists(script_path):
-                text_block = bpy.data.texts.new(script_name + ".py")
-                with open(script_path, "r") as f:
-                    text_block.from_string(f.read())
-            elif not text_block:
+            text_block = get_text(script_path)
+            if not text_block:
                 self.report({'WARNING'}, f"Script file {script_name}.py not found")
                 return {'CANCELLED'}
 
@@ -131,10 +136,10 @@ class BEBTOOLS_OT_SaveScript(Operator):
                 if area.type == 'TEXT_EDITOR' and area.spaces.active.text:
                     text_block = area.spaces.active.text
                     break
-            if text_block and text_block.name == f"{script_name}.py":
+            if text_block and (is_text_for(text_block, script_path) or text_block.name == f"{script_name}.py"):
                 try:
-                    with open(script_path, "w") as f:
-                        f.write(text_block.as_string())
+                    save_script(script_path, text_block.as_string(), wm.bebtools_history_size)
+                    mark_synced(text_block, script_path)
                     self.report({'INFO'}, f"Saved changes to {script_name}.py")
                 except Exception as e:
                     self.report({'ERROR'}, f"Error saving {script_name}.py: {str(e)}")
@@ -169,22 +174,15 @@ class BEBTOOLS_OT_PasteEdit(Operator):
             script_path = script_item.path
             script_name = script_item.name
             
-            text_block = bpy.data.texts.get(script_name + ".py")
-            if not text_block and os.path.exists(script_path):
-                text_block = bpy.data.texts.new(script_name + ".py")
-                with open(script_path, "r") as f:
-                    text_block.from_string(f.read())
-            elif not text_block:
+            text_block = get_text(script_path)
+            if not text_block:
                 self.report({'WARNING'}, f"Script file {script_name}.py not found")
                 return {'CANCELLED'}
             open_or_reuse_text_editor(context, text_block)
 
             clipboard = context.window_manager.clipboard
-            if clipboard:
-                text_block.clear()
-                text_block.from_string(clipboard)
-            else:
-                text_block.clear()
+            set_contents(text_block, clipboard)
+            if not clipboard:
                 self.report({'INFO'}, "Clipboard is empty; script cleared")
 
             for area in context.screen.areas:
@@ -194,8 +192,8 @@ class BEBTOOLS_OT_PasteEdit(Operator):
                     break
 
             try:
-                with open(script_path, "w") as f:
-                    f.write(text_block.as_string())
+                save_script(script_path, text_block.as_string(), wm.bebtools_history_size)
+                mark_synced(text_block, script_path)
                 self.report({'INFO'}, f"Pasted clipboard and saved to {script_name}.py")
             except Exception as e:
                 self.report({'ERROR'}, f"Error saving {script_name}.py: {str(e)}")
@@ -238,6 +236,8 @@ class BEBTOOLS_OT_NewScript(Operator):
             f.write("# New script created by Beb.Tools\n")
         with open(info_path, "w") as f:
             f.write(f"Instructions for {name}\n")
+        bundle.touch(script_path)
+        bundle.touch(info_path)
 
         get_scripts(base_dir)
         if base_dir != SCRIPTS_DIR:
@@ -247,8 +247,7 @@ class BEBTOOLS_OT_NewScript(Operator):
             back_item.is_folder = True
             wm.bebtools_scripts.move(len(wm.bebtools_scripts) - 1, 0)
         wm.bebtools_active_index = -1
-        text_block = bpy.data.texts.new(f"{name}.py")
-        text_block.from_string("# New script created by Beb.Tools\n")
+        text_block = get_text(script_path)
         open_or_reuse_text_editor(context, text_block)
         update_info_text(context)
         self.report({'INFO'}, f"Created and opened {name}.py")
@@ -284,6 +283,7 @@ class BEBTOOLS_OT_NewFolder(Operator):
 
         try:
             os.makedirs(folder_path, exist_ok=True)
+            bundle.touch(folder_path)
             get_scripts(base_dir)
             if base_dir != SCRIPTS_DIR:
                 back_item = wm.bebtools_scripts.add()
@@ -314,7 +314,7 @@ class BEBTOOLS_OT_OpenFolderContents(Operator):
                 return {'CANCELLED'}
             folder_path = folder_item.path
             parent_path = os.path.dirname(folder_path)
-            print(f"Opening folder: {folder_path}, Parent: {parent_path}")  # Debug log
+            log.debug("Opening folder: %s, Parent: %s", folder_path, parent_path)
             wm.bebtools_active_index = -1  # Reset before navigation
             get_scripts(folder_path)
             # Add Back if there’s a parent directory
@@ -363,6 +363,7 @@ class BEBTOOLS_OT_DeleteFolder(Operator):
             try:
                 import shutil
                 shutil.rmtree(folder_path)
+                bundle.touch(folder_path)
                 self.report({'INFO'}, f"Deleted folder '{folder_name}' and its contents")
                 get_scripts(parent_dir)  # Reload parent dir, not root
                 if parent_dir != SCRIPTS_DIR:  # Add Back if not at root
@@ -406,6 +407,8 @@ class BEBTOOLS_OT_DeleteScript(Operator):
                     os.remove(script_path)
                 if os.path.exists(info_path):
                     os.remove(info_path)
+                bundle.touch(script_path)
+                bundle.touch(info_path)
                 wm.bebtools_scripts.remove(wm.bebtools_active_index)
                 wm.bebtools_active_index = min(wm.bebtools_active_index, len(wm.bebtools_scripts) - 1)
                 if not wm.bebtools_queue:
@@ -468,6 +471,8 @@ class BEBTOOLS_OT_RenameScript(Operator):
                 self.report({'INFO'}, f"Renamed script to '{new_name}.py'")
                 if os.path.exists(old_txt):
                     os.rename(old_txt, new_txt)
+                for path in (old_py, old_txt, new_py, new_txt):
+                    bundle.touch(path)
                     self.report({'INFO'}, f"Renamed instructions to '{new_name}.txt'")
                 else:
                     self.report({'INFO'}, f"No instructions file found for '{script_item.name}'")
@@ -524,6 +529,8 @@ class BEBTOOLS_OT_RenameFolder(Operator):
 
             try:
                 os.rename(old_path, new_path)
+                bundle.touch(old_path)
+                bundle.touch(new_path)
                 self.report({'INFO'}, f"Renamed folder to '{new_name}'")
                 bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT')
                 wm.bebtools_active_index = -1
@@ -596,6 +603,8 @@ class BEBTOOLS_OT_MoveFolder(Operator):
 
             try:
                 os.rename(src_path, dest_path)
+                bundle.touch(src_path)
+                bundle.touch(dest_path)
                 self.report({'INFO'}, f"Moved folder to {dest_dir}")
                 bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT', directory=wm.bebtools_current_dir)
                 wm.bebtools_active_index = -1
@@ -605,6 +614,58 @@ class BEBTOOLS_OT_MoveFolder(Operator):
                 return {'CANCELLED'}
         return {'FINISHED'}
 
+class BEBTOOLS_OT_PublishBundle(Operator):
+    bl_idname = "bebtools.publish_bundle"
+    bl_label = "Publish Bundle"
+    bl_description = "Pack all scripts, instructions and their compiled code into one archive that loads with a single read"
+
+    def execute(self, context):
+        try:
+            count = bundle.publish(SCRIPTS_DIR)
+        except (OSError, UnicodeDecodeError) as e:
+            self.report({'ERROR'}, f"Error publishing bundle: {str(e)}")
+            return {'CANCELLED'}
+        # A mounted bundle is replaced by the new one
+        if bundle.is_mounted():
+            bundle.mount(SCRIPTS_DIR)
+            bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT', directory=context.window_manager.bebtools_current_dir)
+        self.report({'INFO'}, f"Published {count} scripts to {os.path.basename(bundle.BUNDLE_PATH)}")
+        return {'FINISHED'}
+
+class BEBTOOLS_OT_ToggleBundle(Operator):
+    bl_idname = "bebtools.toggle_bundle"
+    bl_label = "Use Bundle"
+    bl_description = "Serve scripts from the published bundle instead of reading the scripts folder"
+
+    def execute(self, context):
+        if bundle.is_mounted():
+            bundle.unmount(SCRIPTS_DIR)
+            self.report({'INFO'}, "Scripts served from the scripts folder")
+        elif bundle.mount(SCRIPTS_DIR):
+            self.report({'INFO'}, "Scripts served from the bundle")
+        elif os.path.exists(bundle.BUNDLE_PATH):
+            self.report({'WARNING'}, "Bundle is out of date or unreadable, publish it again (see console)")
+            return {'CANCELLED'}
+        else:
+            self.report({'WARNING'}, "No bundle published yet")
+            return {'CANCELLED'}
+        # Remembered for the next sessions
+        bundle.set_enabled(bundle.is_mounted())
+        bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT', directory=context.window_manager.bebtools_current_dir)
+        return {'FINISHED'}
+
+class BEBTOOLS_OT_SyncMirror(Operator):
+    bl_idname = "bebtools.sync_mirror"
+    bl_label = "Sync Now"
+    bl_description = "Sync the local scripts and queues with the remote scripts folder now, in the background"
+
+    def execute(self, context):
+        if not get_remote():
+            self.report({'WARNING'}, "No remote scripts folder set")
+            return {'CANCELLED'}
+        sync_now()
+        return {'FINISHED'}
+
 classes = (
     BEBTOOLS_OT_EditScript,
     BEBTOOLS_OT_SaveScript,
@@ -618,4 +679,7 @@ classes = (
     BEBTOOLS_OT_MoveFolder,
     BEBTOOLS_OT_DeleteFolder,
     BEBTOOLS_OT_OpenFolderContents,
+    BEBTOOLS_OT_PublishBundle,
+    BEBTOOLS_OT_ToggleBundle,
+    BEBTOOLS_OT_SyncMirror,
 )
\ No newline at end of file
@@ -0,0 +1,160 @@
+import bpy
+import os
+import hashlib
+from bpy.app.handlers import persistent
+
+# Custom properties marking the text blocks Beb.Tools opened: the file they mirror, the
+# file's mtime when they were last synced (a string, ID properties are 32-bit ints) and a
+# hash of the contents at that point, so local edits can be told apart from disk changes
+PATH_KEY = "bebtools_path"
+MTIME_KEY = "bebtools_mtime"
+HASH_KEY = "bebtools_hash"
+
+# Owned blocks taken out of bpy.data.texts while a .blend is being saved
+_stashed = []
+# Set during save_copy, whose snapshots leave the owned blocks where they are
+_copying = False
+
+
+def content_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+def owned_texts():
+    return [text for text in bpy.data.texts if PATH_KEY in text]
+
+def _key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+def is_text_for(text, path):
+    return PATH_KEY in text and _key(text[PATH_KEY]) == _key(path)
+
+def find_text(path):
+    for text in owned_texts():
+        if is_text_for(text, path):
+            return text
+    return None
+
+def is_modified(text):
+    # Edited in Blender since it was last loaded from or saved to disk
+    return text.get(HASH_KEY) != content_hash(text.as_string())
+
+def mark_synced(text, path):
+    text[PATH_KEY] = path
+    text[MTIME_KEY] = str(os.stat(path).st_mtime_ns)
+    text[HASH_KEY] = content_hash(text.as_string())
+
+def set_contents(text, body):
+    # Replaces only the lines that differ, so cursor, scroll and undo survive small changes
+    old = text.as_string().split("\n")
+    new = body.split("\n")
+    if old == new:
+        return False
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old[-1 - end] == new[-1 - end]:
+        end += 1
+    # Widen the region until it spans at least one line on both sides
+    while start + end == len(old) or start + end == len(new):
+        if end:
+            end -= 1
+        else:
+            start -= 1
+    last = len(old) - end - 1
+    text.region_from_string("\n".join(new[start:len(new) - end]), range=(start, 0, last, len(old[last])))
+    return True
+
+def shown_texts():
+    return {area.spaces.active.text for window in bpy.context.window_manager.windows
+            for area in window.screen.areas if area.type == 'TEXT_EDITOR' and area.spaces.active.text}
+
+def evict_unused(keep):
+    # Owned blocks no editor shows are dropped unless they hold unsaved edits
+    shown = shown_texts()
+    for text in owned_texts():
+        if text != keep and text not in shown and not is_modified(text):
+            bpy.data.texts.remove(text)
+
+def get_text(path, default=None):
+    # Text block mirroring a file, reloaded only when the file changed on disk since the last
+    # sync and the block has no unsaved edits. Missing files get `default`, or None.
+    text = find_text(path)
+    exists = os.path.exists(path)
+    if text is None:
+        if not exists and default is None:
+            return None
+        text = bpy.data.texts.new(os.path.basename(path))
+        text[PATH_KEY] = path
+        text[HASH_KEY] = content_hash("")
+    if not exists:
+        if not text.as_string() and default:
+            text.from_string(default)
+    elif text.get(MTIME_KEY) != str(os.stat(path).st_mtime_ns) and not is_modified(text):
+        with open(path, "r") as f:
+            set_contents(text, f.read())
+        mark_synced(text, path)
+    evict_unused(keep=text)
+    return text
+
+def save_copy(filepath):
+    # Uncompressed copy of the open file for checkpoints and export workers, its path and
+    # dirty state stay untouched
+    global _copying
+    _copying = True
+    try:
+        bpy.ops.wm.save_as_mainfile(filepath=filepath, copy=True, compress=False, check_existing=False)
+    finally:
+        _copying = False
+
+@persistent
+def on_save_pre(*args):
+    # Take owned blocks out of the file being saved, on_save_post (or a failed save) puts them back
+    if _stashed:
+        # Left over from a failed save on a Blender without save_post_fail
+        on_save_post()
+    if _copying:
+        return
+    for text in owned_texts():
+        spaces = [area.spaces.active for window in bpy.context.window_manager.windows
+                  for area in window.screen.areas if area.type == 'TEXT_EDITOR' and area.spaces.active.text == text]
+        _stashed.append({
+            "name": text.name,
+            "props": {key: text[key] for key in (PATH_KEY, MTIME_KEY, HASH_KEY) if key in text},
+            "body": text.as_string(),
+            "cursor": (text.current_line_index, text.current_character),
+            "spaces": spaces,
+        })
+        bpy.data.texts.remove(text)
+
+@persistent
+def on_save_post(*args):
+    for stashed in _stashed:
+        text = bpy.data.texts.new(stashed["name"])
+        text.from_string(stashed["body"])
+        for key, value in stashed["props"].items():
+            text[key] = value
+        text.cursor_set(*stashed["cursor"])
+        for space in stashed["spaces"]:
+            space.text = text
+    _stashed.clear()
+
+def _post_handlers():
+    # save_post_fail only exists from Blender 4.2 on
+    fail = getattr(bpy.app.handlers, "save_post_fail", None)
+    return [bpy.app.handlers.save_post] + ([fail] if fail is not None else [])
+
+def register_handlers():
+    bpy.app.handlers.save_pre.append(on_save_pre)
+    for handlers in _post_handlers():
+        handlers.append(on_save_post)
+
+def unregister_handlers():
+    if on_save_pre in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(on_save_pre)
+    for handlers in _post_handlers():
+        if on_save_post in handlers:
+            handlers.remove(on_save_post)
+
+classes = ()
@@ -1,8 +1,24 @@
 import bpy
 import os
 from bpy.types import Panel, UIList, Operator
+from bpy.app.handlers import persistent
 from bpy.props import StringProperty, CollectionProperty
-from .bebtools_utils import SCRIPTS_DIR, get_scripts, update_info_text
+from .bebtools_utils import SCRIPTS_DIR, get_scripts, update_info_text, prefetch_instructions
+from .bebtools_graph import parse_resources, build_graph, critical_path
+from .bebtools_checkpoint import get_state
+from .bebtools_catalog import iter_scripts, get_lint, refresh as refresh_catalog
+from .bebtools_bundle import is_mounted, touch
+from .bebtools_mirror import status as mirror_status
+from .bebtools_log import get_logger
+from .bebtools_sandbox import is_busy, recent_output
+
+log = get_logger("Beb.Tools")
+
+# Lint findings shown under a script's instructions
+MAX_LINT_LINES = 8
+LINT_ICONS = {'HIGH': "ERROR", 'MEDIUM': "INFO", 'LOW': "DOT"}
+# Lines of background script output shown in the queue panel
+OUTPUT_PANEL_LINES = 8
 
 class BEBTOOLS_UL_ScriptList(UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
@@ -103,7 +119,7 @@ class BEBTOOLS_OT_ImportScript(Operator):
                 txt_files[filename] = filepath
             else:
                 skipped += 1
-                print(f"Skipped non-.py/.txt file: {file.name}")
+                log.debug("Skipped non-.py/.txt file: %s", file.name)
         for py_name, py_path in py_files.items():
             dest_py = os.path.join(SCRIPTS_DIR, f"{py_name}.py")
             if os.path.exists(dest_py):
@@ -120,13 +136,15 @@ class BEBTOOLS_OT_ImportScript(Operator):
                 else:
                     with open(os.path.join(SCRIPTS_DIR, f"{py_name}.txt"), "w") as f:
                         f.write(f"Instructions for {py_name}\n")
+                touch(dest_py)
+                touch(os.path.join(SCRIPTS_DIR, f"{py_name}.txt"))
             except Exception as e:
                 self.report({'ERROR'}, f"Error importing '{py_name}.py': {str(e)}")
                 return {'CANCELLED'}
         for txt_name in txt_files:
             if txt_name not in py_files:
                 skipped += 1
-                print(f"Skipped {txt_name}.txt—no matching .py file")
+                log.debug("Skipped %s.txt—no matching .py file", txt_name)
         bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT', directory=SCRIPTS_DIR)
         wm.bebtools_active_index = -1
         update_info_text(context)
@@ -215,6 +233,43 @@ class BEBTOOLS_OT_ToggleFolderMode(Operator):
                 area.tag_redraw()
         return {'FINISHED'}
 
+# (queue contents and durations, label) of the last critical path shown in the queue panel
+_critical_path_cache = (None, "")
+
+def critical_path_text(queue):
+    # The graph is only rebuilt when the queue or its last durations changed, not on every redraw
+    global _critical_path_cache
+    key = tuple((item.inputs, item.outputs, item.uses_bpy, item.last_duration) for item in queue)
+    if key != _critical_path_cache[0]:
+        durations = [duration for _, _, _, duration in key]
+        text = ""
+        if any(durations):
+            steps = [(parse_resources(inputs), parse_resources(outputs), uses_bpy) for inputs, outputs, uses_bpy, _ in key]
+            total, path = critical_path(build_graph(steps), durations)
+            text = f"Critical path: {total:.1f}s of {sum(durations):.1f}s (steps {', '.join(str(j + 1) for j in path)})"
+        _critical_path_cache = (key, text)
+    return _critical_path_cache[1]
+
+# Set once the panel asked for the initial script list, cleared when the list is shown or
+# a file is loaded, either may leave the list empty again
+_init_requested = False
+
+def init_scripts_timer():
+    bpy.ops.bebtools.init_scripts('INVOKE_DEFAULT')
+    return None
+
+@persistent
+def on_load_post(*args):
+    global _init_requested
+    _init_requested = False
+
+def register_handlers():
+    bpy.app.handlers.load_post.append(on_load_post)
+
+def unregister_handlers():
+    if on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(on_load_post)
+
 class BEBTOOLS_PT_Panel(Panel):
     bl_label = "Beb.Tools"
     bl_idname = "BEBTOOLS_PT_panel"
@@ -229,11 +284,16 @@ class BEBTOOLS_PT_Panel(Panel):
     def draw(self, context):
         layout = self.layout
         wm = context.window_manager
+        global _init_requested
 
         if not wm.bebtools_scripts:
             layout.operator("bebtools.init_scripts", text="Load Scripts")
-            wm.bebtools_current_dir = SCRIPTS_DIR
+            # The script list is filled the first time the panel is drawn, not at startup
+            if not _init_requested:
+                _init_requested = True
+                bpy.app.timers.register(init_scripts_timer, first_interval=0.0)
         else:
+            _init_requested = False
             # Parent row to hold all sections
             parent_row = layout.row(align=True)
             
@@ -267,6 +327,16 @@ class BEBTOOLS_PT_Panel(Panel):
                 "bebtools_active_index",
                 rows=10
             )
+            mirror = mirror_status()
+            if mirror and (mirror[0] or wm.bebtools_developer_mode):
+                row = layout.row(align=True)
+                row.label(text=mirror[1], icon="ERROR" if mirror[0] else "CHECKMARK")
+                row.operator("bebtools.sync_mirror", text="", icon="FILE_REFRESH")
+            if wm.bebtools_developer_mode:
+                layout.prop(wm, "bebtools_remote_dir")
+                row = layout.row(align=True)
+                row.operator("bebtools.toggle_bundle", icon="PACKAGE", depress=is_mounted())
+                row.operator("bebtools.publish_bundle", text="", icon="EXPORT")
 
 class BEBTOOLS_UL_QueueList(UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
@@ -274,6 +344,14 @@ class BEBTOOLS_UL_QueueList(UIList):
         row.alignment = 'LEFT'
         op = row.operator("bebtools.queue_context_menu", text=f"{index + 1}. {item.name}", emboss=False)
         op.index = index
+        if item.params:
+            row.label(text="", icon="PREFERENCES")
+        if not item.uses_bpy:
+            row.label(text="", icon="SYSTEM")
+        if item.checkpoint:
+            row.label(text="", icon="FILE_BLEND")
+        if item.purge_after:
+            row.label(text="", icon="ORPHAN_DATA")
 
 class BEBTOOLS_OT_QueueContextMenu(Operator):
     bl_idname = "bebtools.queue_context_menu"
@@ -293,6 +371,8 @@ class BEBTOOLS_OT_QueueContextMenu(Operator):
         layout = self.layout
         layout.operator("bebtools.run_selected", text="Run Selected", icon="PLAY")
         layout.operator("bebtools.multi_run", text="Run All", icon="FRAME_NEXT")
+        layout.operator("bebtools.edit_step_params", text="Step Settings", icon="PREFERENCES")
+        layout.operator("bebtools.resume_queue", text="Resume From Checkpoint", icon="RECOVER_LAST")
         layout.operator("bebtools.remove_from_queue", text="Remove", icon="REMOVE")
         layout.operator("bebtools.clear_queue", text="Clear", icon="TRASH")
 
@@ -329,11 +409,44 @@ class BEBTOOLS_PT_QueuePanel(Panel):
             "bebtools_queue_index",
             rows=5
         )
+        path_text = critical_path_text(wm.bebtools_queue)
+        if path_text:
+            layout.label(text=path_text, icon="TIME")
+        if wm.bebtools_track_memory:
+            for index, item in enumerate(wm.bebtools_queue):
+                if item.last_memory:
+                    layout.label(text=f"{index + 1}. {item.name}: {item.last_memory}", icon="MEMORY")
+        if any(item.checkpoint for item in wm.bebtools_queue):
+            failed_step = get_state(wm.bebtools_queue).get("failed_step")
+            if failed_step is not None:
+                row = layout.row(align=True)
+                row.label(text=f"Failed at step {failed_step + 1}, Run All resumes there", icon="ERROR")
+                row.operator("bebtools.resume_queue", text="", icon="RECOVER_LAST")
+                row.operator("bebtools.clear_checkpoints", text="", icon="X")
         row = layout.row(align=True)
         row.operator("bebtools.move_up", text="", icon="TRIA_UP_BAR")
         row.operator("bebtools.move_down", text="", icon="TRIA_DOWN_BAR")
         row.operator("bebtools.multi_run", text="Run All", icon="PLAY")
         row.operator("bebtools.clear_queue", text="", icon="X")
+        layout.prop(wm, "bebtools_undo_mode")
+        layout.prop(wm, "bebtools_log_level")
+        row = layout.row(align=True)
+        row.prop(wm, "bebtools_track_memory", text="", icon="MEMORY")
+        row.prop(wm, "bebtools_purge_mode")
+        output = recent_output(OUTPUT_PANEL_LINES)
+        if output or is_busy():
+            box = layout.box()
+            row = box.row(align=True)
+            row.label(text="Running in the background..." if is_busy() else "Background output", icon="CONSOLE")
+            row.operator("bebtools.clear_output", text="", icon="X")
+            for name, stream, text in output:
+                box.label(text=f"{name}: {text}", icon="ERROR" if stream == "stderr" else "NONE")
+        if wm.bebtools_developer_mode:
+            layout.prop(wm, "bebtools_log_file")
+            layout.prop(wm, "bebtools_history_size")
+            row = layout.row(align=True)
+            row.prop(wm, "bebtools_rpc_enabled", icon="URL")
+            row.prop(wm, "bebtools_rpc_port")
 
 class BEBTOOLS_OT_SearchScripts(Operator):
     bl_idname = "bebtools.search_scripts"
@@ -352,16 +465,24 @@ class BEBTOOLS_OT_SearchScripts(Operator):
                 self.report({'INFO'}, "Returned to folder browsing")
             return {'FINISHED'}
 
-        # Perform recursive search
+        # Perform recursive search, from the catalog once its background scan finished
         wm.bebtools_scripts.clear()
         matches = []
-        for root, _, files in os.walk(SCRIPTS_DIR):
-            for file in files:
-                if file.endswith(".py") and not file.startswith("__"):
-                    script_name = file[:-3]  # Just the name without .py
-                    if query in script_name.lower():
-                        full_path = os.path.join(root, file)
-                        matches.append((script_name, full_path, False))  # Use script_name only
+        catalog_scripts = iter_scripts()
+        if catalog_scripts is not None:
+            # Scripts added, renamed or removed outside Beb.Tools since the scan
+            refresh_catalog(SCRIPTS_DIR)
+            catalog_scripts = iter_scripts()
+            matches = [(entry["name"], entry["path"], False) for entry in catalog_scripts
+                       if query in entry["name"].lower()]
+        else:
+            for root, _, files in os.walk(SCRIPTS_DIR):
+                for file in files:
+                    if file.endswith(".py") and not file.startswith("__"):
+                        script_name = file[:-3]  # Just the name without .py
+                        if query in script_name.lower():
+                            full_path = os.path.join(root, file)
+                            matches.append((script_name, full_path, False))  # Use script_name only
 
         # Sort matches alphabetically
         matches.sort(key=lambda x: x[0])
@@ -373,6 +494,7 @@ class BEBTOOLS_OT_SearchScripts(Operator):
             item.path = path  # Full path still stored for operations
             item.is_folder = is_folder
 
+        prefetch_instructions([path for name, path, is_folder in matches])
         wm.bebtools_search_active = True
         wm.bebtools_active_index = -1
         update_info_text(context)
@@ -443,6 +565,19 @@ class BEBTOOLS_PT_InfoPanel(Panel):
             rows=10
         )
 
+        findings = ()
+        if 0 <= wm.bebtools_active_index < len(wm.bebtools_scripts):
+            script_item = wm.bebtools_scripts[wm.bebtools_active_index]
+            if not script_item.is_folder:
+                findings = get_lint(script_item.path)
+        if findings:
+            box = layout.box()
+            box.label(text=f"Performance hints ({len(findings)})", icon="INFO")
+            for line, severity, message in findings[:MAX_LINT_LINES]:
+                box.label(text=f"Line {line}: {message}", icon=LINT_ICONS[severity])
+            if len(findings) > MAX_LINT_LINES:
+                box.label(text=f"... {len(findings) - MAX_LINT_LINES} more")
+
 class BEBTOOLS_UL_InfoText(UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         layout.label(text=item.name)
@@ -1,28 +1,42 @@
 import bpy
 import os
+import sys
+import threading
+from collections import OrderedDict
+from .bebtools_catalog import list_dir, refresh_lint
+from .bebtools_log import get_logger
+from . import bebtools_bundle as bundle
 
 MODULES_DIR = os.path.join(os.path.dirname(__file__), "..", "modules")
 SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), "..", "scripts")
+QUEUES_DIR = os.path.join(os.path.dirname(__file__), "..", "queues")
+# Kept in Blender's user config, so reinstalling or updating the add-on doesn't lose it
+CONFIG_DIR = bpy.utils.user_resource('CONFIG', path="bebtools", create=True)
+HISTORY_DIR = os.path.join(CONFIG_DIR, "history")
+
+log = get_logger("Beb.Tools")
+
+# Instruction lines keyed by .txt path, validated by mtime, least recently used evicted first
+INSTRUCTION_CACHE_SIZE = 256
+_instruction_cache = OrderedDict()
+_instruction_lock = threading.Lock()
+# Bumped for every prefetch so an older prefetch thread stops early
+_prefetch_generation = 0
+# Lines currently shown in wm.bebtools_info_lines
+_shown_info_lines = None
 
 def get_scripts(directory=SCRIPTS_DIR, expand=False):
     wm = bpy.context.window_manager
     if not expand:
         wm.bebtools_scripts.clear()
     items = []
-    for filename in os.listdir(directory):
-        full_path = os.path.join(directory, filename)
-        if os.path.isdir(full_path):
-            item = wm.bebtools_scripts.add()
-            item.name = filename
-            item.path = full_path
-            item.is_folder = True
-            items.append(item)
-        elif filename.endswith(".py") and not filename.startswith("__"):
-            item = wm.bebtools_scripts.add()
-            item.name = filename[:-3]
-            item.path = full_path
-            item.is_folder = False
-            items.append(item)
+    # Served from the catalog, the folder is only re-listed when its mtime changed
+    for entry in list_dir(directory):
+        item = wm.bebtools_scripts.add()
+        item.name = entry["name"]
+        item.path = entry["path"]
+        item.is_folder = entry["is_folder"]
+        items.append(item)
     folders = sorted(
         [(item.name, item.path, item.is_folder) for item in wm.bebtools_scripts if item.is_folder and item.name != "Back"],
         key=lambda x: x[0]
@@ -48,33 +62,95 @@ def get_scripts(directory=SCRIPTS_DIR, expand=False):
         new_item.name = name
         new_item.path = path
         new_item.is_folder = is_folder
-    print(f"Loaded directory: {directory}, List: {[item.name for item in wm.bebtools_scripts]}")
+    log.debug("Loaded directory: %s (%s folders, %s scripts)", directory, len(folders), len(scripts))
+    prefetch_instructions([path for name, path, is_folder in scripts])
     return items
 
+def read_instructions(info_file):
+    # Returns the lines of an instructions file, or None if it doesn't exist
+    if bundle.covers(info_file):
+        text = bundle.read_text(info_file)
+        return tuple(text.split('\n')) if text is not None else None
+    try:
+        mtime = os.stat(info_file).st_mtime_ns
+    except OSError:
+        return None
+    with _instruction_lock:
+        cached = _instruction_cache.get(info_file)
+        if cached and cached[0] == mtime:
+            _instruction_cache.move_to_end(info_file)
+            return cached[1]
+    with open(info_file, "r") as f:
+        lines = tuple(f.read().split('\n'))
+    with _instruction_lock:
+        _instruction_cache[info_file] = (mtime, lines)
+        _instruction_cache.move_to_end(info_file)
+        while len(_instruction_cache) > INSTRUCTION_CACHE_SIZE:
+            _instruction_cache.popitem(last=False)
+    return lines
+
+def store_instructions(info_file, text):
+    # Puts freshly saved instructions in the cache so the next read doesn't go to disk
+    bundle.store(info_file, text)
+    try:
+        mtime = os.stat(info_file).st_mtime_ns
+    except OSError:
+        return
+    with _instruction_lock:
+        _instruction_cache[info_file] = (mtime, tuple(text.split('\n')))
+        _instruction_cache.move_to_end(info_file)
+        while len(_instruction_cache) > INSTRUCTION_CACHE_SIZE:
+            _instruction_cache.popitem(last=False)
+
+def prefetch_instructions(script_paths):
+    # Warm the instruction cache for the listed scripts without blocking the UI
+    global _prefetch_generation
+    _prefetch_generation += 1
+    generation = _prefetch_generation
+    info_files = [os.path.splitext(path)[0] + ".txt" for path in script_paths[:INSTRUCTION_CACHE_SIZE]]
+
+    def prefetch():
+        for info_file in info_files:
+            if generation != _prefetch_generation:
+                return
+            try:
+                read_instructions(info_file)
+            except OSError:
+                pass
+
+    threading.Thread(target=prefetch, name="bebtools_prefetch", daemon=True).start()
+
+def set_info_lines(wm, lines):
+    # Only rebuild the RNA collection when the content actually changed
+    global _shown_info_lines
+    lines = tuple(lines)
+    if lines == _shown_info_lines and len(wm.bebtools_info_lines) == len(lines):
+        return
+    wm.bebtools_info_lines.clear()
+    for line in lines:
+        item = wm.bebtools_info_lines.add()
+        item.name = line
+    _shown_info_lines = lines
+
 def update_info_text(context):
     wm = context.window_manager
     if wm.bebtools_active_index >= 0 and wm.bebtools_active_index < len(wm.bebtools_scripts):
         script_item = wm.bebtools_scripts[wm.bebtools_active_index]
-        wm.bebtools_info_lines.clear()
         if script_item.name == "Back":
-            item = wm.bebtools_info_lines.add()
-            item.name = "Navigate back to parent directory"
+            set_info_lines(wm, ["Navigate back to parent directory"])
         elif script_item.is_folder:
-            item = wm.bebtools_info_lines.add()
-            item.name = f"Folder: {script_item.name}"
+            set_info_lines(wm, [f"Folder: {script_item.name}"])
         else:
             script_path = script_item.path
+            refresh_lint(script_path)
             info_file = os.path.splitext(script_path)[0] + ".txt"
-            if os.path.exists(info_file):
-                with open(info_file, "r") as f:
-                    for line in f.read().split('\n'):
-                        item = wm.bebtools_info_lines.add()
-                        item.name = line
+            lines = read_instructions(info_file)
+            if lines is not None:
+                set_info_lines(wm, lines)
             else:
-                item = wm.bebtools_info_lines.add()
-                item.name = f"No instructions found for '{script_item.name}'."
+                set_info_lines(wm, [f"No instructions found for '{script_item.name}'."])
     else:
-        wm.bebtools_info_lines.clear()
+        set_info_lines(wm, [])
 
 def open_or_reuse_text_editor(context, text_block):
     for area in context.screen.areas:
@@ -93,4 +169,49 @@ def open_or_reuse_text_editor(context, text_block):
                 text_block.cursor_set(line=0, character=0)
             break
 
+def process_rss():
+    # Resident memory of the Blender process in bytes, 0 if the platform doesn't expose it
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return 0
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+        # Peak rather than current usage; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return 0
+
+def format_bytes(size):
+    sign = "-" if size < 0 else "+"
+    size = abs(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+
 classes = ()
\ No newline at end of file
@@ -1,78 +1,75 @@
 import bpy
 import mathutils
 
-def create_bbox_for_object(obj):
-    if obj.type != 'MESH' or not obj.data:
-        return None
-    
-    # Store the original collections the object is in
-    original_collections = list(obj.users_collection)
-    
-    # Enable Texture Space (temporarily)
-    obj.show_texture_space = True
-
-    # Get Texture Space bounding box from mesh data
-    tex_space_loc = mathutils.Vector(obj.data.texspace_location)  # Center
-    tex_space_size = mathutils.Vector(obj.data.texspace_size)  # Half extents
-
-    # Correct the size by doubling the extents
-    bbox_size = tex_space_size * 2  # Full size of the bounding box
-
-    # Create Empty Cube at the correct position
-    bpy.ops.object.empty_add(type='CUBE', align='WORLD', location=tex_space_loc)
-    empty_cube = bpy.context.object
-
-    # Scale empty to match the bounding box
-    empty_cube.scale = bbox_size / 2  # Empty scale is half the full size
-
-    # Name it based on the object
-    empty_cube.name = f"{obj.name}_BBox"
-
-    # Store the mesh's original world matrix
-    original_matrix = obj.matrix_world.copy()
-
-    # Deselect all and select the objects for parenting
-    bpy.ops.object.select_all(action='DESELECT')
-    obj.select_set(True)
-    empty_cube.select_set(True)
-    bpy.context.view_layer.objects.active = empty_cube  # Set empty as active
-
-    # Use Blender's built-in parent operator to mimic manual parenting
-    bpy.ops.object.parent_set(type='OBJECT', keep_transform=True)
-
-    # Restore the mesh's world matrix to ensure no transform change
-    obj.matrix_world = original_matrix
-
-    # Disable Texture Space display after processing
-    obj.show_texture_space = False
-
-    # Restore the mesh to its original collections
-    current_collections = list(obj.users_collection)
-    for coll in current_collections:
-        if coll not in original_collections:
-            coll.objects.unlink(obj)  # Remove from any new collections
-    for coll in original_collections:
-        if obj.name not in coll.objects:  # Use object name for check
-            coll.objects.link(obj)  # Re-link to original collections
-
-    # Link the empty cube to the same collections as the mesh
-    empty_current_collections = list(empty_cube.users_collection)
-    for coll in empty_current_collections:
-        coll.objects.unlink(empty_cube)  # Remove from default (e.g., scene collection)
-    for coll in original_collections:
-        if empty_cube.name not in coll.objects:  # Use object name for check
-            coll.objects.link(empty_cube)  # Add to mesh's original collections
-
-    return empty_cube
-
-# First, apply transforms to ALL objects in the scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-bpy.ops.object.select_all(action='DESELECT')
-
-# Then create bounding boxes for mesh objects
-for obj in bpy.data.objects:
-    if obj.type == 'MESH':
-        empty_cube = create_bbox_for_object(obj)
-
-print("Transforms applied to all objects, bounding box empties created for meshes, meshes parented with correct size and returned to original collections, and texture space turned off!")
\ No newline at end of file
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Batch bounds, scene index and re-parenting inside the add-on; plain loops from the Text Editor
+try:
+    from .bebtools_bounds import world_aabbs, oriented_boxes
+    from .bebtools_reparent import reparent
+    from .bebtools_scene_index import scene_index
+except ImportError:
+    world_aabbs = oriented_boxes = reparent = scene_index = None
+
+# Flat meshes still get a box with some thickness, a zero scale can't be parented to
+MIN_HALF_SIZE = 1e-4
+
+def box_matrix(center, rotation, half_size):
+    """World matrix of an empty cube (it spans -1..1) covering a box."""
+    scale = [max(value, MIN_HALF_SIZE) for value in half_size]
+    return mathutils.Matrix.LocRotScale(mathutils.Vector(center), rotation, scale)
+
+def box_matrices(meshes, mode):
+    if mode == 'OBB' and oriented_boxes:
+        centers, rotations, half_sizes = oriented_boxes(meshes)
+        return [box_matrix(center, mathutils.Matrix(rotation.tolist()), half_size)
+                for center, rotation, half_size in zip(centers, rotations, half_sizes)]
+    if world_aabbs:
+        mins, maxs = world_aabbs(meshes)
+        return [box_matrix((low + high) / 2, None, (high - low) / 2) for low, high in zip(mins, maxs)]
+    if mode == 'OBB':
+        log.warning("Oriented boxes need the Beb.Tools add-on, using axis-aligned boxes")
+    matrices = []
+    for obj in meshes:
+        corners = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
+        low = mathutils.Vector([min(c[i] for c in corners) for i in range(3)])
+        high = mathutils.Vector([max(c[i] for c in corners) for i in range(3)])
+        matrices.append(box_matrix((low + high) / 2, None, (high - low) / 2))
+    return matrices
+
+def create_bounding_boxes(mode='AABB'):
+    if scene_index:
+        meshes = [obj for obj in scene_index.objects_of_type('MESH') if obj.data]
+    else:
+        meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH' and obj.data]
+    if not meshes:
+        log.warning("No mesh objects found!")
+        return
+
+    boxes = []
+    for obj, matrix in zip(meshes, box_matrices(meshes, mode)):
+        empty_cube = bpy.data.objects.new(f"{obj.name}_BBox", None)
+        empty_cube.empty_display_type = 'CUBE'
+        empty_cube.matrix_world = matrix
+        # The box goes into the same collections as its mesh
+        for coll in obj.users_collection:
+            coll.objects.link(empty_cube)
+        boxes.append(empty_cube)
+        log.debug("Created %s", empty_cube.name)
+
+    # Parent each mesh to its box, keeping the mesh where it is
+    if reparent:
+        reparent(meshes, boxes)
+    else:
+        for obj, empty_cube in zip(meshes, boxes):
+            world = obj.matrix_world.copy()
+            obj.parent = empty_cube
+            obj.matrix_world = world
+    log.info("Created %s bounding box empties (%s), meshes parented in place", len(boxes), mode)
+
+# Queued steps can ask for oriented boxes with {"mode": "OBB"}
+params = globals().get("BEBTOOLS_PARAMS") or {}
+create_bounding_boxes(params.get("mode", 'AABB').upper())
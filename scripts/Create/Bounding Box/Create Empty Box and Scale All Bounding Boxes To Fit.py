@@ -1,62 +1,83 @@
 import bpy
 import mathutils
 
-def scale_empty_cubes_to_bbox():
-    # Step 1: Add or find BBox_Scaler empty cube
-    bbox_scaler = None
-    for obj in bpy.data.objects:
-        if obj.name == "BBox_Scaler" and obj.type == 'EMPTY' and obj.empty_display_type == 'CUBE':
-            bbox_scaler = obj
-            print(f"Found existing BBox_Scaler: {bbox_scaler.name}")
-            break
-    
-    if not bbox_scaler:
-        bpy.ops.object.empty_add(type='CUBE', location=(0, 0, 0))
-        bbox_scaler = bpy.context.object
-        bbox_scaler.name = "BBox_Scaler"
-        print(f"Created new BBox_Scaler: {bbox_scaler.name}")
-    
-    # Step 2: Find all other empty cubes and scale them
-    empty_cubes = [obj for obj in bpy.data.objects 
-                   if obj.type == 'EMPTY' and obj.empty_display_type == 'CUBE' and obj != bbox_scaler]
-    
-    if not empty_cubes:
-        print("No other empty cubes found to scale!")
-        return
-    
-    # Get BBox_Scaler’s scale (reference bounds)
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Batch fitting, packing and re-parenting inside the add-on; plain loops from the Text Editor
+try:
+    from .bebtools_layout import read_vectors, write_vectors, fit_scales, pack_grid, pack_shelf
+    from .bebtools_reparent import reparent
+    from .bebtools_scene_index import scene_index
+except ImportError:
+    read_vectors = write_vectors = fit_scales = pack_grid = pack_shelf = reparent = scene_index = None
+
+def fit_in_python(empty_cubes, bbox_scaler):
+    # Same fit as fit_scales, one cube at a time
     bbox_scale = mathutils.Vector(bbox_scaler.scale)
-    print(f"BBox_Scaler scale: {bbox_scale}")
-    
-    # Scale each empty cube to fit within BBox_Scaler
     for cube in empty_cubes:
         original_scale = mathutils.Vector(cube.scale)
-        print(f"Processing {cube.name} with original scale: {original_scale}")
-        
-        # Calculate scaling factors for each axis to fit within BBox_Scaler
-        scale_factors = [
-            bbox_scale.x / original_scale.x if original_scale.x != 0 else float('inf'),
-            bbox_scale.y / original_scale.y if original_scale.y != 0 else float('inf'),
-            bbox_scale.z / original_scale.z if original_scale.z != 0 else float('inf')
-        ]
-        
-        # Use the smallest factor to maintain aspect ratio and fit inside
+        scale_factors = [bbox_scale[i] / original_scale[i] if original_scale[i] != 0 else float('inf')
+                         for i in range(3)]
         scale_factor = min(scale_factors)
         if scale_factor == float('inf'):
-            print(f"Skipping {cube.name}: zero scale detected!")
+            log.debug("Skipping %s: zero scale detected!", cube.name)
             continue
-        
-        # Apply the uniform scale
         cube.scale = original_scale * scale_factor
-        print(f"Scaled {cube.name} to: {cube.scale}")
-    
-    # Step 3: Parent all scaled empty cubes to BBox_Scaler
+        log.debug("Scaled %s to: %s", cube.name, cube.scale)
     for cube in empty_cubes:
-        if cube.scale != (0, 0, 0):  # Only parent if it was scaled (non-zero)
+        if cube.scale != mathutils.Vector((0, 0, 0)):
             cube.parent = bbox_scaler
-            print(f"Parented {cube.name} to BBox_Scaler")
-    
-    print("All empty cubes scaled and parented to BBox_Scaler!")
 
-# Run the function
-scale_empty_cubes_to_bbox()
\ No newline at end of file
+def scale_empty_cubes_to_bbox(layout='NONE', spacing=0.1):
+    # Step 1: Add or find BBox_Scaler empty cube
+    bbox_scaler = bpy.data.objects.get("BBox_Scaler")
+    if bbox_scaler and bbox_scaler.type == 'EMPTY' and bbox_scaler.empty_display_type == 'CUBE':
+        log.info("Found existing BBox_Scaler: %s", bbox_scaler.name)
+    else:
+        bpy.ops.object.empty_add(type='CUBE', location=(0, 0, 0))
+        bbox_scaler = bpy.context.object
+        bbox_scaler.name = "BBox_Scaler"
+        log.info("Created new BBox_Scaler: %s", bbox_scaler.name)
+
+    # Step 2: Find all other empty cubes
+    empties = scene_index.objects_of_type('EMPTY') if scene_index else \
+        [obj for obj in bpy.data.objects if obj.type == 'EMPTY']
+    empty_cubes = [obj for obj in empties if obj.empty_display_type == 'CUBE' and obj != bbox_scaler]
+    if not empty_cubes:
+        log.warning("No other empty cubes found to scale!")
+        return
+
+    bbox_scale = tuple(bbox_scaler.scale)
+    log.debug("BBox_Scaler scale: %s", bbox_scale)
+    if not fit_scales:
+        if layout != 'NONE':
+            log.warning("Packing needs the Beb.Tools add-on, boxes keep their positions")
+        fit_in_python(empty_cubes, bbox_scaler)
+        log.info("All empty cubes scaled and parented to BBox_Scaler!")
+        return
+
+    # Step 3: Fit every cube inside BBox_Scaler in one go, keeping aspect ratios
+    fitted, valid = fit_scales(read_vectors(empty_cubes, "scale"), bbox_scale)
+    for cube in (cube for cube, ok in zip(empty_cubes, valid) if not ok):
+        log.debug("Skipping %s: zero scale detected!", cube.name)
+    write_vectors(empty_cubes, "scale", fitted)
+
+    # Step 4: Parent the cubes to BBox_Scaler, then lay them out in its space when asked
+    nonzero = fitted.any(axis=1)
+    parented = [cube for cube, keep in zip(empty_cubes, nonzero) if keep]
+    reparent(parented, bbox_scaler, keep_transform=False)
+    if layout in ('GRID', 'SHELF') and parented:
+        # An empty cube spans -1..1, so its size is twice its scale
+        sizes = 2 * abs(fitted[nonzero])
+        pack = pack_grid if layout == 'GRID' else pack_shelf
+        write_vectors(parented, "location", pack(sizes, spacing))
+        log.info("Packed %s boxes on a %s layout", len(parented), layout.lower())
+
+    log.info("All empty cubes scaled and parented to BBox_Scaler!")
+
+# Queued steps can pack the boxes with {"layout": "GRID" or "SHELF", "spacing": 0.1}
+params = globals().get("BEBTOOLS_PARAMS") or {}
+scale_empty_cubes_to_bbox(params.get("layout", 'NONE').upper(), float(params.get("spacing", 0.1)))
@@ -1,16 +1,21 @@
 import bpy
 import mathutils
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 def add_camera_from_view():
     # Ensure we’re in a 3D View context
     if not bpy.context.area or bpy.context.area.type != 'VIEW_3D':
-        print("Error: Must be run from a 3D View context!")
+        log.error("Error: Must be run from a 3D View context!")
         return
     
     # Get the 3D viewport’s region data
     region_3d = bpy.context.region_data
     if not region_3d:
-        print("Error: No 3D region data available!")
+        log.error("Error: No 3D region data available!")
         return
     
     # Get view location, rotation, and distance
@@ -23,19 +28,32 @@ def add_camera_from_view():
     view_dir.rotate(view_rot)  # Rotate to match viewport
     cam_loc = view_loc - view_dir * view_dist  # Position camera back along view direction
     
-    # Add the camera
-    bpy.ops.object.camera_add(location=cam_loc, rotation=view_rot.to_euler())
-    camera = bpy.context.object
-    camera.name = "Camera_From_View"
-    
-    # Match viewport lens (approximate focal length)
-    camera.data.lens = region_3d.view_camera_zoom if region_3d.view_perspective == 'CAMERA' else 50  # Default to 50mm if not in camera view
-    print(f"Added camera {camera.name} at {cam_loc} with rotation {camera.rotation_euler}")
+    # Add the camera through the data API, into the active collection like the Add menu does
+    camera_data = bpy.data.cameras.new("Camera_From_View")
+    camera = bpy.data.objects.new("Camera_From_View", camera_data)
+    bpy.context.collection.objects.link(camera)
+
+    scene_camera = bpy.context.scene.camera
+    if region_3d.view_perspective == 'CAMERA' and scene_camera and scene_camera.type == 'CAMERA':
+        # Looking through the scene camera: copy it, view_location is not where it sits
+        camera.matrix_world = scene_camera.matrix_world
+        camera_data.lens = scene_camera.data.lens
+        camera_data.sensor_width = scene_camera.data.sensor_width
+    else:
+        camera.location = cam_loc
+        camera.rotation_euler = view_rot.to_euler()
+        # The viewport lens applies to a 72 mm wide sensor, twice the camera's 36 mm
+        view_lens = bpy.context.space_data.lens
+        camera_data.lens = view_lens / 2
+        if region_3d.view_perspective == 'ORTHO':
+            camera_data.type = 'ORTHO'
+            camera_data.ortho_scale = view_dist * 72 / view_lens
+    log.debug("Added camera %s at %s with rotation %s", camera.name, camera.location, camera.rotation_euler)
     
     # Optional: Set as active camera (uncomment if desired)
     # bpy.context.scene.camera = camera
     
-    print("Camera added matching current viewport view!")
+    log.info("Camera added matching current viewport view!")
 
 # Run the function
 add_camera_from_view()
\ No newline at end of file
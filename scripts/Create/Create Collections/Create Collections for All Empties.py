@@ -1,7 +1,20 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Shared scene index inside the add-on, a plain scan when run from the Text Editor
+try:
+    from .bebtools_scene_index import scene_index
+except ImportError:
+    scene_index = None
+
 def get_all_children(obj):
     """Recursively get all children of an object."""
+    if scene_index:
+        return scene_index.descendants(obj)
     children = []
     for child in obj.children:
         children.append(child)
@@ -12,51 +25,54 @@ def create_empty_collections(scene=None):
     # Use provided scene or fall back to bpy.context.scene
     if scene is None:
         scene = bpy.context.scene
-    print(f"Current scene: {scene.name}")
+    log.debug("Current scene: %s", scene.name)
     
+    if scene_index:
+        candidates = scene_index.roots('EMPTY', scene)
+    else:
+        candidates = [obj for obj in scene.objects if obj.type == 'EMPTY' and obj.parent is None]
     parent_empties = []
-    print("All objects in scene:")
-    for obj in scene.objects:
-        print(f" - {obj.name}, Type: {obj.type}, Parent: {obj.parent}")
-        if obj.type == 'EMPTY' and obj.parent is None:
-            # Check if the empty is only in the Scene Collection
-            current_collections = list(obj.users_collection)
-            if len(current_collections) == 1 and current_collections[0] == scene.collection:
-                parent_empties.append(obj)
-                print(f"   Added as parent empty: {obj.name}")
-            else:
-                print(f"   Skipped {obj.name}: already in a custom collection")
+    log.debug("Top-level objects in scene:")
+    for obj in candidates:
+        log.debug(" - %s, Type: %s, Parent: %s", obj.name, obj.type, obj.parent)
+        # Check if the empty is only in the Scene Collection
+        current_collections = list(obj.users_collection)
+        if len(current_collections) == 1 and current_collections[0] == scene.collection:
+            parent_empties.append(obj)
+            log.debug("   Added as parent empty: %s", obj.name)
+        else:
+            log.debug("   Skipped %s: already in a custom collection", obj.name)
 
-    print(f"Found {len(parent_empties)} parent empty objects to process")
+    log.info("Found %s parent empty objects to process", len(parent_empties))
     if not parent_empties:
-        print("No top-level empty objects found needing collections!")
+        log.warning("No top-level empty objects found needing collections!")
         return
     
     for empty_obj in parent_empties:
-        print(f"Processing empty: {empty_obj.name}")
+        log.debug("Processing empty: %s", empty_obj.name)
         collection_name = f"{empty_obj.name}_Collection"
         new_collection = bpy.data.collections.new(collection_name)
-        print(f"Created collection: {collection_name}")
+        log.debug("Created collection: %s", collection_name)
         
         scene.collection.children.link(new_collection)
-        print(f"Linked {collection_name} to scene")
+        log.debug("Linked %s to scene", collection_name)
         
         # Move the empty and all its children to the new collection
         objects_to_move = [empty_obj] + get_all_children(empty_obj)
         for obj in objects_to_move:
             current_collections = list(obj.users_collection)
-            print(f"Current collections for {obj.name}: {[coll.name for coll in current_collections]}")
+            log.debug("Current collections for %s: %s", obj.name, [coll.name for coll in current_collections])
             
             if current_collections:
                 for coll in current_collections:
                     coll.objects.unlink(obj)
-                    print(f"Unlinked {obj.name} from {coll.name}")
+                    log.debug("Unlinked %s from %s", obj.name, coll.name)
             else:
-                print(f"{obj.name} was not in any collections")
+                log.debug("%s was not in any collections", obj.name)
             
             new_collection.objects.link(obj)
-            print(f"Linked {obj.name} to {collection_name}")
+            log.debug("Linked %s to %s", obj.name, collection_name)
 
 bpy.ops.object.select_all(action='DESELECT')
 create_empty_collections(bpy.context.scene)
-print("Empty objects and their children organized into collections complete!")
\ No newline at end of file
+log.info("Empty objects and their children organized into collections complete!")
\ No newline at end of file
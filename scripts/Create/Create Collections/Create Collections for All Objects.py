@@ -1,46 +1,60 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Shared scene index inside the add-on, a plain scan when run from the Text Editor
+try:
+    from .bebtools_scene_index import scene_index
+except ImportError:
+    scene_index = None
+
 def create_mesh_collections(scene=None):
     # Use provided scene or fall back to bpy.context.scene
     if scene is None:
         scene = bpy.context.scene
-    print(f"Current scene: {scene.name}")
+    log.debug("Current scene: %s", scene.name)
     
+    if scene_index:
+        candidates = scene_index.roots('MESH', scene)
+    else:
+        candidates = [obj for obj in scene.objects if obj.type == 'MESH' and obj.parent is None]
     parent_meshes = []
-    print("All objects in scene:")
-    for obj in scene.objects:
-        print(f" - {obj.name}, Type: {obj.type}, Parent: {obj.parent}")
-        if obj.type == 'MESH' and obj.parent is None:
-            parent_meshes.append(obj)
-            print(f"   Added as parent mesh: {obj.name}")
+    log.debug("Top-level objects in scene:")
+    for obj in candidates:
+        log.debug(" - %s, Type: %s, Parent: %s", obj.name, obj.type, obj.parent)
+        parent_meshes.append(obj)
+        log.debug("   Added as parent mesh: %s", obj.name)
     
-    print(f"Found {len(parent_meshes)} parent mesh objects")
+    log.info("Found %s parent mesh objects", len(parent_meshes))
     if not parent_meshes:
-        print("No top-level mesh objects found in the scene!")
+        log.warning("No top-level mesh objects found in the scene!")
         return
     
     for mesh_obj in parent_meshes:
-        print(f"Processing mesh: {mesh_obj.name}")
+        log.debug("Processing mesh: %s", mesh_obj.name)
         collection_name = f"{mesh_obj.name}"
         new_collection = bpy.data.collections.new(collection_name)
-        print(f"Created collection: {collection_name}")
+        log.debug("Created collection: %s", collection_name)
         
         scene.collection.children.link(new_collection)
-        print(f"Linked {collection_name} to scene")
+        log.debug("Linked %s to scene", collection_name)
         
         current_collections = list(mesh_obj.users_collection)
-        print(f"Current collections for {mesh_obj.name}: {[coll.name for coll in current_collections]}")
+        log.debug("Current collections for %s: %s", mesh_obj.name, [coll.name for coll in current_collections])
         
         if current_collections:
             for coll in current_collections:
                 coll.objects.unlink(mesh_obj)
-                print(f"Unlinked {mesh_obj.name} from {coll.name}")
+                log.debug("Unlinked %s from %s", mesh_obj.name, coll.name)
         else:
-            print(f"{mesh_obj.name} was not in any collections")
+            log.debug("%s was not in any collections", mesh_obj.name)
         
         new_collection.objects.link(mesh_obj)
-        print(f"Linked {mesh_obj.name} to {collection_name}")
+        log.debug("Linked %s to %s", mesh_obj.name, collection_name)
 
 bpy.ops.object.select_all(action='DESELECT')
 create_mesh_collections(bpy.context.scene)
-print("Mesh objects organized into collections complete!")
\ No newline at end of file
+log.info("Mesh objects organized into collections complete!")
\ No newline at end of file
@@ -1,19 +1,34 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Shared scene index and batch re-parenting inside the add-on, plain loops when run from the Text Editor
+try:
+    from .bebtools_scene_index import scene_index
+    from .bebtools_reparent import reparent
+except ImportError:
+    scene_index = reparent = None
+
 # Create an empty at (0,0,0) and parent all cameras to it
 bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0.0, 0.0, 0.0))
 new_empty = bpy.context.active_object
 new_empty.name = "All_Cameras_Parent"
 
-for obj in bpy.data.objects:
-    if obj.type == 'CAMERA':
-        # Clear existing parent if any
-        if obj.parent:
-            obj.matrix_parent_inverse = obj.matrix_world
-            obj.parent = None
-        # Parent to new empty
+if scene_index:
+    cameras = scene_index.objects_of_type('CAMERA')
+else:
+    cameras = [obj for obj in bpy.data.objects if obj.type == 'CAMERA']
+
+# Keep the current world transform, whatever the old parent was
+if reparent:
+    reparent(cameras, new_empty)
+else:
+    for obj in cameras:
+        world = obj.matrix_world.copy()
         obj.parent = new_empty
-        # Keep current transform
-        obj.matrix_parent_inverse = new_empty.matrix_world.inverted()
+        obj.matrix_world = world
 
-print("All cameras parented to new empty at (0, 0, 0)!")
\ No newline at end of file
+log.info("All cameras parented to new empty at (0, 0, 0)!")
\ No newline at end of file
@@ -1,20 +1,29 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Batch re-parenting inside the add-on, a plain loop when run from the Text Editor
+try:
+    from .bebtools_reparent import reparent
+except ImportError:
+    reparent = None
+
 # Create an empty at (0,0,0) and parent all objects to it
 bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0.0, 0.0, 0.0))
 new_empty = bpy.context.active_object
 new_empty.name = "All_Objects_Parent"
 
-for obj in bpy.data.objects:
-    # Skip the new empty itself
-    if obj != new_empty:
-        # Clear existing parent if any
-        if obj.parent:
-            obj.matrix_parent_inverse = obj.matrix_world
-            obj.parent = None
-        # Parent to new empty
-        obj.parent = new_empty
-        # Keep current transform
-        obj.matrix_parent_inverse = new_empty.matrix_world.inverted()
+# Keep the current world transform, whatever the old parent was; the new empty itself is skipped
+if reparent:
+    reparent(bpy.data.objects, new_empty)
+else:
+    for obj in list(bpy.data.objects):
+        if obj != new_empty:
+            world = obj.matrix_world.copy()
+            obj.parent = new_empty
+            obj.matrix_world = world
 
-print("All objects parented to new empty at (0, 0, 0)!")
\ No newline at end of file
+log.info("All objects parented to new empty at (0, 0, 0)!")
\ No newline at end of file
@@ -0,0 +1,132 @@
+import bpy
+import math
+from bpy.types import Operator
+from bpy.props import EnumProperty, FloatProperty, BoolProperty
+
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Batch bounds and framing live in the Beb.Tools add-on, this script can't run without them
+try:
+    from .bebtools_framing import group_bounds, frame_bounds, FRAMES_KEY, FRAMES_TYPE_KEY
+    from .bebtools_layout import write_vectors
+    from .bebtools_scene_index import scene_index
+except ImportError:
+    group_bounds = None
+
+SENSOR_WIDTH = 36.0
+
+
+def framing_targets(scene, target):
+    # (name, objects) per collection or per top-level object with its whole hierarchy
+    if target == 'COLLECTIONS':
+        return [(coll.name, list(coll.all_objects)) for coll in bpy.data.collections]
+    return [(obj.name, [obj] + scene_index.descendants(obj)) for obj in scene_index.roots(scene=scene)]
+
+def remove_framing_cameras(kind):
+    cameras = [obj for obj in scene_index.objects_of_type('CAMERA') if obj.get(FRAMES_TYPE_KEY) == kind]
+    data = [obj.data for obj in cameras if obj.data and obj.data.users == 1]
+    bpy.data.batch_remove(cameras + data)
+    return len(cameras)
+
+
+class BEBTOOLS_OT_CreateFramingCameras(Operator):
+    bl_idname = "bebtools.create_framing_cameras"
+    bl_label = "Create Framing Cameras"
+    bl_description = "Create a camera framing every collection or top-level object"
+
+    target: EnumProperty(
+        name="Frame",
+        items=[
+            ('COLLECTIONS', "Collections", "One camera per collection, used by Render All Collections"),
+            ('OBJECTS', "Top-Level Objects", "One camera per object without a parent, children included"),
+        ],
+        default='COLLECTIONS'
+    )
+    elevation: FloatProperty(
+        name="Elevation",
+        description="Angle of the camera above the horizon",
+        subtype='ANGLE',
+        default=math.radians(30),
+        min=-math.pi / 2,
+        max=math.pi / 2
+    )
+    azimuth: FloatProperty(
+        name="Azimuth",
+        description="Angle around the vertical axis, 0 looks along +Y",
+        subtype='ANGLE',
+        default=math.radians(45)
+    )
+    lens: FloatProperty(
+        name="Focal Length",
+        description="Focal length of every camera in millimeters (36 mm sensor)",
+        default=50.0,
+        min=1.0
+    )
+    margin: FloatProperty(
+        name="Margin",
+        description="Room around each framed item, 1 touches the frame edges",
+        default=1.1,
+        min=1.0
+    )
+    replace: BoolProperty(
+        name="Replace Existing",
+        description="Remove framing cameras this operator made before for the same kind of item",
+        default=True
+    )
+
+    def execute(self, context):
+        if group_bounds is None:
+            self.report({'ERROR'}, "Framing cameras need the Beb.Tools add-on")
+            log.error("Framing cameras need the Beb.Tools add-on")
+            return {'CANCELLED'}
+        scene = context.scene
+        kind = 'COLLECTION' if self.target == 'COLLECTIONS' else 'OBJECT'
+        if self.replace:
+            log.debug("Removed %s old framing cameras", remove_framing_cameras(kind))
+
+        targets = framing_targets(scene, self.target)
+        mins, maxs, valid = group_bounds([objects for _, objects in targets])
+        names = [name for (name, _), ok in zip(targets, valid) if ok]
+        if not names:
+            self.report({'WARNING'}, "Nothing to frame!")
+            log.warning("Nothing to frame!")
+            return {'FINISHED'}
+        aspect = scene.render.resolution_x / max(scene.render.resolution_y, 1)
+        locations, rotation, clip_starts, clip_ends = frame_bounds(
+            mins[valid], maxs[valid], aspect, self.lens, SENSOR_WIDTH, self.elevation, self.azimuth, self.margin)
+
+        cameras = []
+        for name, clip_start, clip_end in zip(names, clip_starts, clip_ends):
+            camera_data = bpy.data.cameras.new(f"Cam_{name}")
+            camera_data.lens = self.lens
+            camera_data.sensor_width = SENSOR_WIDTH
+            camera_data.clip_start = clip_start
+            camera_data.clip_end = clip_end
+            camera = bpy.data.objects.new(f"Cam_{name}", camera_data)
+            camera[FRAMES_KEY] = name
+            camera[FRAMES_TYPE_KEY] = kind
+            scene.collection.objects.link(camera)
+            cameras.append(camera)
+        # Placement for all of them in two writes
+        write_vectors(cameras, "location", locations)
+        write_vectors(cameras, "rotation_euler", tuple(rotation))
+
+        self.report({'INFO'}, f"Created {len(cameras)} framing cameras")
+        log.info("Created %s framing cameras, one per %s", len(cameras), kind.lower())
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+# Register the operator (runs when script is loaded by Beb.Tools)
+bpy.utils.register_class(BEBTOOLS_OT_CreateFramingCameras)
+
+# Queued steps with stored parameters run unattended, otherwise ask for the options
+params = globals().get("BEBTOOLS_PARAMS")
+if params or not globals().get("BEBTOOLS_INVOKE", True):
+    bpy.ops.bebtools.create_framing_cameras('EXEC_DEFAULT', **params)
+else:
+    bpy.ops.bebtools.create_framing_cameras('INVOKE_DEFAULT')
@@ -1,5 +1,10 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 # Get the scene
 scene = bpy.context.scene
 
@@ -14,13 +19,13 @@ for coll_name in collection_names_to_delete[:]:  # Use a copy to avoid iteration
         for obj in coll.objects[:]:  # Use a copy of objects
             if obj.name not in scene.collection.objects:
                 scene.collection.objects.link(obj)
-                print(f"Moved {obj.name} to Scene Collection from {coll_name}")
+                log.debug("Moved %s to Scene Collection from %s", obj.name, coll_name)
             coll.objects.unlink(obj)
         # Delete the collection
         bpy.data.collections.remove(coll)
-        print(f"Deleted collection: {coll_name}")
+        log.debug("Deleted collection: %s", coll_name)
 
 if not collection_names_to_delete:
-    print("No user-created collections found to delete!")
+    log.warning("No user-created collections found to delete!")
 else:
-    print("All user-created collections deleted, objects preserved in Scene Collection!")
\ No newline at end of file
+    log.info("All user-created collections deleted, objects preserved in Scene Collection!")
\ No newline at end of file
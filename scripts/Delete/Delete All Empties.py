@@ -1,8 +1,23 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Shared scene index inside the add-on, a plain scan when run from the Text Editor
+try:
+    from .bebtools_scene_index import scene_index
+except ImportError:
+    scene_index = None
+
+if scene_index:
+    empties = scene_index.objects_of_type('EMPTY', bpy.context.scene)
+else:
+    empties = [obj for obj in bpy.context.scene.objects if obj.type == 'EMPTY']
+
 # Deletes all empty objects from the scene
-for obj in bpy.context.scene.objects:
-    if obj.type == 'EMPTY':
-        bpy.data.objects.remove(obj, do_unlink=True)
+for obj in empties:
+    bpy.data.objects.remove(obj, do_unlink=True)
 
-print("All empties deleted from the scene.")
\ No newline at end of file
+log.info("All empties deleted from the scene.")
\ No newline at end of file
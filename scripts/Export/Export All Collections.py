@@ -0,0 +1,126 @@
+import bpy
+import os
+import time
+from bpy.types import Operator
+from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty
+
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# The worker pool and export manifest live in the Beb.Tools add-on
+try:
+    from .bebtools_export import ExportRun, plan_export, MANIFEST_NAME
+    from .bebtools_sandbox import start_background, POOL_SIZE
+except ImportError:
+    ExportRun = None
+
+
+class BEBTOOLS_OT_ExportCollections(Operator):
+    bl_idname = "bebtools.export_collections"
+    bl_label = "Export All Collections"
+    bl_description = "Export every collection as its own file, several at a time in background Blender processes"
+
+    directory: StringProperty(
+        name="Output Directory",
+        description="Directory the exported files go to",
+        subtype='DIR_PATH',
+        default=""
+    )
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ('FBX', "FBX", "Autodesk FBX (.fbx)"),
+            ('GLB', "glTF Binary", "glTF 2.0 binary (.glb)"),
+            ('USD', "USD", "Universal Scene Description (.usdc)"),
+        ],
+        default='FBX'
+    )
+    workers: IntProperty(
+        name="Workers",
+        description="Background Blender processes exporting at the same time (0 = automatic)",
+        default=0,
+        min=0,
+        max=16
+    )
+    changed_only: BoolProperty(
+        name="Changed Only",
+        description="Skip collections whose contents match their last export in this directory",
+        default=True
+    )
+    background: BoolProperty(
+        name="Run in Background",
+        description="Return at once and report progress in the Beb.Tools panel, otherwise wait for the export",
+        default=True
+    )
+
+    def execute(self, context):
+        if ExportRun is None:
+            self.report({'ERROR'}, "Exporting collections needs the Beb.Tools add-on")
+            log.error("Exporting collections needs the Beb.Tools add-on")
+            return {'CANCELLED'}
+        if not self.directory:
+            self.report({'ERROR'}, "No output directory selected!")
+            log.warning("No output directory selected!")
+            return {'CANCELLED'}
+        directory = bpy.path.abspath(self.directory)
+        os.makedirs(directory, exist_ok=True)
+
+        collections = [coll for coll in bpy.data.collections if coll.all_objects]
+        if not collections:
+            self.report({'WARNING'}, "No collections with objects found to export!")
+            log.warning("No collections with objects found to export!")
+            return {'FINISHED'}
+        planned, skipped = plan_export(collections, directory, self.file_format, self.changed_only)
+        if skipped:
+            log.info("Skipping %s collections unchanged since their last export (%s)", len(skipped), MANIFEST_NAME)
+        if not planned:
+            self.report({'INFO'}, "All collections are up to date, nothing to export")
+            return {'FINISHED'}
+
+        start = time.perf_counter()
+        run = ExportRun(planned, directory, self.file_format, self.workers or POOL_SIZE)
+        log.info("Exporting %s collections with %s workers", len(planned), len(run.processes))
+
+        def done(results, error):
+            if error:
+                log.error("Export failed: %s", error)
+                return
+            exported, failed = run.finish(results)
+            log.info("Exported %s collections to %s in %.1fs%s", exported, directory, time.perf_counter() - start,
+                     f", {len(failed)} failed" if failed else "")
+
+        if self.background:
+            start_background(run.wait, done)
+            self.report({'INFO'}, f"Exporting {len(planned)} collections in the background")
+            return {'FINISHED'}
+        exported, failed = run.finish(run.wait())
+        log.info("Exported %s collections to %s in %.1fs", exported, directory, time.perf_counter() - start)
+        if failed:
+            self.report({'ERROR'}, f"{len(failed)} collections failed to export: {', '.join(failed)}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported {exported} collections to {directory}")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        """Open the file browser with options."""
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "file_format")
+        layout.prop(self, "workers")
+        layout.prop(self, "changed_only")
+        layout.prop(self, "background")
+
+# Register the operator (runs when script is loaded by Beb.Tools)
+bpy.utils.register_class(BEBTOOLS_OT_ExportCollections)
+
+# Queued steps with stored parameters run unattended, otherwise open the file browser
+params = globals().get("BEBTOOLS_PARAMS")
+if params or not globals().get("BEBTOOLS_INVOKE", True):
+    bpy.ops.bebtools.export_collections('EXEC_DEFAULT', **params)
+else:
+    bpy.ops.bebtools.export_collections('INVOKE_DEFAULT')
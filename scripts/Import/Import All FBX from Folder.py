@@ -3,6 +3,11 @@ import os
 from bpy.types import Operator
 from bpy.props import StringProperty
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 class BEBTOOLS_OT_ImportAllFBX(Operator):
     bl_idname = "bebtools.import_all_fbx"
     bl_label = "Import All FBX Files"
@@ -20,7 +25,7 @@ class BEBTOOLS_OT_ImportAllFBX(Operator):
         """Import all .fbx files from the selected directory and its subfolders."""
         if not self.directory:
             self.report({'ERROR'}, "No directory selected!")
-            print("No directory selected!")
+            log.warning("No directory selected!")
             return {'CANCELLED'}
         
         fbx_files = []
@@ -32,20 +37,20 @@ class BEBTOOLS_OT_ImportAllFBX(Operator):
         
         if not fbx_files:
             self.report({'WARNING'}, f"No .fbx files found in {self.directory} or its subfolders!")
-            print(f"No .fbx files found in {self.directory} or its subfolders!")
+            log.warning("No .fbx files found in %s or its subfolders!", self.directory)
             return {'FINISHED'}
         
         # Import each .fbx file
         for fbx_file in fbx_files:
-            print(f"Importing: {fbx_file}")
+            log.debug("Importing: %s", fbx_file)
             try:
                 bpy.ops.import_scene.fbx(filepath=fbx_file)
-                print(f"Successfully imported: {fbx_file}")
+                log.debug("Successfully imported: %s", fbx_file)
             except Exception as e:
-                print(f"Error importing {fbx_file}: {str(e)}")
+                log.error("Error importing %s: %s", fbx_file, e)
         
         self.report({'INFO'}, f"Imported {len(fbx_files)} .fbx files from {self.directory}")
-        print(f"Imported {len(fbx_files)} .fbx files from {self.directory} and subfolders!")
+        log.info("Imported %s .fbx files from %s and subfolders!", len(fbx_files), self.directory)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -56,5 +61,9 @@ class BEBTOOLS_OT_ImportAllFBX(Operator):
 # Register the operator (runs when script is loaded by Beb.Tools)
 bpy.utils.register_class(BEBTOOLS_OT_ImportAllFBX)
 
-# When called from Beb.Tools "Apply", this executes the operator
-bpy.ops.bebtools.import_all_fbx('INVOKE_DEFAULT')
\ No newline at end of file
+# Queued steps with stored parameters run unattended, otherwise open the file browser
+params = globals().get("BEBTOOLS_PARAMS")
+if params or not globals().get("BEBTOOLS_INVOKE", True):
+    bpy.ops.bebtools.import_all_fbx('EXEC_DEFAULT', **params)
+else:
+    bpy.ops.bebtools.import_all_fbx('INVOKE_DEFAULT')
@@ -3,6 +3,11 @@ import os
 from bpy.types import Operator
 from bpy.props import StringProperty
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 class BEBTOOLS_OT_ImportAllGLB(Operator):
     bl_idname = "bebtools.import_all_glb"
     bl_label = "Import All GLB Files"
@@ -20,7 +25,7 @@ class BEBTOOLS_OT_ImportAllGLB(Operator):
         """Import all .glb files from the selected directory and its subfolders."""
         if not self.directory:
             self.report({'ERROR'}, "No directory selected!")
-            print("No directory selected!")
+            log.warning("No directory selected!")
             return {'CANCELLED'}
         
         glb_files = []
@@ -32,20 +37,20 @@ class BEBTOOLS_OT_ImportAllGLB(Operator):
         
         if not glb_files:
             self.report({'WARNING'}, f"No .glb files found in {self.directory} or its subfolders!")
-            print(f"No .glb files found in {self.directory} or its subfolders!")
+            log.warning("No .glb files found in %s or its subfolders!", self.directory)
             return {'FINISHED'}
         
         # Import each .glb file
         for glb_file in glb_files:
-            print(f"Importing: {glb_file}")
+            log.debug("Importing: %s", glb_file)
             try:
                 bpy.ops.import_scene.gltf(filepath=glb_file)  # GLB uses the same importer as GLTF
-                print(f"Successfully imported: {glb_file}")
+                log.debug("Successfully imported: %s", glb_file)
             except Exception as e:
-                print(f"Error importing {glb_file}: {str(e)}")
+                log.error("Error importing %s: %s", glb_file, e)
         
         self.report({'INFO'}, f"Imported {len(glb_files)} .glb files from {self.directory}")
-        print(f"Imported {len(glb_files)} .glb files from {self.directory} and subfolders!")
+        log.info("Imported %s .glb files from %s and subfolders!", len(glb_files), self.directory)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -56,5 +61,9 @@ class BEBTOOLS_OT_ImportAllGLB(Operator):
 # Register the operator
 bpy.utils.register_class(BEBTOOLS_OT_ImportAllGLB)
 
-# Execute with file browser
-bpy.ops.bebtools.import_all_glb('INVOKE_DEFAULT')
\ No newline at end of file
+# Queued steps with stored parameters run unattended, otherwise open the file browser
+params = globals().get("BEBTOOLS_PARAMS")
+if params or not globals().get("BEBTOOLS_INVOKE", True):
+    bpy.ops.bebtools.import_all_glb('EXEC_DEFAULT', **params)
+else:
+    bpy.ops.bebtools.import_all_glb('INVOKE_DEFAULT')
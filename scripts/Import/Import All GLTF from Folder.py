@@ -3,6 +3,11 @@ import os
 from bpy.types import Operator
 from bpy.props import StringProperty
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 class BEBTOOLS_OT_ImportAllGLTF(Operator):
     bl_idname = "bebtools.import_all_gltf"
     bl_label = "Import All GLTF Files"
@@ -20,7 +25,7 @@ class BEBTOOLS_OT_ImportAllGLTF(Operator):
         """Import all .gltf files from the selected directory and its subfolders."""
         if not self.directory:
             self.report({'ERROR'}, "No directory selected!")
-            print("No directory selected!")
+            log.warning("No directory selected!")
             return {'CANCELLED'}
         
         gltf_files = []
@@ -32,20 +37,20 @@ class BEBTOOLS_OT_ImportAllGLTF(Operator):
         
         if not gltf_files:
             self.report({'WARNING'}, f"No .gltf files found in {self.directory} or its subfolders!")
-            print(f"No .gltf files found in {self.directory} or its subfolders!")
+            log.warning("No .gltf files found in %s or its subfolders!", self.directory)
             return {'FINISHED'}
         
         # Import each .gltf file
         for gltf_file in gltf_files:
-            print(f"Importing: {gltf_file}")
+            log.debug("Importing: %s", gltf_file)
             try:
                 bpy.ops.import_scene.gltf(filepath=gltf_file)
-                print(f"Successfully imported: {gltf_file}")
+                log.debug("Successfully imported: %s", gltf_file)
             except Exception as e:
-                print(f"Error importing {gltf_file}: {str(e)}")
+                log.error("Error importing %s: %s", gltf_file, e)
         
         self.report({'INFO'}, f"Imported {len(gltf_files)} .gltf files from {self.directory}")
-        print(f"Imported {len(gltf_files)} .gltf files from {self.directory} and subfolders!")
+        log.info("Imported %s .gltf files from %s and subfolders!", len(gltf_files), self.directory)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -56,5 +61,9 @@ class BEBTOOLS_OT_ImportAllGLTF(Operator):
 # Register the operator (runs when script is loaded by Beb.Tools)
 bpy.utils.register_class(BEBTOOLS_OT_ImportAllGLTF)
 
-# When called from Beb.Tools "Apply", this executes the operator
-bpy.ops.bebtools.import_all_gltf('INVOKE_DEFAULT')
\ No newline at end of file
+# Queued steps with stored parameters run unattended, otherwise open the file browser
+params = globals().get("BEBTOOLS_PARAMS")
+if params or not globals().get("BEBTOOLS_INVOKE", True):
+    bpy.ops.bebtools.import_all_gltf('EXEC_DEFAULT', **params)
+else:
+    bpy.ops.bebtools.import_all_gltf('INVOKE_DEFAULT')
@@ -3,6 +3,11 @@ import os
 from bpy.types import Operator
 from bpy.props import StringProperty
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 class BEBTOOLS_OT_ImportAllOBJ(Operator):
     bl_idname = "bebtools.import_all_obj"
     bl_label = "Import All OBJ Files"
@@ -20,7 +25,7 @@ class BEBTOOLS_OT_ImportAllOBJ(Operator):
         """Import all .obj files from the selected directory and its subfolders."""
         if not self.directory:
             self.report({'ERROR'}, "No directory selected!")
-            print("No directory selected!")
+            log.warning("No directory selected!")
             return {'CANCELLED'}
         
         obj_files = []
@@ -32,20 +37,20 @@ class BEBTOOLS_OT_ImportAllOBJ(Operator):
         
         if not obj_files:
             self.report({'WARNING'}, f"No .obj files found in {self.directory} or its subfolders!")
-            print(f"No .obj files found in {self.directory} or its subfolders!")
+            log.warning("No .obj files found in %s or its subfolders!", self.directory)
             return {'FINISHED'}
         
         # Import each .obj file
         for obj_file in obj_files:
-            print(f"Importing: {obj_file}")
+            log.debug("Importing: %s", obj_file)
             try:
                 bpy.ops.wm.obj_import(filepath=obj_file)  # Blender 4.2's OBJ importer
-                print(f"Successfully imported: {obj_file}")
+                log.debug("Successfully imported: %s", obj_file)
             except Exception as e:
-                print(f"Error importing {obj_file}: {str(e)}")
+                log.error("Error importing %s: %s", obj_file, e)
         
         self.report({'INFO'}, f"Imported {len(obj_files)} .obj files from {self.directory}")
-        print(f"Imported {len(obj_files)} .obj files from {self.directory} and subfolders!")
+        log.info("Imported %s .obj files from %s and subfolders!", len(obj_files), self.directory)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -56,5 +61,9 @@ class BEBTOOLS_OT_ImportAllOBJ(Operator):
 # Register the operator
 bpy.utils.register_class(BEBTOOLS_OT_ImportAllOBJ)
 
-# Execute with file browser
-bpy.ops.bebtools.import_all_obj('INVOKE_DEFAULT')
\ No newline at end of file
+# Queued steps with stored parameters run unattended, otherwise open the file browser
+params = globals().get("BEBTOOLS_PARAMS")
+if params or not globals().get("BEBTOOLS_INVOKE", True):
+    bpy.ops.bebtools.import_all_obj('EXEC_DEFAULT', **params)
+else:
+    bpy.ops.bebtools.import_all_obj('INVOKE_DEFAULT')
@@ -3,6 +3,11 @@ import os
 from bpy.types import Operator
 from bpy.props import StringProperty
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 class BEBTOOLS_OT_ImportAllUSD(Operator):
     bl_idname = "bebtools.import_all_usd"
     bl_label = "Import All USD Files"
@@ -20,7 +25,7 @@ class BEBTOOLS_OT_ImportAllUSD(Operator):
         """Import all .usd files from the selected directory and its subfolders."""
         if not self.directory:
             self.report({'ERROR'}, "No directory selected!")
-            print("No directory selected!")
+            log.warning("No directory selected!")
             return {'CANCELLED'}
         
         usd_files = []
@@ -32,20 +37,20 @@ class BEBTOOLS_OT_ImportAllUSD(Operator):
         
         if not usd_files:
             self.report({'WARNING'}, f"No .usd files found in {self.directory} or its subfolders!")
-            print(f"No .usd files found in {self.directory} or its subfolders!")
+            log.warning("No .usd files found in %s or its subfolders!", self.directory)
             return {'FINISHED'}
         
         # Import each .usd file
         for usd_file in usd_files:
-            print(f"Importing: {usd_file}")
+            log.debug("Importing: %s", usd_file)
             try:
                 bpy.ops.wm.usd_import(filepath=usd_file)  # Blender's USD importer
-                print(f"Successfully imported: {usd_file}")
+                log.debug("Successfully imported: %s", usd_file)
             except Exception as e:
-                print(f"Error importing {usd_file}: {str(e)}")
+                log.error("Error importing %s: %s", usd_file, e)
         
         self.report({'INFO'}, f"Imported {len(usd_files)} .usd files from {self.directory}")
-        print(f"Imported {len(usd_files)} .usd files from {self.directory} and subfolders!")
+        log.info("Imported %s .usd files from %s and subfolders!", len(usd_files), self.directory)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -56,5 +61,9 @@ class BEBTOOLS_OT_ImportAllUSD(Operator):
 # Register the operator
 bpy.utils.register_class(BEBTOOLS_OT_ImportAllUSD)
 
-# Execute with file browser
-bpy.ops.bebtools.import_all_usd('INVOKE_DEFAULT')
\ No newline at end of file
+# Queued steps with stored parameters run unattended, otherwise open the file browser
+params = globals().get("BEBTOOLS_PARAMS")
+if params or not globals().get("BEBTOOLS_INVOKE", True):
+    bpy.ops.bebtools.import_all_usd('EXEC_DEFAULT', **params)
+else:
+    bpy.ops.bebtools.import_all_usd('INVOKE_DEFAULT')
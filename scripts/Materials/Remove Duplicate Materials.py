@@ -1,6 +1,11 @@
 import bpy
 import re
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 def deduplicate_materials_and_images():
     # Step 1: Deduplicate materials
     material_map = {}  # Maps primary material name to its datablock
@@ -34,12 +39,12 @@ def deduplicate_materials_and_images():
             if match:
                 primary_name = match.group(1)
                 if primary_name in material_map:
-                    print(f"Reassigning {obj.name} from {slot.material.name} to {primary_name}")
+                    log.debug("Reassigning %s from %s to %s", obj.name, slot.material.name, primary_name)
                     slot.material = material_map[primary_name]
     
     # Delete duplicate materials
     for mat in materials_to_delete:
-        print(f"Deleting duplicate material: {mat.name}")
+        log.debug("Deleting duplicate material: %s", mat.name)
         bpy.data.materials.remove(mat)
 
     # Step 2: Deduplicate images in material node trees
@@ -72,15 +77,15 @@ def deduplicate_materials_and_images():
                     if match:
                         primary_name = match.group(1)
                         if primary_name in image_map:
-                            print(f"Reassigning image in {mat.name} from {node.image.name} to {primary_name}")
+                            log.debug("Reassigning image in %s from %s to %s", mat.name, node.image.name, primary_name)
                             node.image = image_map[primary_name]
     
     # Delete duplicate images
     for img in images_to_delete:
-        print(f"Deleting duplicate image: {img.name}")
+        log.debug("Deleting duplicate image: %s", img.name)
         bpy.data.images.remove(img)
 
-    print("Material and image deduplication complete!")
+    log.info("Material and image deduplication complete!")
 
 # Run the function
 deduplicate_materials_and_images()
\ No newline at end of file
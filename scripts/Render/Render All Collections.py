@@ -1,12 +1,98 @@
 import bpy
 import os
+import math
+import numpy as np
 from bpy.types import Operator
-from bpy.props import StringProperty, BoolProperty, EnumProperty
+from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty
+
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Dirty tracking lives in the Beb.Tools add-on; unavailable when run from the Text Editor
+try:
+    from .bebtools_dirty import get_dirty_collections, mark_rendered
+except ImportError:
+    get_dirty_collections = mark_rendered = None
+
+# Framing shares its bounds and camera math with Create Framing Cameras; without the add-on
+# there are no framing cameras and previews use the active camera
+try:
+    from .bebtools_framing import group_bounds, frame_bounds, FRAMES_KEY, FRAMES_TYPE_KEY
+except ImportError:
+    group_bounds = None
+
+# File extensions Blender appends to still renders for each format
+FORMAT_EXTENSIONS = {'PNG': ".png", 'JPEG': ".jpg", 'BMP': ".bmp", 'TIFF': ".tif"}
+
+
+def get_eevee_engine():
+    # Blender 4.2 ships EEVEE Next as BLENDER_EEVEE_NEXT, other versions use BLENDER_EEVEE
+    engines = bpy.types.RenderSettings.bl_rna.properties['engine'].enum_items.keys()
+    return 'BLENDER_EEVEE_NEXT' if 'BLENDER_EEVEE_NEXT' in engines else 'BLENDER_EEVEE'
+
+
+def get_framing_cameras():
+    # Collection name -> framing camera, for collections that have one
+    if group_bounds is None:
+        return {}
+    return {obj[FRAMES_KEY]: obj for obj in bpy.data.objects
+            if obj.type == 'CAMERA' and obj.get(FRAMES_TYPE_KEY) == 'COLLECTION' and FRAMES_KEY in obj}
+
+
+def frame_collections(collections, camera_data, aspect):
+    # Collection -> (location, clip_start, clip_end) for the preview camera, and the rotation they
+    # share; every collection is measured in one batch, those with nothing to frame are left out
+    mins, maxs, valid = group_bounds([list(coll.all_objects) for coll in collections])
+    if not valid.any():
+        return {}, None
+    locations, rotation, clip_starts, clip_ends = frame_bounds(
+        mins[valid], maxs[valid], aspect, camera_data.lens, camera_data.sensor_width)
+    framed = [coll for coll, ok in zip(collections, valid) if ok]
+    return {coll: (tuple(location), clip_start, clip_end)
+            for coll, location, clip_start, clip_end in zip(framed, locations, clip_starts, clip_ends)}, rotation
+
+
+def build_contact_sheet(image_paths, output_path, file_format, tile_x, tile_y, columns=0):
+    # Paste every preview render into one atlas image, first collection at the top left
+    if not image_paths:
+        return None
+    count = len(image_paths)
+    columns = columns if columns > 0 else math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns)
+    width, height = columns * tile_x, rows * tile_y
+    atlas = np.zeros((height, width, 4), dtype=np.float32)
+
+    for i, path in enumerate(image_paths):
+        image = bpy.data.images.load(path, check_existing=False)
+        try:
+            w, h = image.size
+            pixels = np.empty(w * h * 4, dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+            pixels = pixels.reshape(h, w, 4)[:tile_y, :tile_x]
+            row, col = divmod(i, columns)
+            y0 = height - (row + 1) * tile_y
+            x0 = col * tile_x
+            atlas[y0:y0 + pixels.shape[0], x0:x0 + pixels.shape[1]] = pixels
+        finally:
+            bpy.data.images.remove(image)
+
+    sheet = bpy.data.images.new("BebTools_ContactSheet", width, height, alpha=True)
+    try:
+        sheet.pixels.foreach_set(atlas.ravel())
+        sheet.filepath_raw = output_path
+        sheet.file_format = file_format
+        sheet.save()
+    finally:
+        bpy.data.images.remove(sheet)
+    return output_path
+
 
 class BEBTOOLS_OT_RenderCollections(Operator):
     bl_idname = "bebtools.render_collections"
     bl_label = "Render Collections"
-    bl_description = "Render each collection individually with the active camera"
+    bl_description = "Render each collection individually with its framing camera or the active camera"
 
     # Properties for file browser
     directory: StringProperty(
@@ -31,68 +117,233 @@ class BEBTOOLS_OT_RenderCollections(Operator):
         ],
         default='PNG'
     )
+    profile: EnumProperty(
+        name="Profile",
+        description="Render with the full scene settings or a fast preview profile",
+        items=[
+            ('FINAL', "Final", "Render with the scene's own engine, resolution and samples"),
+            ('PREVIEW', "Preview", "Render quick low resolution previews for QA"),
+        ],
+        default='FINAL'
+    )
+    preview_engine: EnumProperty(
+        name="Preview Engine",
+        description="Render engine used by the preview profile",
+        items=[
+            ('WORKBENCH', "Workbench", "Solid shading, fastest"),
+            ('EEVEE', "Eevee", "Material preview quality"),
+        ],
+        default='WORKBENCH'
+    )
+    preview_size: IntProperty(
+        name="Preview Size",
+        description="Longest side of each preview in pixels",
+        default=256,
+        min=32,
+        max=2048
+    )
+    preview_samples: IntProperty(
+        name="Preview Samples",
+        description="Eevee samples per preview (Workbench uses FXAA)",
+        default=4,
+        min=1,
+        max=64
+    )
+    auto_frame: BoolProperty(
+        name="Auto Frame",
+        description="Frame each collection with its own camera computed from its bounding box",
+        default=True
+    )
+    contact_sheet: BoolProperty(
+        name="Contact Sheet",
+        description="Combine all previews into a single atlas image",
+        default=True
+    )
+    sheet_columns: IntProperty(
+        name="Sheet Columns",
+        description="Number of columns in the contact sheet (0 = square layout)",
+        default=0,
+        min=0
+    )
+    use_framing_cameras: BoolProperty(
+        name="Use Framing Cameras",
+        description="Render collections that have a camera from Create Framing Cameras through it",
+        default=True
+    )
+    dirty_only: BoolProperty(
+        name="Render Dirty Only",
+        description="Only render collections whose objects, meshes or materials changed since their last render",
+        default=False
+    )
 
     def execute(self, context):
         if not self.directory:
             self.report({'ERROR'}, "No output directory selected!")
-            print("No output directory selected!")
+            log.warning("No output directory selected!")
             return {'CANCELLED'}
-        
-        # Get the active camera
-        camera = context.scene.camera
-        if not camera:
+
+        scene = context.scene
+        preview = self.profile == 'PREVIEW'
+        auto_frame = preview and self.auto_frame
+        if auto_frame and group_bounds is None:
+            log.warning("Auto framing needs the Beb.Tools add-on, previews use the active camera")
+            auto_frame = False
+
+        # Get the active camera (preview auto framing and framing cameras bring their own)
+        camera = scene.camera
+        framing_cameras = get_framing_cameras() if self.use_framing_cameras else {}
+        if not camera and not auto_frame and not framing_cameras:
             self.report({'ERROR'}, "No active camera found in the scene!")
-            print("No active camera found in the scene!")
+            log.warning("No active camera found in the scene!")
             return {'CANCELLED'}
-        
+
         # Get all collections (exclude Scene Collection)
         collections = [coll for coll in bpy.data.collections if coll != context.scene.collection]
         if not collections:
             self.report({'WARNING'}, "No collections found to render!")
-            print("No collections found to render!")
+            log.warning("No collections found to render!")
             return {'FINISHED'}
-        
+
+        # Skip collections that haven't changed since their last render
+        render_queue = collections
+        if self.dirty_only and get_dirty_collections:
+            render_queue = get_dirty_collections(collections)
+            log.info("Skipping %s unchanged collections", len(collections) - len(render_queue))
+            if not render_queue:
+                self.report({'INFO'}, "All collections are up to date, nothing to render")
+                return {'FINISHED'}
+
         # Store original visibility states
         original_visibility = {coll: not coll.hide_render for coll in collections}
-        
+
         # Set render settings
-        render = context.scene.render
+        render = scene.render
         original_transparent = render.film_transparent
         original_format = render.image_settings.file_format
+        original_camera = scene.camera
+        original_engine = render.engine
+        original_resolution = (render.resolution_x, render.resolution_y, render.resolution_percentage)
+        original_render_aa = scene.display.render_aa
+        original_eevee_samples = scene.eevee.taa_render_samples
         render.film_transparent = self.transparent
         render.image_settings.file_format = self.file_format
-        
+
+        # Blend-relative "//" paths resolved, os functions would treat them as literal folders
+        directory = bpy.path.abspath(self.directory)
+        output_dir = directory
+        if preview:
+            aspect = render.resolution_x / max(render.resolution_y, 1)
+            if aspect >= 1.0:
+                render.resolution_x = self.preview_size
+                render.resolution_y = max(round(self.preview_size / aspect), 1)
+            else:
+                render.resolution_y = self.preview_size
+                render.resolution_x = max(round(self.preview_size * aspect), 1)
+            render.resolution_percentage = 100
+            if self.preview_engine == 'WORKBENCH':
+                render.engine = 'BLENDER_WORKBENCH'
+                scene.display.render_aa = 'FXAA'
+            else:
+                render.engine = get_eevee_engine()
+                scene.eevee.taa_render_samples = self.preview_samples
+            output_dir = os.path.join(directory, "previews")
+            os.makedirs(output_dir, exist_ok=True)
+
+        # Temporary camera used to frame each collection, linked to the Scene Collection
+        frame_camera = None
+        framing = {}
+        if auto_frame:
+            camera_data = bpy.data.cameras.new("BebTools_PreviewCamera")
+            if camera:
+                camera_data.lens = camera.data.lens
+                camera_data.sensor_width = camera.data.sensor_width
+            frame_camera = bpy.data.objects.new("BebTools_PreviewCamera", camera_data)
+            scene.collection.objects.link(frame_camera)
+            scene.camera = frame_camera
+            framing, rotation = frame_collections([coll for coll in render_queue if coll.name not in framing_cameras],
+                                                  camera_data, render.resolution_x / render.resolution_y)
+            if rotation is not None:
+                frame_camera.rotation_mode = 'XYZ'
+                frame_camera.rotation_euler = rotation
+
         # Hide all collections initially
         for coll in collections:
             coll.hide_render = True
-        
+
         # Render each collection
-        for coll in collections:
-            print(f"Rendering collection: {coll.name}")
+        rendered_paths = []
+        for coll in render_queue:
+            log.debug("Rendering collection: %s", coll.name)
             coll.hide_render = False  # Unhide the current collection
-            
+
+            if coll.name in framing_cameras:
+                scene.camera = framing_cameras[coll.name]
+            elif frame_camera:
+                scene.camera = frame_camera
+                if coll not in framing:
+                    log.warning("Skipping %s: nothing to frame", coll.name)
+                    coll.hide_render = True
+                    continue
+                location, clip_start, clip_end = framing[coll]
+                frame_camera.location = location
+                frame_camera.data.clip_start = clip_start
+                frame_camera.data.clip_end = clip_end
+            elif camera:
+                scene.camera = camera
+            else:
+                log.warning("Skipping %s: no camera", coll.name)
+                coll.hide_render = True
+                continue
+
             # Set output path with collection name
-            output_path = os.path.join(self.directory, f"{coll.name}")
+            output_path = os.path.join(output_dir, f"{coll.name}")
             render.filepath = output_path
-            
+
             # Render the scene
             try:
                 bpy.ops.render.render(write_still=True)
-                print(f"Rendered {coll.name} to {output_path}.{self.file_format.lower()}")
+                rendered_paths.append(output_path + FORMAT_EXTENSIONS[self.file_format])
+                if mark_rendered and not preview:
+                    mark_rendered(coll)
+                log.debug("Rendered %s to %s%s", coll.name, output_path, FORMAT_EXTENSIONS[self.file_format])
             except Exception as e:
-                print(f"Error rendering {coll.name}: {str(e)}")
-            
+                log.error("Error rendering %s: %s", coll.name, e)
+
             # Hide it again
             coll.hide_render = True
-        
+
+        # Combine previews into one atlas
+        sheet_path = None
+        if preview and self.contact_sheet:
+            sheet_path = os.path.join(directory, "contact_sheet" + FORMAT_EXTENSIONS[self.file_format])
+            try:
+                build_contact_sheet(rendered_paths, sheet_path, self.file_format,
+                                    render.resolution_x, render.resolution_y, self.sheet_columns)
+                log.info("Saved contact sheet to %s", sheet_path)
+            except Exception as e:
+                log.error("Error building contact sheet: %s", e)
+                sheet_path = None
+
         # Restore original visibility and settings
         for coll, visible in original_visibility.items():
             coll.hide_render = not visible
         render.film_transparent = original_transparent
         render.image_settings.file_format = original_format
-        
-        self.report({'INFO'}, f"Rendered {len(collections)} collections to {self.directory}")
-        print(f"Rendered {len(collections)} collections to {self.directory}")
+        if preview:
+            render.engine = original_engine
+            render.resolution_x, render.resolution_y, render.resolution_percentage = original_resolution
+            scene.display.render_aa = original_render_aa
+            scene.eevee.taa_render_samples = original_eevee_samples
+        scene.camera = original_camera
+        if frame_camera:
+            camera_data = frame_camera.data
+            bpy.data.objects.remove(frame_camera, do_unlink=True)
+            bpy.data.cameras.remove(camera_data)
+
+        self.report({'INFO'}, f"Rendered {len(rendered_paths)} collections to {directory}")
+        log.info("Rendered %s collections to %s", len(rendered_paths), directory)
+        if sheet_path:
+            self.report({'INFO'}, f"Contact sheet saved to {sheet_path}")
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -105,7 +356,27 @@ class BEBTOOLS_OT_RenderCollections(Operator):
         layout = self.layout
         layout.prop(self, "transparent")
         layout.prop(self, "file_format")
+        if get_dirty_collections:
+            layout.prop(self, "dirty_only")
+        layout.prop(self, "use_framing_cameras")
+        layout.prop(self, "profile")
+        if self.profile == 'PREVIEW':
+            box = layout.box()
+            box.prop(self, "preview_engine")
+            box.prop(self, "preview_size")
+            if self.preview_engine == 'EEVEE':
+                box.prop(self, "preview_samples")
+            box.prop(self, "auto_frame")
+            box.prop(self, "contact_sheet")
+            if self.contact_sheet:
+                box.prop(self, "sheet_columns")
 
 # Register and run for Beb.Tools compatibility
 bpy.utils.register_class(BEBTOOLS_OT_RenderCollections)
-bpy.ops.bebtools.render_collections('INVOKE_DEFAULT')
\ No newline at end of file
+
+# Queued steps with stored parameters run unattended, otherwise open the file browser
+params = globals().get("BEBTOOLS_PARAMS")
+if params or not globals().get("BEBTOOLS_INVOKE", True):
+    bpy.ops.bebtools.render_collections('EXEC_DEFAULT', **params)
+else:
+    bpy.ops.bebtools.render_collections('INVOKE_DEFAULT')
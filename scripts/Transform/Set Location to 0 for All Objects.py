@@ -1,8 +1,13 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 # Move all mesh objects to location (0, 0, 0)
 for obj in bpy.data.objects:
     if obj.type == 'MESH':
         obj.location = (0.0, 0.0, 0.0)
 
-print("All mesh object locations set to (0, 0, 0)!")
\ No newline at end of file
+log.info("All mesh object locations set to (0, 0, 0)!")
\ No newline at end of file
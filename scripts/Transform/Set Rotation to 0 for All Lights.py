@@ -1,8 +1,23 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Shared scene index inside the add-on, a plain scan when run from the Text Editor
+try:
+    from .bebtools_scene_index import scene_index
+except ImportError:
+    scene_index = None
+
+if scene_index:
+    lights = scene_index.objects_of_type('LIGHT')
+else:
+    lights = [obj for obj in bpy.data.objects if obj.type == 'LIGHT']
+
 # Reset rotation of all light objects to (0, 0, 0)
-for obj in bpy.data.objects:
-    if obj.type == 'LIGHT':
-        obj.rotation_euler = (0.0, 0.0, 0.0)
+for obj in lights:
+    obj.rotation_euler = (0.0, 0.0, 0.0)
 
-print("All light object rotations set to (0, 0, 0)!")
\ No newline at end of file
+log.info("All light object rotations set to (0, 0, 0)!")
\ No newline at end of file
@@ -1,6 +1,11 @@
 import bpy
 import mathutils
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 # Reset rotation of all mesh objects to (0, 0, 0)
 for obj in bpy.data.objects:
     if obj.type == 'MESH':
@@ -8,4 +13,4 @@ for obj in bpy.data.objects:
         # If using quaternion rotation, uncomment the next line instead
         # obj.rotation_quaternion = mathutils.Quaternion((1.0, 0.0, 0.0, 0.0))
 
-print("All mesh object rotations set to (0, 0, 0)!")
\ No newline at end of file
+log.info("All mesh object rotations set to (0, 0, 0)!")
\ No newline at end of file
@@ -1,8 +1,23 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
+# Shared scene index inside the add-on, a plain scan when run from the Text Editor
+try:
+    from .bebtools_scene_index import scene_index
+except ImportError:
+    scene_index = None
+
+if scene_index:
+    empties = scene_index.objects_of_type('EMPTY')
+else:
+    empties = [obj for obj in bpy.data.objects if obj.type == 'EMPTY']
+
 # Set scale of all empty objects to (1, 1, 1)
-for obj in bpy.data.objects:
-    if obj.type == 'EMPTY':
-        obj.scale = (1.0, 1.0, 1.0)
+for obj in empties:
+    obj.scale = (1.0, 1.0, 1.0)
 
-print("All empty object scales set to (1, 1, 1)!")
\ No newline at end of file
+log.info("All empty object scales set to (1, 1, 1)!")
\ No newline at end of file
@@ -1,8 +1,13 @@
 import bpy
 
+# Beb.Tools passes in its buffered `log`; standard logging when run from the Text Editor
+if "log" not in globals():
+    import logging
+    log = logging.getLogger(__name__)
+
 # Set scale of all mesh objects to (1, 1, 1)
 for obj in bpy.data.objects:
     if obj.type == 'MESH':
         obj.scale = (1.0, 1.0, 1.0)
 
-print("All mesh object scales set to (1, 1, 1)!")
\ No newline at end of file
+log.info("All mesh object scales set to (1, 1, 1)!")
\ No newline at end of file